@@ -15,7 +15,6 @@ from .client.client import connect  # noqa: F401
 from .client.client import login  # noqa: F401
 from .client.client import login_as_guest  # noqa: F401
 from .client.client import register  # noqa: F401
-from .client.deploy import Orchestra  # noqa: F401
 from .client.domain_client import DomainClient  # noqa: F401
 from .client.gateway_client import GatewayClient  # noqa: F401
 from .client.registry import DomainRegistry  # noqa: F401
@@ -150,9 +149,18 @@ def _settings() -> UserSettings:
 
 
 @module_property
-def _orchestra() -> Orchestra:
+def _orchestra() -> Any:
+    # relative
+    from .client.deploy import Orchestra
+
     return Orchestra
 
 
+# hagrid is imported on first use of sy.Orchestra
+@module_property
+def _Orchestra() -> Any:
+    return _orchestra()
+
+
 def search(name: str) -> SearchResults:
     return Search(_domains()).search(name=name)
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 # stdlib
+import base64
 from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Mapping
+from functools import lru_cache
+import hashlib
 import inspect
 from inspect import Parameter
 from inspect import signature
@@ -17,6 +21,7 @@ from typing import get_origin
 
 # third party
 from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
 from pydantic import EmailStr
 from result import OkErr
 from result import Result
@@ -29,6 +34,7 @@ from ..node.credentials import SyftVerifyKey
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
 from ..protocol.data_protocol import migrate_args_and_kwargs
+from ..serde.arrow import numpy_raw_serde
 from ..serde.deserialize import _deserialize
 from ..serde.recursive import index_syft_by_module_name
 from ..serde.serializable import serializable
@@ -136,6 +142,59 @@ class LibEndpoint(SyftBaseObject):
     pre_kwargs: dict[str, Any] | None = None
 
 
+# signatures are made over this prefix and the sha256 digest of the serialized
+# message, which is much faster to hash than signing the whole message. The prefix
+# keeps them apart from signatures of raw messages
+SIGNED_DIGEST_PREFIX = b"syft-sha256:"
+
+
+def signed_digest(serialized_message: bytes) -> bytes:
+    """The bytes signed for a serialized message"""
+    return SIGNED_DIGEST_PREFIX + hashlib.sha256(serialized_message).digest()
+
+
+# the last protocol whose peers only accept signatures of the whole message
+LAST_FULL_MESSAGE_SIGNATURE_PROTOCOL = 4
+
+
+def signs_digest(communication_protocol: PROTOCOL_TYPE | None) -> bool:
+    """If messages for a peer on `communication_protocol` can be signed over
+    their digest. Peers with an unknown protocol get full message signatures."""
+    if communication_protocol is None:
+        return False
+    if communication_protocol == "dev":
+        return True
+    return int(communication_protocol) > LAST_FULL_MESSAGE_SIGNATURE_PROTOCOL
+
+
+def api_call_protocol(
+    api_call: SyftAPICall | SignedSyftAPICall,
+) -> PROTOCOL_TYPE | None:
+    """The communication protocol the caller negotiated, None for older callers"""
+    message = api_call.message if isinstance(api_call, SignedSyftAPICall) else api_call
+    return message.kwargs.get("communication_protocol", None)
+
+
+# results for peers that sign digests are sent as the serialized message, with
+# the rest of the SignedSyftAPICall in these headers
+SIGNATURE_HEADER = "X-Syft-Signature"
+VERIFY_KEY_HEADER = "X-Syft-Verify-Key"
+
+
+# verifications are keyed by everything they depend on, so resent and forwarded
+# calls skip the ed25519 check
+VERIFIED_SIGNATURE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=VERIFIED_SIGNATURE_CACHE_SIZE)
+def _verify_signature(verify_key: VerifyKey, message: bytes, signature: bytes) -> bool:
+    try:
+        verify_key.verify(message, signature)
+    except BadSignatureError:
+        return False
+    return True
+
+
 @serializable(attrs=["signature", "credentials", "serialized_message"])
 class SignedSyftAPICall(SyftObject):
     __canonical_name__ = "SignedSyftAPICall"
@@ -161,15 +220,60 @@ class SignedSyftAPICall(SyftObject):
 
     @property
     def is_valid(self) -> Result[SyftSuccess, SyftError]:
-        try:
-            _ = self.credentials.verify_key.verify(
-                self.serialized_message, self.signature
-            )
-        except BadSignatureError:
-            return SyftError(message="BadSignatureError")
+        verify_key = self.credentials.verify_key
+        digest = signed_digest(self.serialized_message)
+        if not _verify_signature(verify_key, digest, self.signature):
+            # older clients sign the whole message
+            try:
+                _ = verify_key.verify(self.serialized_message, self.signature)
+            except BadSignatureError:
+                return SyftError(message="BadSignatureError")
 
         return SyftSuccess(message="Credentials are valid")
 
+    @classmethod
+    def from_serialized(
+        cls,
+        serialized_message: bytes,
+        credentials: SyftSigningKey,
+        digest: bool = True,
+    ) -> SignedSyftAPICall:
+        """Sign an already serialized message, which is kept as is.
+
+        With `digest=False` the whole message is signed, for older peers.
+        """
+        signed_bytes = (
+            signed_digest(serialized_message) if digest else serialized_message
+        )
+        signed_message = credentials.signing_key.sign(signed_bytes)
+        return cls(
+            credentials=credentials.verify_key,
+            serialized_message=serialized_message,
+            signature=signed_message.signature,
+        )
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers sent along the serialized message instead of the whole envelope"""
+        return {
+            SIGNATURE_HEADER: base64.b64encode(self.signature).decode(),
+            VERIFY_KEY_HEADER: str(self.credentials),
+        }
+
+    @classmethod
+    def from_headers(
+        cls, headers: Mapping[str, str], serialized_message: bytes
+    ) -> SignedSyftAPICall | None:
+        """Rebuilds a call sent as `headers` and its serialized message, None if the
+        headers don't carry a signature"""
+        if SIGNATURE_HEADER not in headers:
+            return None
+        return cls(
+            credentials=SyftVerifyKey.from_string(headers[VERIFY_KEY_HEADER]),
+            serialized_message=serialized_message,
+            signature=base64.b64decode(headers[SIGNATURE_HEADER]),
+        )
+
 
 @instrument
 @serializable()
@@ -185,13 +289,11 @@ class SyftAPICall(SyftObject):
     kwargs: dict[str, Any]
     blocking: bool = True
 
-    def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
-        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
-
-        return SignedSyftAPICall(
-            credentials=credentials.verify_key,
-            serialized_message=signed_message.message,
-            signature=signed_message.signature,
+    def sign(
+        self, credentials: SyftSigningKey, digest: bool = True
+    ) -> SignedSyftAPICall:
+        return SignedSyftAPICall.from_serialized(
+            _serialize(self, to_bytes=True), credentials, digest=digest
         )
 
 
@@ -205,13 +307,11 @@ class SyftAPIData(SyftBaseObject):
     # fields
     data: Any = None
 
-    def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
-        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
-
-        return SignedSyftAPICall(
-            credentials=credentials.verify_key,
-            serialized_message=signed_message.message,
-            signature=signed_message.signature,
+    def sign(
+        self, credentials: SyftSigningKey, digest: bool = True
+    ) -> SignedSyftAPICall:
+        return SignedSyftAPICall.from_serialized(
+            _serialize(self, to_bytes=True), credentials, digest=digest
         )
 
 
@@ -906,7 +1006,11 @@ class SyftAPI(SyftObject):
         return self.__user_role
 
     def make_call(self, api_call: SyftAPICall, cache_result: bool = True) -> Result:
-        signed_call = api_call.sign(credentials=self.signing_key)
+        with numpy_raw_serde(self.communication_protocol):
+            signed_call = api_call.sign(
+                credentials=self.signing_key,
+                digest=signs_digest(self.communication_protocol),
+            )
         if self.connection is not None:
             signed_result = self.connection.make_call(signed_call)
         else:
@@ -19,8 +19,6 @@ from pydantic import field_validator
 import requests
 from requests import Response
 from requests import Session
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry  # type: ignore[import-untyped]
 from typing_extensions import Self
 
 # relative
@@ -62,6 +60,7 @@ from .api import SyftAPI
 from .api import SyftAPICall
 from .api import debox_signed_syftapicall_response
 from .connection import NodeConnection
+from .http_pool import get_http_session
 from .protocol import SyftProtocol
 
 if TYPE_CHECKING:
@@ -108,7 +107,8 @@ def forward_message_to_proxy(
         # generate a random signing key
         credentials = SyftSigningKey.generate()
 
-    signed_message: SignedSyftAPICall = call.sign(credentials=credentials)
+    # the protocol of the node is unknown here
+    signed_message: SignedSyftAPICall = call.sign(credentials=credentials, digest=False)
     signed_result = make_call(signed_message)
     response = debox_signed_syftapicall_response(signed_result)
 
@@ -175,12 +175,7 @@ class HTTPConnection(NodeConnection):
     @property
     def session(self) -> Session:
         if self.session_cache is None:
-            session = requests.Session()
-            retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            self.session_cache = session
+            self.session_cache = get_http_session(self.url)
         return self.session_cache
 
     def _make_get(self, path: str, params: dict | None = None) -> bytes:
@@ -304,9 +299,8 @@ class HTTPConnection(NodeConnection):
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
         msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
-        response = requests.post(  # nosec
-            url=str(self.api_url),
-            data=msg_bytes,
+        response = self.session.post(
+            str(self.api_url), verify=verify_tls(), proxies={}, data=msg_bytes
         )
 
         if response.status_code != 200:
@@ -314,7 +308,10 @@ class HTTPConnection(NodeConnection):
                 f"Failed to fetch metadata. Response returned with code {response.status_code}"
             )
 
-        result = _deserialize(response.content, from_bytes=True)
+        # newer nodes send the signature in the headers and the result as the body
+        result = SignedSyftAPICall.from_headers(response.headers, response.content)
+        if result is None:
+            result = _deserialize(response.content, from_bytes=True)
         return result
 
     def __repr__(self) -> str:
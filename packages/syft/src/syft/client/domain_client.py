@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING
 from typing import cast
 
 # third party
-from hagrid.orchestra import NodeHandle
 from loguru import logger
 from tqdm import tqdm
 
@@ -42,6 +41,9 @@ from .connection import NodeConnection
 from .protocol import SyftProtocol
 
 if TYPE_CHECKING:
+    # third party
+    from hagrid.orchestra import NodeHandle
+
     # relative
     from ..service.project.project import Project
 
@@ -281,7 +283,7 @@ class DomainClient(SyftClient):
         via_client: SyftClient | None = None,
         url: str | None = None,
         port: int | None = None,
-        handle: NodeHandle | None = None,  # noqa: F821
+        handle: NodeHandle | None = None,
         email: str | None = None,
         password: str | None = None,
         protocol: str | SyftProtocol = SyftProtocol.HTTP,
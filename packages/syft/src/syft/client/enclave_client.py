@@ -5,9 +5,6 @@ from __future__ import annotations
 from typing import Any
 from typing import TYPE_CHECKING
 
-# third party
-from hagrid.orchestra import NodeHandle
-
 # relative
 from ..abstract_node import NodeSideType
 from ..client.api import APIRegistry
@@ -28,6 +25,9 @@ from .client import login_as_guest
 from .protocol import SyftProtocol
 
 if TYPE_CHECKING:
+    # third party
+    from hagrid.orchestra import NodeHandle
+
     # relative
     from ..service.code.user_code import SubmitUserCode
 
@@ -70,7 +70,7 @@ class EnclaveClient(SyftClient):
         via_client: SyftClient | None = None,
         url: str | None = None,
         port: int | None = None,
-        handle: NodeHandle | None = None,  # noqa: F821
+        handle: NodeHandle | None = None,
         email: str | None = None,
         password: str | None = None,
         protocol: str | SyftProtocol = SyftProtocol.HTTP,
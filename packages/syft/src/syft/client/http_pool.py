@@ -0,0 +1,151 @@
+# stdlib
+import os
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+
+# third party
+from pydantic import BaseModel
+from requests import PreparedRequest
+from requests import Response
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry  # type: ignore[import-untyped]
+
+
+class HTTPPoolConfig(BaseModel):
+    """Connection pool settings shared by every session created by `get_http_session`.
+
+    Parameters:
+        `pool_connections`: int
+            Number of host pools kept per session
+        `pool_maxsize`: int
+            Number of keep-alive connections kept per host
+        `pool_block`: bool
+            Block when all connections of a host are in use instead of opening a new one
+        `max_retries`: int
+            Retries for failed connections and idempotent requests
+        `backoff_factor`: float
+            Backoff between retries
+        `connect_timeout`: float | None
+            Default connect timeout, None waits forever
+        `read_timeout`: float | None
+            Default read timeout, None waits forever
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying the pool default timeout to requests that don't set one.
+
+    With `retries=False` nothing is retried, for streamed bodies that can't be
+    sent twice and callers running their own retry loop.
+    """
+
+    def __init__(self, config: HTTPPoolConfig, retries: bool = True) -> None:
+        self.timeout = (config.connect_timeout, config.read_timeout)
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            max_retries=(
+                Retry(total=config.max_retries, backoff_factor=config.backoff_factor)
+                if retries
+                else 0
+            ),
+        )
+
+    def send(
+        self, request: PreparedRequest, timeout: Any = None, **kwargs: Any
+    ) -> Response:
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+    def connection_stats(self) -> dict[str, int]:
+        n_requests, n_connections = 0, 0
+        for key in self.poolmanager.pools.keys():
+            pool = self.poolmanager.pools[key]
+            n_requests += pool.num_requests
+            n_connections += pool.num_connections
+        return {
+            "requests": n_requests,
+            "connections": n_connections,
+            "reused": n_requests - n_connections,
+        }
+
+
+HTTP_POOL_CONFIG = HTTPPoolConfig()
+HTTP_SESSIONS: dict[tuple, Session] = {}
+HTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def http_session_key(url: Any) -> tuple:
+    parts = urlsplit(str(url))
+    # the pid keeps a forked child from sharing the parent's sockets
+    return (os.getpid(), parts.scheme, parts.hostname, parts.port)
+
+
+def get_http_session(url: Any, retries: bool = True) -> Session:
+    """Keep-alive session shared by every caller talking to the node at `url`.
+
+    Pass `retries=False` when the request body is a generator or the caller
+    retries by itself, the session then sends every request exactly once.
+    """
+    key = (*http_session_key(url), retries)
+    with HTTP_SESSIONS_LOCK:
+        session = HTTP_SESSIONS.get(key, None)
+        if session is None:
+            session = Session()
+            adapter = PooledHTTPAdapter(HTTP_POOL_CONFIG, retries=retries)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            HTTP_SESSIONS[key] = session
+    return session
+
+
+def get_http_pool_stats(url: Any | None = None) -> dict[str, int]:
+    """Request and connection counts of the pooled sessions, for `url` or all of them.
+
+    `reused` is the number of requests served over an already open connection.
+    """
+    with HTTP_SESSIONS_LOCK:
+        if url is None:
+            sessions = list(HTTP_SESSIONS.values())
+        else:
+            node_key = http_session_key(url)
+            sessions = [
+                session
+                for key, session in HTTP_SESSIONS.items()
+                if key[: len(node_key)] == node_key
+            ]
+
+    stats = {"requests": 0, "connections": 0, "reused": 0}
+    for session in sessions:
+        adapter = session.get_adapter("http://")
+        if isinstance(adapter, PooledHTTPAdapter):
+            for stat, value in adapter.connection_stats().items():
+                stats[stat] += value
+    return stats
+
+
+def close_http_sessions() -> None:
+    with HTTP_SESSIONS_LOCK:
+        for session in HTTP_SESSIONS.values():
+            session.close()
+        HTTP_SESSIONS.clear()
+
+
+def configure_http_pool(**kwargs: Any) -> HTTPPoolConfig:
+    """Update the pool settings, sessions created afterwards use the new values."""
+    global HTTP_POOL_CONFIG
+    HTTP_POOL_CONFIG = HTTPPoolConfig(**{**HTTP_POOL_CONFIG.model_dump(), **kwargs})
+    close_http_sessions()
+    return HTTP_POOL_CONFIG
@@ -5,8 +5,6 @@ from pathlib import Path
 from typing import Any
 
 # relative
-from .builder_docker import DockerBuilder
-from .builder_k8s import KubernetesBuilder
 from .builder_types import BuilderBase
 from .builder_types import ImageBuildResult
 from .builder_types import ImagePushResult
@@ -31,9 +29,16 @@ class CustomWorkerBuilder:
 
     @cached_property
     def builder(self) -> BuilderBase:
+        # the builders are imported on first use, they import docker and kr8s
         if IN_KUBERNETES:
+            # relative
+            from .builder_k8s import KubernetesBuilder
+
             return KubernetesBuilder()
         else:
+            # relative
+            from .builder_docker import DockerBuilder
+
             return DockerBuilder()
 
     def build_image(
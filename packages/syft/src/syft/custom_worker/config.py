@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Any
 
 # third party
-import docker
 from packaging import version
 from pydantic import field_validator
 from typing_extensions import Self
@@ -165,6 +164,9 @@ class DockerWorkerConfig(WorkerConfig):
         self.description = description_text
 
     def test_image_build(self, tag: str, **kwargs: Any) -> SyftSuccess | SyftError:
+        # third party
+        import docker
+
         try:
             with contextlib.closing(docker.from_env()) as client:
                 if not client.ping():
@@ -1,3 +1,6 @@
+# future
+from __future__ import annotations
+
 # stdlib
 import base64
 from collections.abc import Iterable
@@ -5,15 +8,19 @@ from enum import Enum
 from functools import cache
 import json
 import os
+from typing import TYPE_CHECKING
 
 # third party
-import kr8s
-from kr8s.objects import APIObject
-from kr8s.objects import Pod
-from kr8s.objects import Secret
 from pydantic import BaseModel
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    # third party
+    import kr8s
+    from kr8s.objects import APIObject
+    from kr8s.objects import Pod
+    from kr8s.objects import Secret
+
 # Kubernetes namespace
 KUBERNETES_NAMESPACE = os.getenv("K8S_NAMESPACE", "syft")
 
@@ -96,6 +103,10 @@ class PodStatus(BaseModel):
 def get_kr8s_client() -> kr8s.Api:
     if not IN_KUBERNETES:
         raise RuntimeError("Not inside a kubernetes environment")
+
+    # third party
+    import kr8s
+
     return kr8s.api(namespace=KUBERNETES_NAMESPACE)
 
 
@@ -110,6 +121,9 @@ class KubeUtils:
     @staticmethod
     def resolve_pod(client: kr8s.Api, pod: str | Pod) -> Pod | None:
         """Return the first pod that matches the given name"""
+        # third party
+        from kr8s.objects import Pod
+
         if isinstance(pod, Pod):
             return pod
 
@@ -209,6 +223,9 @@ class KubeUtils:
             for k, v in data.items():
                 data[k] = KubeUtils.b64encode_secret(v)  # type: ignore
 
+        # third party
+        from kr8s.objects import Secret
+
         secret = Secret(
             {
                 "metadata": {
@@ -33,11 +33,15 @@ from ..client.api import SignedSyftAPICall
 from ..client.api import SyftAPI
 from ..client.api import SyftAPICall
 from ..client.api import SyftAPIData
+from ..client.api import api_call_protocol
 from ..client.api import debox_signed_syftapicall_response
+from ..client.api import signs_digest
 from ..client.client import SyftClient
 from ..exceptions.exception import PySyftException
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.arrow import numpy_raw_serde
+from ..serde.serialize import _serialize as serialize
 from ..service.action.action_object import Action
 from ..service.action.action_object import ActionObject
 from ..service.action.action_service import ActionService
@@ -137,6 +141,12 @@ from .worker_settings import WorkerSettings
 # the code for a specific node UID and thread
 CODE_RELOADER: dict[int, Callable] = {}
 
+# serialized apis kept by `Node.get_api_bytes`, most recently used last. They
+# can be several megabytes each with a lot of user code
+API_CACHE_SIZE = 32
+# the services whose data ends up in the api besides the service registry
+API_SOURCE_SERVICES = [UserCodeService, APIService, SettingsService]
+
 
 NODE_PRIVATE_KEY = "NODE_PRIVATE_KEY"
 NODE_UID = "NODE_UID"
@@ -336,6 +346,7 @@ class Node(AbstractNode):
         self.node_side_type = NodeSideType(node_side_type)
         self.client_cache: dict = {}
         self.peer_client_cache: dict = {}
+        self.api_cache: dict = {}
 
         if isinstance(node_type, str):
             node_type = NodeType(node_type)
@@ -458,20 +469,33 @@ class Node(AbstractNode):
                 ] = remote_profile
 
     def stop(self) -> None:
-        for consumer_list in self.queue_manager.consumers.values():
-            for c in consumer_list:
-                c.close()
-        for p in self.queue_manager.producers.values():
-            p.close()
-
-        self.queue_manager.producers.clear()
-        self.queue_manager.consumers.clear()
+        # subprocess workers have no queue manager
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is not None:
+            for consumer_list in queue_manager.consumers.values():
+                for c in consumer_list:
+                    c.close()
+            for p in queue_manager.producers.values():
+                p.close()
+
+            queue_manager.producers.clear()
+            queue_manager.consumers.clear()
 
         NodeRegistry.remove_node(self.id)
 
     def close(self) -> None:
         self.stop()
 
+    def close_stores(self) -> None:
+        """Release the connections of the document and action stores.
+
+        Unlike `close`, this leaves the NodeRegistry alone. Worker nodes have the
+        id of the node they work for, which stays registered. Blob storage clients
+        open a connection per use, so they hold none to release.
+        """
+        self.document_store.close()
+        self.action_store.close()
+
     def cleanup(self) -> None:
         self.stop()
         self.remove_temp_dir()
@@ -1138,8 +1162,12 @@ class Node(AbstractNode):
         result = self.handle_api_call_with_unsigned_result(
             api_call, job_id=job_id, check_call_location=check_call_location
         )
-        # Sign the result
-        signed_result = SyftAPIData(data=result).sign(self.signing_key)
+        # Sign the result, over its digest if the caller's protocol supports it
+        communication_protocol = api_call_protocol(api_call)
+        with numpy_raw_serde(communication_protocol):
+            signed_result = SyftAPIData(data=result).sign(
+                self.signing_key, digest=signs_digest(communication_protocol)
+            )
 
         return signed_result
 
@@ -1374,8 +1402,17 @@ class Node(AbstractNode):
         result = log_service.add(context, log_id, queue_item.job_id)
         if isinstance(result, SyftError):
             return result
+
+        self.notify_queue(queue_item)
         return job
 
+    def notify_queue(self, queue_item: QueueItem) -> None:
+        # subprocess workers have no queue manager, their items are picked up
+        # by the producer's periodic stash scan
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is not None:
+            queue_manager.notify(queue_item)
+
     def _get_existing_user_code_jobs(
         self, context: AuthedServiceContext, user_code_id: UID
     ) -> list[Job] | SyftError:
@@ -1511,6 +1548,38 @@ class Node(AbstractNode):
             communication_protocol=communication_protocol,
         )
 
+    @property
+    def api_generation(self) -> tuple[int, ...]:
+        # changes whenever user code, custom endpoints or settings are written
+        return tuple(
+            self.get_service(service).stash.partition.generation
+            for service in API_SOURCE_SERVICES
+        )
+
+    def get_api_bytes(
+        self,
+        for_user: SyftVerifyKey | None = None,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> bytes:
+        """`get_api` serialized, built again only after the data it is made of changed"""
+        role = self.get_role_for_credentials(credentials=for_user)
+        key = (for_user, role, communication_protocol)
+        # read before building, so a write during the build invalidates it
+        generation = self.api_generation
+
+        cached = self.api_cache.pop(key, None)
+        if cached is not None and cached[0] == generation:
+            self.api_cache[key] = cached
+            return cached[1]
+
+        api_bytes = serialize(
+            self.get_api(for_user, communication_protocol), to_bytes=True
+        )
+        self.api_cache[key] = (generation, api_bytes)
+        while len(self.api_cache) > API_CACHE_SIZE:
+            self.api_cache.pop(next(iter(self.api_cache)), None)
+        return api_bytes
+
     def get_method_with_context(
         self, function: Callable, context: NodeServiceContext
     ) -> Callable:
@@ -1,7 +1,14 @@
 # stdlib
+import asyncio
 import base64
 import binascii
+from collections.abc import Callable
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
 from typing import Annotated
+from typing import Any
 
 # third party
 from fastapi import APIRouter
@@ -15,9 +22,14 @@ from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import ValidationError
 import requests
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
 # relative
 from ..abstract_node import AbstractNode
+from ..client.api import SignedSyftAPICall
+from ..client.api import api_call_protocol
+from ..client.api import signs_digest
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..serde.deserialize import _deserialize as deserialize
 from ..serde.serialize import _serialize as serialize
@@ -30,12 +42,22 @@ from ..service.user.user import UserPrivateKey
 from ..service.user.user_service import UserService
 from ..types.uid import UID
 from ..util.telemetry import TRACE_MODE
+from ..util.util import get_env
 from .credentials import SyftVerifyKey
 from .credentials import UserLoginCredentials
 from .worker import Worker
 
+# threads of the executor running api calls, logins and registrations, which keeps
+# them from taking up the threadpool of the other routes
+API_CALL_WORKERS = "API_CALL_WORKERS"
 
-def make_routes(worker: Worker) -> APIRouter:
+
+def get_api_call_workers() -> int | None:
+    workers = get_env(API_CALL_WORKERS)
+    return int(workers) if workers else None
+
+
+def make_routes(worker: Worker, executor: Executor | None = None) -> APIRouter:
     if TRACE_MODE:
         # third party
         try:
@@ -47,6 +69,18 @@ def make_routes(worker: Worker) -> APIRouter:
 
     router = APIRouter()
 
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=get_api_call_workers(), thread_name_prefix="syft-api-call"
+        )
+
+    async def run_in_executor(func: Callable, *args: Any) -> Any:
+        # copy the context so the trace spans of the handlers carry over
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(context.run, func, *args)
+        )
+
     async def get_body(request: Request) -> bytes:
         return await request.body()
 
@@ -71,16 +105,21 @@ def make_routes(worker: Worker) -> APIRouter:
 
         peer_uid_parsed = UID.from_string(peer_uid)
 
-        url = _blob_url(peer_uid=peer_uid_parsed, presigned_url=url_path_parsed)
-
+        # looking up the peer, connecting and reading the chunks block, so they run on
+        # the threadpool, which is only taken up while waiting for a chunk
+        url = await run_in_threadpool(
+            _blob_url, peer_uid=peer_uid_parsed, presigned_url=url_path_parsed
+        )
         try:
-            resp = requests.get(url=url, stream=True)  # nosec
+            resp = await run_in_threadpool(requests.get, url=url, stream=True)  # nosec
             resp.raise_for_status()
         except requests.RequestException:
             raise HTTPException(404, "Failed to retrieve data from domain.")
 
         return StreamingResponse(
-            resp.iter_content(chunk_size=None), media_type="text/event-stream"
+            resp.iter_content(chunk_size=None),
+            media_type="text/event-stream",
+            background=BackgroundTask(resp.close),
         )
 
     @router.get(
@@ -89,7 +128,7 @@ def make_routes(worker: Worker) -> APIRouter:
         status_code=200,
         response_class=JSONResponse,
     )
-    def root() -> dict[str, str]:
+    async def root() -> dict[str, str]:
         """
         Currently, all service backends must satisfy either of the following requirements to
         pass the HTTP health checks sent to it from the GCE loadbalancer: 1. Respond with a
@@ -115,15 +154,13 @@ def make_routes(worker: Worker) -> APIRouter:
         user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
+            worker.get_api_bytes(user_verify_key, communication_protocol),
             media_type="application/octet-stream",
         )
 
     # get the SyftAPI object
     @router.get("/api")
-    def syft_new_api(
+    async def syft_new_api(
         request: Request, verify_key: str, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
@@ -133,13 +170,26 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_syft_new_api(user_verify_key, communication_protocol)
+                return await run_in_executor(
+                    handle_syft_new_api, user_verify_key, communication_protocol
+                )
         else:
-            return handle_syft_new_api(user_verify_key, communication_protocol)
+            return await run_in_executor(
+                handle_syft_new_api, user_verify_key, communication_protocol
+            )
 
     def handle_new_api_call(data: bytes) -> Response:
         obj_msg = deserialize(blob=data, from_bytes=True)
         result = worker.handle_api_call(api_call=obj_msg)
+        if isinstance(result, SignedSyftAPICall) and signs_digest(
+            api_call_protocol(obj_msg)
+        ):
+            # the result is already serialized, the signature goes in the headers
+            return Response(
+                result.serialized_message,
+                headers=result.headers,
+                media_type="application/octet-stream",
+            )
         return Response(
             serialize(result, to_bytes=True),
             media_type="application/octet-stream",
@@ -147,7 +197,7 @@ def make_routes(worker: Worker) -> APIRouter:
 
     # make a request to the SyftAPI
     @router.post("/api_call")
-    def syft_new_api_call(
+    async def syft_new_api_call(
         request: Request, data: Annotated[bytes, Depends(get_body)]
     ) -> Response:
         if TRACE_MODE:
@@ -156,9 +206,9 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_new_api_call(data)
+                return await run_in_executor(handle_new_api_call, data)
         else:
-            return handle_new_api_call(data)
+            return await run_in_executor(handle_new_api_call, data)
 
     def handle_login(email: str, password: str, node: AbstractNode) -> Response:
         try:
@@ -208,7 +258,7 @@ def make_routes(worker: Worker) -> APIRouter:
 
     # exchange email and password for a SyftSigningKey
     @router.post("/login", name="login", status_code=200)
-    def login(
+    async def login(
         request: Request,
         email: Annotated[str, Body(example="info@openmined.org")],
         password: Annotated[str, Body(example="changethis")],
@@ -219,12 +269,12 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_login(email, password, worker)
+                return await run_in_executor(handle_login, email, password, worker)
         else:
-            return handle_login(email, password, worker)
+            return await run_in_executor(handle_login, email, password, worker)
 
     @router.post("/register", name="register", status_code=200)
-    def register(
+    async def register(
         request: Request, data: Annotated[bytes, Depends(get_body)]
     ) -> Response:
         if TRACE_MODE:
@@ -233,8 +283,8 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_register(data, worker)
+                return await run_in_executor(handle_register, data, worker)
         else:
-            return handle_register(data, worker)
+            return await run_in_executor(handle_register, data, worker)
 
     return router
@@ -9,13 +9,10 @@ import platform
 import signal
 import subprocess  # nosec
 import time
+from typing import TYPE_CHECKING
 
 # third party
-from fastapi import APIRouter
-from fastapi import FastAPI
 import requests
-from starlette.middleware.cors import CORSMiddleware
-import uvicorn
 
 # relative
 from ..abstract_node import NodeSideType
@@ -26,7 +23,11 @@ from .domain import Domain
 from .enclave import Enclave
 from .gateway import Gateway
 from .node import NodeType
-from .routes import make_routes
+
+if TYPE_CHECKING:
+    # third party
+    from fastapi import APIRouter
+    from fastapi import FastAPI
 
 if os_name() == "macOS":
     # needed on MacOS to prevent [__NSCFConstantString initialize] may have been in
@@ -36,7 +37,12 @@ if os_name() == "macOS":
 WAIT_TIME_SECONDS = 20
 
 
-def make_app(name: str, router: APIRouter) -> FastAPI:
+def make_app(name: str, router: "APIRouter") -> "FastAPI":
+    # third party
+    from fastapi import APIRouter
+    from fastapi import FastAPI
+    from starlette.middleware.cors import CORSMiddleware
+
     app = FastAPI(
         title=name,
     )
@@ -128,6 +134,12 @@ def run_uvicorn(
                 n_consumers=n_consumers,
                 association_request_auto_approval=association_request_auto_approval,
             )
+        # third party
+        import uvicorn
+
+        # relative
+        from .routes import make_routes
+
         router = make_routes(worker=worker)
         app = make_app(worker.name, router=router)
 
@@ -27,6 +27,7 @@ from ..service.response import SyftException
 from ..service.response import SyftSuccess
 from ..types.dicttuple import DictTuple
 from ..types.syft_object import SyftBaseObject
+from ..types.syft_object import SyftMigrationRegistry
 from ..util.util import get_dev_mode
 
 PROTOCOL_STATE_FILENAME = "protocol_version.json"
@@ -44,6 +45,10 @@ IGNORE_TYPES = [
     "MockObjectToSyftBaseObj",
 ]
 
+# process-wide DataProtocol instances, rebuilt only when the protocol history
+# is written or the set of registered types changes
+DATA_PROTOCOL_CACHE: dict[tuple, "DataProtocol"] = {}
+
 
 def natural_key(key: PROTOCOL_TYPE) -> list[int | str | Any]:
     """Define key for natural ordering of strings."""
@@ -103,6 +108,7 @@ class DataProtocol:
 
     def load_state(self) -> None:
         self.protocol_history = self.read_history()
+        self.protocol_states: dict[str, dict] = {}
         self.state = self.build_state()
         self.diff, self.current = self.diff_state(self.state)
         self.protocol_support = self.calculate_supported_protocols()
@@ -151,6 +157,7 @@ class DataProtocol:
         return protocol_history
 
     def save_history(self, history: dict) -> None:
+        clear_data_protocol_cache()
         for file_path in protocol_release_dir().iterdir():
             for version in self.read_json(file_path):
                 # Skip adding file if the version is not part of the history
@@ -208,6 +215,13 @@ class DataProtocol:
                 return state_dict
         return state_dict
 
+    def get_protocol_state(self, protocol: PROTOCOL_TYPE) -> dict:
+        """Object versions as of `protocol`, built once per protocol version."""
+        stop_key = str(protocol)
+        if stop_key not in self.protocol_states:
+            self.protocol_states[stop_key] = self.build_state(stop_key=stop_key)
+        return self.protocol_states[stop_key]
+
     def diff_state(self, state: dict) -> tuple[dict, dict]:
         compare_dict: dict = defaultdict(dict)  # what versions are in the latest code
         object_diff: dict = defaultdict(dict)  # diff in latest code with saved json
@@ -441,6 +455,7 @@ class DataProtocol:
         )
 
         # Save history
+        clear_data_protocol_cache()
         self.file_path.write_text(json.dumps(protocol_history, indent=2) + "\n")
 
         # Reload protocol
@@ -529,10 +544,21 @@ class DataProtocol:
 
 
 def get_data_protocol(raise_exception: bool = False) -> DataProtocol:
-    return DataProtocol(
-        filename=data_protocol_file_name(),
-        raise_exception=raise_exception,
-    )
+    filename = data_protocol_file_name()
+    # TYPE_BANK changes whenever a new serializable type is registered
+    cache_key = (filename, raise_exception, id(TYPE_BANK), len(TYPE_BANK))
+    data_protocol = DATA_PROTOCOL_CACHE.get(cache_key, None)
+    if data_protocol is None:
+        data_protocol = DataProtocol(
+            filename=filename,
+            raise_exception=raise_exception,
+        )
+        DATA_PROTOCOL_CACHE[cache_key] = data_protocol
+    return data_protocol
+
+
+def clear_data_protocol_cache() -> None:
+    DATA_PROTOCOL_CACHE.clear()
 
 
 def stage_protocol_changes() -> Result[SyftSuccess, SyftError]:
@@ -585,8 +611,12 @@ def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
                 versions = range(current_version - 1, migrate_to_version - 1, -1)
             else:  # upgrade
                 versions = range(current_version + 1, migrate_to_version + 1)
-            for version in versions:
-                _object = _object.migrate_to(version)
+            if len(versions) > 0:
+                migration_chain = SyftMigrationRegistry.get_migration_chain(
+                    type_from=type(_object), versions=tuple(versions)
+                )
+                for migration_transform in migration_chain:
+                    _object = migration_transform(_object, None)
         arg[key] = _object
 
     wrapped_arg = arg[0] if single_entity else arg
@@ -620,7 +650,7 @@ def migrate_args_and_kwargs(
     if to_protocol == data_protocol.latest_version:
         return args, kwargs
 
-    protocol_state = data_protocol.build_state(stop_key=str(to_protocol))
+    protocol_state = data_protocol.get_protocol_state(to_protocol)
 
     migrated_kwargs, migrated_args = {}, []
 
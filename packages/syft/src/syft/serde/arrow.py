@@ -1,4 +1,8 @@
 # stdlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import struct
 from typing import cast
 
 # third party
@@ -11,6 +15,91 @@ from ..util.experimental_flags import flags
 from .deserialize import _deserialize
 from .serialize import _serialize
 
+# Raw numpy serialization: NUMPY_RAW_MAGIC | header | array buffer
+# the magic can't start a capnp message, which is how the other formats are stored
+NUMPY_RAW_MAGIC = b"SYNP"
+NUMPY_RAW_DTYPE_KINDS = "biufcmMS"
+# dtype length, number of dimensions
+NUMPY_RAW_HEADER = struct.Struct("<HB")
+NUMPY_RAW_DIM = struct.Struct("<Q")
+
+# the last protocol whose peers can only read arrow tensors
+LAST_ARROW_ONLY_PROTOCOL = 4
+
+# set while serializing a message for a peer that reads the raw format
+NUMPY_RAW_PEER: ContextVar[bool] = ContextVar("NUMPY_RAW_PEER", default=False)
+
+
+def reads_numpy_raw(communication_protocol: str | int | None) -> bool:
+    """If a peer on `communication_protocol` can deserialize raw numpy arrays.
+    Peers with an unknown protocol get arrow tensors."""
+    if communication_protocol is None:
+        return False
+    if communication_protocol == "dev":
+        return True
+    return int(communication_protocol) > LAST_ARROW_ONLY_PROTOCOL
+
+
+@contextmanager
+def numpy_raw_serde(communication_protocol: str | int | None) -> Iterator[None]:
+    """Serializes the numeric arrays of messages built in this context in the raw
+    format, if the peer's `communication_protocol` supports it."""
+    token = NUMPY_RAW_PEER.set(reads_numpy_raw(communication_protocol))
+    try:
+        yield
+    finally:
+        NUMPY_RAW_PEER.reset(token)
+
+
+def use_numpy_raw(obj: np.ndarray) -> bool:
+    return (
+        flags.NUMPY_RAW_SERDE
+        and NUMPY_RAW_PEER.get()
+        and obj.dtype.kind in NUMPY_RAW_DTYPE_KINDS
+    )
+
+
+def is_numpy_raw(buf: bytes) -> bool:
+    return buf[: len(NUMPY_RAW_MAGIC)] == NUMPY_RAW_MAGIC
+
+
+def numpy_raw_serialize(obj: np.ndarray) -> bytes:
+    """Writes the dtype and shape header followed by the array buffer in one copy."""
+    if not obj.flags.c_contiguous:
+        obj = obj.copy(order="C")
+    dtype = obj.dtype.str.encode()
+    header = [
+        NUMPY_RAW_MAGIC,
+        NUMPY_RAW_HEADER.pack(len(dtype), obj.ndim),
+        dtype,
+        *[NUMPY_RAW_DIM.pack(dim) for dim in obj.shape],
+    ]
+    return b"".join([*header, obj.reshape(-1).view(np.uint8)])
+
+
+def numpy_raw_deserialize(buf: bytes) -> np.ndarray:
+    """Rebuilds the array as a `np.frombuffer` view of `buf`, without copying.
+
+    The view is read-only when `buf` is immutable, consumers that write to the
+    array copy it with `writeable_array`.
+    """
+    offset = len(NUMPY_RAW_MAGIC)
+    dtype_len, ndim = NUMPY_RAW_HEADER.unpack_from(buf, offset)
+    offset += NUMPY_RAW_HEADER.size
+    dtype = np.dtype(bytes(buf[offset : offset + dtype_len]).decode())
+    offset += dtype_len
+    shape = tuple(
+        NUMPY_RAW_DIM.unpack_from(buf, offset + idx * NUMPY_RAW_DIM.size)[0]
+        for idx in range(ndim)
+    )
+    offset += ndim * NUMPY_RAW_DIM.size
+    return np.frombuffer(buf, dtype=dtype, offset=offset).reshape(shape)
+
+
+def writeable_array(array: np.ndarray) -> np.ndarray:
+    """Returns `array` if it can be written to, otherwise a writable copy."""
+    return array if array.flags.writeable else array.copy()
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
     # inner function to make sure variables go out of scope after this
@@ -50,7 +139,8 @@ def arrow_deserialize(
     result = pa.ipc.read_tensor(numpy_bytes)
     np_array = result.to_numpy()
     np_array.setflags(write=True)
-    return np_array.astype(original_dtype)
+    # arrow tensors keep the dtype, so this only copies for mismatched payloads
+    return np_array.astype(original_dtype, copy=False)
 
 
 def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
@@ -114,13 +204,18 @@ def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
 
 
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
-    else:
+    if obj.dtype.type == np.str_:
         return arraytonumpyutf8(obj)
+    elif use_numpy_raw(obj):
+        return numpy_raw_serialize(obj)
+    else:
+        return arrow_serialize(obj)
 
 
 def numpy_deserialize(buf: bytes) -> np.ndarray:
+    if is_numpy_raw(buf):
+        return numpy_raw_deserialize(buf)
+
     deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
         return arrow_deserialize(*deser)
@@ -6,6 +6,7 @@ import sys
 import tempfile
 import types
 from typing import Any
+from typing import cast
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
@@ -21,10 +22,16 @@ from .capnp import get_capnp_schema
 from .util import compatible_with_large_file_writes_capnp
 
 TYPE_BANK = {}
+SERDE_PLANS: dict = {}
+# registrations of third party types, run when the first type of their top level
+# package is (de)serialized so the package isn't imported with syft
+LAZY_SERDE_REGISTRATIONS: dict[str, list[Callable[[], None]]] = {}
+MISSING = object()
 
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
+CAPNP_DATA_CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
 
 
 def get_types(cls: type, keys: list[str] | None = None) -> list[type] | None:
@@ -158,10 +165,181 @@ def recursive_serde_register(
     )
 
     TYPE_BANK[fqn] = serde_attributes
+    SERDE_PLANS[fqn] = SerdePlan(fqn, serde_attributes)
 
     if isinstance(alias_fqn, tuple):
         for alias in alias_fqn:
             TYPE_BANK[alias] = serde_attributes
+            SERDE_PLANS[alias] = SerdePlan(alias, serde_attributes)
+
+
+def recursive_serde_register_lazy(package: str, register: Callable[[], None]) -> None:
+    """Run `register` when a type of the top level `package` is first (de)serialized"""
+    LAZY_SERDE_REGISTRATIONS.setdefault(package, []).append(register)
+
+
+def load_lazy_serde(fqn: str) -> None:
+    package = fqn.split(".", 1)[0]
+    for register in LAZY_SERDE_REGISTRATIONS.pop(package, []):
+        register()
+
+
+def _serialize_field(obj: Any) -> bytes:
+    return sy.serialize(obj, to_bytes=True)
+
+
+def _serialize_field_for_hashing(obj: Any) -> bytes:
+    return sy.serialize(obj, to_bytes=True, for_hashing=True)
+
+
+class SerdePlan:
+    """Precompiled serde steps of a type in the TYPE_BANK.
+
+    Everything that only depends on the type (the ordered fields, their
+    override transforms, the resolved class and how to construct it) is
+    computed once, so `rs_object2proto` and `rs_proto2object` only execute it.
+    """
+
+    def __init__(self, fqn: str, serde_attributes: tuple) -> None:
+        (
+            nonrecursive,
+            serialize,
+            deserialize,
+            attribute_list,
+            exclude_attrs_list,
+            serde_overrides,
+            hash_exclude_attrs,
+            cls,
+            _,
+            _,
+        ) = serde_attributes
+        self.fqn = fqn
+        self.serde_attributes = serde_attributes
+        self.nonrecursive = nonrecursive
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.cls = cls
+        self.exclude_attrs = set(exclude_attrs_list)
+        self.hash_exclude_attrs = set(hash_exclude_attrs)
+        self.serde_overrides = serde_overrides
+        self.deserialize_transforms = {
+            attr_name: transforms[1]
+            for attr_name, transforms in serde_overrides.items()
+        }
+        self.attribute_list = (
+            None if attribute_list is None else set(attribute_list) - self.exclude_attrs
+        )
+        self.fields = (
+            None
+            if self.attribute_list is None
+            else self.compile_fields(self.attribute_list)
+        )
+        # compiled on first use, the hash excluded attrs can't be imported yet
+        self.hash_fields: list[tuple[str, Callable | None]] | None = None
+        self.class_type: Any = None
+        self.construct: Callable | None = None
+
+    def compile_fields(self, attribute_list: Any) -> list[tuple[str, Callable | None]]:
+        fields = []
+        for attr_name in sorted(attribute_list):
+            transforms = self.serde_overrides.get(attr_name, None)
+            fields.append(
+                (attr_name, transforms[0] if transforms is not None else None)
+            )
+        return fields
+
+    def get_fields(
+        self, obj: Any, for_hashing: bool
+    ) -> list[tuple[str, Callable | None]]:
+        if self.attribute_list is None:
+            exclude_attrs = self.exclude_attrs
+            if for_hashing:
+                exclude_attrs = exclude_attrs | self.get_hash_exclude_attrs()
+            return self.compile_fields(obj.__dict__.keys() - exclude_attrs)
+
+        if not for_hashing:
+            return cast(list, self.fields)
+        if self.hash_fields is None:
+            self.hash_fields = self.compile_fields(
+                self.attribute_list - self.get_hash_exclude_attrs()
+            )
+        return self.hash_fields
+
+    def get_hash_exclude_attrs(self) -> set[str]:
+        # relative
+        from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+        return self.hash_exclude_attrs.union(DYNAMIC_SYFT_ATTRIBUTES)
+
+    def get_class_type(self) -> Any:
+        if self.class_type is not None:
+            return self.class_type
+
+        class_type = resolve_class_type(self.fqn)
+        if class_type == type(None):
+            # yes this looks stupid but it works and the opposite breaks
+            class_type = self.cls
+        if "syft.user" in self.fqn:
+            # user code can be reloaded, so its classes are resolved every time
+            return class_type
+        self.class_type = class_type
+        return class_type
+
+    def get_constructor(self, class_type: Any) -> Callable:
+        if self.construct is not None and class_type is self.class_type:
+            return self.construct
+
+        construct = compile_constructor(self.fqn, class_type)
+        if class_type is self.class_type:
+            self.construct = construct
+        return construct
+
+
+def compile_constructor(fqn: str, class_type: Any) -> Callable:
+    if hasattr(class_type, "serde_constructor"):
+        return class_type.serde_constructor
+
+    def construct_with_setattr(obj: Any, kwargs: dict) -> Any:
+        for attr_name, attr_value in kwargs.items():
+            setattr(obj, attr_name, attr_value)
+        return obj
+
+    def construct_object(kwargs: dict) -> Any:
+        return construct_with_setattr(class_type.__new__(class_type), kwargs)
+
+    if issubclass(class_type, Enum):
+
+        def construct_enum(kwargs: dict) -> Any:
+            if "value" in kwargs:
+                return class_type.__new__(class_type, kwargs["value"])
+            return construct_object(kwargs)
+
+        return construct_enum
+
+    if issubclass(class_type, BaseModel):
+        # if we skip the __new__ flow of BaseModel we get the error
+        # AttributeError: object has no attribute '__fields_set__'
+        if "syft.user" in fqn:
+            # weird issues with pydantic and ForwardRef on user classes being inited
+            # with custom state args / kwargs
+            return lambda kwargs: construct_with_setattr(class_type(), kwargs)
+        return lambda kwargs: class_type(**kwargs)
+
+    return construct_object
+
+
+def get_serde_plan(fqn: str) -> SerdePlan:
+    if fqn not in TYPE_BANK:
+        load_lazy_serde(fqn)
+    if fqn not in TYPE_BANK:
+        raise Exception(f"{fqn} not in TYPE_BANK")
+    serde_attributes = TYPE_BANK[fqn]
+    plan = SERDE_PLANS.get(fqn, None)
+    # the TYPE_BANK entry is replaced when a type is registered again
+    if plan is None or plan.serde_attributes is not serde_attributes:
+        plan = SerdePlan(fqn, serde_attributes)
+        SERDE_PLANS[fqn] = plan
+    return plan
 
 
 def chunk_bytes(
@@ -172,14 +350,16 @@ def chunk_bytes(
 ) -> None:
     data = ser_func(field_obj)
     size_of_data = len(data)
-    if compatible_with_large_file_writes_capnp(size_of_data):
+    # spooling to a file only saves memory for data created by the serializer,
+    # bytes fields are serialized as themselves and stay referenced by the object
+    if data is not field_obj and compatible_with_large_file_writes_capnp(size_of_data):
         with tempfile.TemporaryFile() as tmp_file:
             # Write data to a file to save RAM
             tmp_file.write(data)
             tmp_file.seek(0)
             del data
 
-            CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
+            CHUNK_SIZE = CAPNP_DATA_CHUNK_SIZE
             list_size = size_of_data // CHUNK_SIZE + 1
             data_lst = builder.init(field_name, list_size)
             for idx in range(list_size):
@@ -187,9 +367,13 @@ def chunk_bytes(
                 data_lst[idx] = tmp_file.read(bytes_to_read)
                 size_of_data -= CHUNK_SIZE
     else:
-        CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
+        CHUNK_SIZE = CAPNP_DATA_CHUNK_SIZE
         list_size = len(data) // CHUNK_SIZE + 1
         data_lst = builder.init(field_name, list_size)
+        if list_size == 1:
+            # no need to slice (and copy) the data when it fits in one chunk
+            data_lst[0] = data
+            return
         END_INDEX = CHUNK_SIZE
         for idx in range(list_size):
             START_INDEX = idx * CHUNK_SIZE
@@ -198,86 +382,52 @@ def chunk_bytes(
 
 
 def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    # most fields fit in a single chunk, which is returned as is
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+    # join allocates the output once, instead of growing it chunk by chunk
+    return b"".join(capnp_list)
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
-
     is_type = False
     if isinstance(self, type):
         is_type = True
 
     msg = recursive_scheme.new_message()
     fqn = get_fully_qualified_name(self)
-    if fqn not in TYPE_BANK:
-        # third party
-        raise Exception(f"{fqn} not in TYPE_BANK")
+    plan = get_serde_plan(fqn)
     msg.fullyQualifiedName = fqn
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    ) = TYPE_BANK[fqn]
 
-    if nonrecursive or is_type:
-        if serialize is None:
+    if plan.nonrecursive or is_type:
+        if plan.serialize is None:
             raise Exception(
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
-        chunk_bytes(self, serialize, "nonrecursiveBlob", msg)
+        chunk_bytes(self, plan.serialize, "nonrecursiveBlob", msg)
         return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    fields = plan.get_fields(self, for_hashing)
+    serialize_field = _serialize_field_for_hashing if for_hashing else _serialize_field
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
-
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+    msg.init("fieldsName", len(fields))
+    msg.init("fieldsData", len(fields))
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    for idx, (attr_name, transform) in enumerate(fields):
+        field_obj = getattr(self, attr_name, MISSING)
+        if field_obj is MISSING:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
-
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if transform is not None:
+            field_obj = transform(field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
 
         msg.fieldsName[idx] = attr_name
-        chunk_bytes(
-            field_obj,
-            lambda x: sy.serialize(x, to_bytes=True, for_hashing=for_hashing),
-            idx,
-            msg.fieldsData,
-        )
+        chunk_bytes(field_obj, serialize_field, idx, msg.fieldsData)
 
     return msg
 
@@ -291,23 +441,20 @@ def rs_bytes2object(blob: bytes) -> Any:
         return rs_proto2object(msg)
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
-
+def resolve_class_type(fqn: str) -> Any:
     # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
+    module_parts = fqn.split(".")
     klass = module_parts.pop()
     class_type: type | Any = type(None)
 
     if klass != "NoneType":
         try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore[assignment,unused-ignore]
+            class_type = index_syft_by_module_name(fqn)  # type: ignore[assignment,unused-ignore]
         except Exception:  # nosec
             try:
                 class_type = getattr(sys.modules[".".join(module_parts)], klass)
             except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
+                if "syft.user" in fqn:
                     # relative
                     from ..node.node import CODE_RELOADER
 
@@ -317,76 +464,48 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
                     class_type = getattr(sys.modules[".".join(module_parts)], klass)
                 except Exception:  # nosec
                     pass
+    return class_type
 
-    if proto.fullyQualifiedName not in TYPE_BANK:
-        raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
 
-    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
-    # module name space in sub-processes or threads even though they are loaded on start
-    # its possible that the uvicorn awsgi server is preloading a bunch of threads
-    # however simply getting the class from the TYPE_BANK doesn't always work and
-    # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    ) = TYPE_BANK[proto.fullyQualifiedName]
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    # relative
+    from .deserialize import _deserialize
 
-    if class_type == type(None):
-        # yes this looks stupid but it works and the opposite breaks
-        class_type = cls
+    fqn = proto.fullyQualifiedName
+    if fqn not in TYPE_BANK:
+        # resolving the class reloads user code, which registers its types
+        resolve_class_type(fqn)
+    plan = get_serde_plan(fqn)
 
-    if nonrecursive:
-        if deserialize is None:
+    if plan.nonrecursive:
+        if plan.deserialize is None:
             raise Exception(
                 f"Cant serialize {type(proto)} nonrecursive without serialize."
             )
 
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
+        return plan.deserialize(combine_bytes(proto.nonrecursiveBlob))
+
+    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
+    # module name space in sub-processes or threads even though they are loaded on start
+    # its possible that the uvicorn awsgi server is preloading a bunch of threads
+    # however simply getting the class from the TYPE_BANK doesn't always work and
+    # causes some errors so it seems like we want to get the local one where possible
+    class_type = plan.get_class_type()
 
     kwargs = {}
+    deserialize_transforms = plan.deserialize_transforms
 
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
         if attr_name != "":
             attr_bytes = combine_bytes(attr_bytes_list)
             attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
+            transform = deserialize_transforms.get(attr_name, None)
 
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
+            if transform is not None:
+                attr_value = transform(attr_value)
             kwargs[attr_name] = attr_value
 
-    if hasattr(class_type, "serde_constructor"):
-        return class_type.serde_constructor(kwargs)
-
-    if issubclass(class_type, Enum) and "value" in kwargs:
-        obj = class_type.__new__(class_type, kwargs["value"])
-    elif issubclass(class_type, BaseModel):
-        # if we skip the __new__ flow of BaseModel we get the error
-        # AttributeError: object has no attribute '__fields_set__'
-
-        if "syft.user" in proto.fullyQualifiedName:
-            # weird issues with pydantic and ForwardRef on user classes being inited
-            # with custom state args / kwargs
-            obj = class_type()
-            for attr_name, attr_value in kwargs.items():
-                setattr(obj, attr_name, attr_value)
-        else:
-            obj = class_type(**kwargs)
-
-    else:
-        obj = class_type.__new__(class_type)  # type: ignore
-        for attr_name, attr_value in kwargs.items():
-            setattr(obj, attr_name, attr_value)
-
-    return obj
+    return plan.get_constructor(class_type)(kwargs)
 
 
 # how else do you import a relative file to execute it?
@@ -5,21 +5,13 @@ from datetime import time
 import functools
 from importlib.util import find_spec
 from io import BytesIO
+from typing import Any
 
 # third party
 from dateutil import parser
-from jax import numpy as jnp
-from jaxlib.xla_extension import ArrayImpl
 from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
-import networkx as nx
-from networkx import DiGraph
 import numpy as np
-from pandas import DataFrame
-from pandas import Series
-from pandas._libs.tslibs.timestamps import Timestamp
-import pyarrow as pa
-import pyarrow.parquet as pq
 import pydantic
 from pydantic._internal._model_construction import ModelMetaclass
 from pymongo.collection import Collection
@@ -33,7 +25,12 @@ from ..types.dicttuple import DictTuple
 from ..types.dicttuple import _Meta as _DictTupleMetaClass
 from ..types.syft_metaclass import EmptyType
 from ..types.syft_metaclass import PartialModelMetaclass
+from .arrow import is_numpy_raw
+from .arrow import numpy_raw_deserialize
+from .arrow import numpy_raw_serialize
+from .arrow import use_numpy_raw
 from .deserialize import _deserialize as deserialize
+from .recursive import recursive_serde_register_lazy
 from .recursive_primitives import _serialize_kv_pairs
 from .recursive_primitives import deserialize_kv
 from .recursive_primitives import deserialize_type
@@ -67,7 +64,11 @@ recursive_serde_register(cls=TypeError)
 recursive_serde_register_type(Collection)
 
 
-def serialize_dataframe(df: DataFrame) -> bytes:
+def serialize_dataframe(df: Any) -> bytes:
+    # third party
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
     table = pa.Table.from_pandas(df)
     sink = pa.BufferOutputStream()
     # 🟡 TODO 37: Should we warn about this?
@@ -81,7 +82,11 @@ def serialize_dataframe(df: DataFrame) -> bytes:
     return numpy_bytes
 
 
-def deserialize_dataframe(buf: bytes) -> DataFrame:
+def deserialize_dataframe(buf: bytes) -> Any:
+    # third party
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
     reader = pa.BufferReader(buf)
     numpy_bytes = reader.read_buffer()
     result = pq.read_table(numpy_bytes)
@@ -89,24 +94,37 @@ def deserialize_dataframe(buf: bytes) -> DataFrame:
     return df
 
 
-# pandas
-recursive_serde_register(
-    DataFrame,
-    serialize=serialize_dataframe,
-    deserialize=deserialize_dataframe,
-)
+def register_pandas() -> None:
+    # third party
+    from pandas import DataFrame
+    from pandas import Series
+    from pandas._libs.tslibs.timestamps import Timestamp
 
+    recursive_serde_register(
+        DataFrame,
+        serialize=serialize_dataframe,
+        deserialize=deserialize_dataframe,
+    )
 
-def deserialize_series(blob: bytes) -> Series:
-    df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return Series(df[df.columns[0]])
+    def deserialize_series(blob: bytes) -> Series:
+        df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
+        return Series(df[df.columns[0]])
 
+    recursive_serde_register(
+        Series,
+        serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+        deserialize=deserialize_series,
+    )
+
+    recursive_serde_register(
+        Timestamp,
+        serialize=lambda x: serialize(x.value, to_bytes=True),
+        deserialize=lambda x: Timestamp(deserialize(x, from_bytes=True)),
+    )
 
-recursive_serde_register(
-    Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
-    deserialize=deserialize_series,
-)
+
+# the heavy third party packages are registered on first use of one of their types
+recursive_serde_register_lazy("pandas", register_pandas)
 
 
 recursive_serde_register(
@@ -127,12 +145,6 @@ recursive_serde_register(
     deserialize=lambda x: parser.parse(deserialize(x, from_bytes=True)).date(),
 )
 
-recursive_serde_register(
-    Timestamp,
-    serialize=lambda x: serialize(x.value, to_bytes=True),
-    deserialize=lambda x: Timestamp(deserialize(x, from_bytes=True)),
-)
-
 
 def _serialize_dicttuple(x: DictTuple) -> bytes:
     return _serialize_kv_pairs(size=len(x), kv_pairs=zip(x.keys(), x))
@@ -181,12 +193,33 @@ try:
 except Exception:  # nosec
     pass
 
-# jax
-recursive_serde_register(
-    ArrayImpl,
-    serialize=lambda x: serialize(np.array(x), to_bytes=True),
-    deserialize=lambda x: jnp.array(deserialize(x, from_bytes=True)),
-)
+
+def register_jax() -> None:
+    # third party
+    from jax import numpy as jnp
+    from jaxlib.xla_extension import ArrayImpl
+
+    def serialize_jax(x: ArrayImpl) -> bytes:
+        # np.asarray reuses the host buffer of cpu arrays
+        array = np.asarray(x)
+        if use_numpy_raw(array):
+            return numpy_raw_serialize(array)
+        return serialize(array, to_bytes=True)
+
+    def deserialize_jax(x: bytes) -> ArrayImpl:
+        if is_numpy_raw(x):
+            return jnp.asarray(numpy_raw_deserialize(x))
+        return jnp.array(deserialize(x, from_bytes=True))
+
+    recursive_serde_register(
+        ArrayImpl,
+        serialize=serialize_jax,
+        deserialize=deserialize_jax,
+    )
+
+
+# jax arrays are defined in jaxlib
+recursive_serde_register_lazy("jaxlib", register_jax)
 
 
 # unsure why we have to register the object not the type but this works
@@ -213,48 +246,68 @@ NOTHING = None
 
 
 # TODO: debug serializing after updating a node
-def serialize_networkx_graph(graph: DiGraph) -> bytes:
+def serialize_networkx_graph(graph: Any) -> bytes:
+    # third party
+    import networkx as nx
+
     graph_dict: dict = nx.node_link_data(graph)
     return serialize(graph_dict, to_bytes=True)
 
 
-def deserialize_networkx_graph(buf: bytes) -> DiGraph:
+def deserialize_networkx_graph(buf: bytes) -> Any:
+    # third party
+    import networkx as nx
+
     graph_dict: dict = deserialize(buf, from_bytes=True)
     return nx.node_link_graph(graph_dict)
 
 
-recursive_serde_register(
-    DiGraph,
-    serialize=serialize_networkx_graph,
-    deserialize=deserialize_networkx_graph,
-)
-
-try:
-    # Just register these serializers if the google.cloud.bigquery & db_dtypes module are available
+def register_networkx() -> None:
     # third party
-    from google.cloud.bigquery.job.query import QueryJob
-    from google.cloud.bigquery.table import RowIterator
+    from networkx import DiGraph
+
+    recursive_serde_register(
+        DiGraph,
+        serialize=serialize_networkx_graph,
+        deserialize=deserialize_networkx_graph,
+    )
 
-    # Checking db_dtypes availability this way to avoid unused ruff issues, but this package is used internally
-    if not find_spec("db_dtypes"):
-        raise ImportError("db_dtypes module not found")
 
-    def convert_to_dataframe(obj: RowIterator) -> bytes:
-        dataframe = obj.to_dataframe()
-        return serialize_dataframe(dataframe)
+recursive_serde_register_lazy("networkx", register_networkx)
 
-    def convert_from_dataframe(blob: bytes) -> DataFrame:
-        dataframe = deserialize_dataframe(blob)
-        return dataframe
 
-    recursive_serde_register(
-        RowIterator, serialize=convert_to_dataframe, deserialize=convert_from_dataframe
-    )
+def register_bigquery() -> None:
+    try:
+        # Just register these serializers if the google.cloud.bigquery & db_dtypes module are available
+        # third party
+        from google.cloud.bigquery.job.query import QueryJob
+        from google.cloud.bigquery.table import RowIterator
 
-    recursive_serde_register(
-        QueryJob,
-        serialize=lambda obj: convert_to_dataframe(obj.result()),
-        deserialize=convert_from_dataframe,
-    )
-except ImportError:
-    pass
+        # Checking db_dtypes availability this way to avoid unused ruff issues, but this package is used internally
+        if not find_spec("db_dtypes"):
+            raise ImportError("db_dtypes module not found")
+
+        def convert_to_dataframe(obj: RowIterator) -> bytes:
+            dataframe = obj.to_dataframe()
+            return serialize_dataframe(dataframe)
+
+        def convert_from_dataframe(blob: bytes) -> Any:
+            dataframe = deserialize_dataframe(blob)
+            return dataframe
+
+        recursive_serde_register(
+            RowIterator,
+            serialize=convert_to_dataframe,
+            deserialize=convert_from_dataframe,
+        )
+
+        recursive_serde_register(
+            QueryJob,
+            serialize=lambda obj: convert_to_dataframe(obj.result()),
+            deserialize=convert_from_dataframe,
+        )
+    except ImportError:
+        pass
+
+
+recursive_serde_register_lazy("google", register_bigquery)
@@ -38,6 +38,8 @@ from ...types.uid import UID
 from .action_object import Action
 from .action_object import ActionObject
 
+LOG_RECORD_HEADER_SIZE = 8
+
 
 @serializable()
 class ExecutionStatus(Enum):
@@ -198,15 +200,27 @@ class InMemoryStoreClientConfig(StoreClientConfig):
 
 @serializable(without=["_lock"])
 class NetworkXBackingStore(BaseGraphStore):
+    """Graph kept in memory as a `nx.DiGraph` and persisted as a snapshot file
+    plus an append-only log of the mutations made since that snapshot.
+
+    The graph is loaded on first access. Once the log holds more records than
+    `compaction_threshold` and the graph has nodes and edges, a new snapshot is
+    written and the log is truncated, so every mutation costs an O(1) append.
+    """
+
+    compaction_threshold: int = 1000
+
     def __init__(self, store_config: StoreConfig, reset: bool = False) -> None:
         if store_config.client_config:
             self.path_str = store_config.client_config.file_path.as_posix()
         else:
             self.path_str = ""
-        if not reset and os.path.exists(self.path_str):
-            self._db = self._load_from_path(self.path_str)
-        else:
+        self._db: nx.DiGraph | None = None
+        self._log_records = 0
+        if reset:
             self._db = nx.DiGraph()
+            if self.path_str:
+                self.save()
 
         self.locking_config = store_config.locking_config
         self._lock: SyftLock | None = None
@@ -219,8 +233,14 @@ class NetworkXBackingStore(BaseGraphStore):
 
     @property
     def db(self) -> nx.Graph:
+        if self._db is None:
+            self._db = self._load()
         return self._db
 
+    @property
+    def log_path_str(self) -> str:
+        return f"{self.path_str}.log"
+
     def _thread_safe_cbk(
         self, cbk: Callable, *args: Any, **kwargs: Any
     ) -> Result[Any, str]:
@@ -246,7 +266,7 @@ class NetworkXBackingStore(BaseGraphStore):
             self.update(uid=uid, data=data)
         else:
             self.db.add_node(uid, data=data)
-        self.save()
+            self._append_log("set", uid, data)
 
     def get(self, uid: UID) -> Any:
         node_data = self.db.nodes.get(uid)
@@ -261,7 +281,7 @@ class NetworkXBackingStore(BaseGraphStore):
     def _delete(self, uid: UID) -> None:
         if self.exists(uid=uid):
             self.db.remove_node(uid)
-        self.save()
+            self._append_log("delete", uid)
 
     def find_neighbors(self, uid: UID) -> list | None:
         if self.exists(uid=uid):
@@ -275,21 +295,21 @@ class NetworkXBackingStore(BaseGraphStore):
     def _update(self, uid: UID, data: Any) -> None:
         if self.exists(uid=uid):
             self.db.nodes[uid]["data"] = data
-        self.save()
+            self._append_log("update", uid, data)
 
     def add_edge(self, parent: Any, child: Any) -> None:
         self._thread_safe_cbk(self._add_edge, parent=parent, child=child)
 
     def _add_edge(self, parent: Any, child: Any) -> None:
         self.db.add_edge(parent, child)
-        self.save()
+        self._append_log("add_edge", parent, child)
 
     def remove_edge(self, parent: Any, child: Any) -> None:
         self._thread_safe_cbk(self._remove_edge, parent=parent, child=child)
 
     def _remove_edge(self, parent: Any, child: Any) -> None:
         self.db.remove_edge(parent, child)
-        self.save()
+        self._append_log("remove_edge", parent, child)
 
     def visualize(self, seed: int = 3113794652, figsize: tuple = (20, 10)) -> None:
         plt.figure(figsize=figsize)
@@ -313,9 +333,73 @@ class NetworkXBackingStore(BaseGraphStore):
         return parent in parents
 
     def save(self) -> None:
+        """Write a full snapshot of the graph and truncate the mutation log."""
         bytes = _serialize(self.db, to_bytes=True)
-        with open(self.path_str, "wb") as f:
+        tmp_path_str = f"{self.path_str}.tmp"
+        with open(tmp_path_str, "wb") as f:
             f.write(bytes)
+        os.replace(tmp_path_str, self.path_str)
+        with open(self.log_path_str, "wb"):
+            pass
+        self._log_records = 0
+
+    def _append_log(self, op: str, *args: Any) -> None:
+        if not self.path_str:
+            return
+        record = _serialize((op, *args), to_bytes=True)
+        with open(self.log_path_str, "ab") as f:
+            f.write(len(record).to_bytes(LOG_RECORD_HEADER_SIZE, "big") + record)
+        self._log_records += 1
+        if self._log_records > max(
+            self.compaction_threshold,
+            self.db.number_of_nodes() + self.db.number_of_edges(),
+        ):
+            self.save()
+
+    def _load(self) -> nx.DiGraph:
+        if self.path_str and os.path.exists(self.path_str):
+            db = self._load_from_path(self.path_str)
+        else:
+            db = nx.DiGraph()
+        if self.path_str and os.path.exists(self.log_path_str):
+            self._log_records, log_size = self._replay_log(db, self.log_path_str)
+            if log_size < os.path.getsize(self.log_path_str):
+                # drop a partially written record, new records would be appended
+                # after it and couldn't be read back
+                with open(self.log_path_str, "r+b") as f:
+                    f.truncate(log_size)
+        return db
+
+    @staticmethod
+    def _replay_log(db: nx.DiGraph, file_path: str) -> tuple[int, int]:
+        """Apply the complete records of the log, returns their count and size"""
+        with open(file_path, "rb") as f:
+            log = f.read()
+
+        n_records, offset = 0, 0
+        while offset + LOG_RECORD_HEADER_SIZE <= len(log):
+            size = int.from_bytes(log[offset : offset + LOG_RECORD_HEADER_SIZE], "big")
+            record_start = offset + LOG_RECORD_HEADER_SIZE
+            if record_start + size > len(log):
+                # partially written record, the mutation never completed
+                break
+            op, *args = _deserialize(
+                log[record_start : record_start + size], from_bytes=True
+            )
+            offset = record_start + size
+            n_records += 1
+
+            if op == "set":
+                db.add_node(args[0], data=args[1])
+            elif op == "update" and args[0] in db:
+                db.nodes[args[0]]["data"] = args[1]
+            elif op == "delete" and args[0] in db:
+                db.remove_node(args[0])
+            elif op == "add_edge":
+                db.add_edge(args[0], args[1])
+            elif op == "remove_edge" and db.has_edge(args[0], args[1]):
+                db.remove_edge(args[0], args[1])
+        return n_records, offset
 
     def _filter_nodes_by(self, uid: UID, qks: QueryKeys) -> bool:
         node_data = self.db.nodes[uid]["data"]
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 # stdlib
+from collections.abc import Callable
 import threading
+from typing import Any
 
 # third party
 from result import Err
@@ -16,6 +18,11 @@ from ...serde.serializable import serializable
 from ...store.dict_document_store import DictStoreConfig
 from ...store.document_store import BasePartitionSettings
 from ...store.document_store import StoreConfig
+from ...store.kv_document_store import DictPermissionStore
+from ...store.kv_document_store import KeyValuePermissionStore
+from ...store.locks import SyftLock
+from ...store.sqlite_document_store import SQLiteBackingStore
+from ...store.sqlite_document_store import SQLitePermissionStore
 from ...types.syft_object import SyftObject
 from ...types.twin_object import TwinObject
 from ...types.uid import LineageID
@@ -37,7 +44,17 @@ class ActionStore:
     pass
 
 
-@serializable()
+@serializable(
+    attrs=[
+        "node_uid",
+        "store_config",
+        "settings",
+        "data",
+        "permissions",
+        "storage_permissions",
+        "root_verify_key",
+    ]
+)
 class KeyValueActionStore(ActionStore):
     """Generic Key-Value Action store.
 
@@ -48,6 +65,8 @@ class KeyValueActionStore(ActionStore):
             Signature verification key, used for checking access permissions.
     """
 
+    permission_store: type[KeyValuePermissionStore] = DictPermissionStore
+
     def __init__(
         self,
         node_uid: UID,
@@ -60,19 +79,103 @@ class KeyValueActionStore(ActionStore):
         self.data = self.store_config.backing_store(
             "data", self.settings, self.store_config
         )
-        self.permissions = self.store_config.backing_store(
-            "permissions", self.settings, self.store_config, ddtype=set
+        self.permissions = self.permission_store(
+            "permissions", self.settings, self.store_config
         )
-        self.storage_permissions = self.store_config.backing_store(
-            "storage_permissions", self.settings, self.store_config, ddtype=set
+        self.storage_permissions = self.permission_store(
+            "storage_permissions", self.settings, self.store_config, value_type=UID
         )
 
         if root_verify_key is None:
             root_verify_key = SyftSigningKey.generate().verify_key
         self.root_verify_key = root_verify_key
+        self._lock: SyftLock | None = self._create_lock()
+
+    def _create_lock(self) -> SyftLock:
+        locking_config = self.store_config.locking_config.model_copy(
+            update={"lock_name": f"ActionStore-{self.node_uid}"}
+        )
+        return SyftLock(locking_config)
+
+    @property
+    def lock(self) -> SyftLock:
+        store_lock = getattr(self, "_lock", None)
+        if store_lock is None:
+            # the lock is not serialized, a deserialized store creates it once
+            with lock:
+                store_lock = getattr(self, "_lock", None)
+                if store_lock is None:
+                    store_lock = self._create_lock()
+                    self._lock = store_lock
+        return store_lock
+
+    def close(self) -> None:
+        """Release the connections of the store"""
+        pass
+
+    def _thread_safe_cbk(self, cbk: Callable, *args: Any, **kwargs: Any) -> Any | Err:
+        store_lock = self.lock
+        if not store_lock.acquire(blocking=True):
+            return Err(
+                f"Failed to acquire lock for the operation {store_lock.lock_name}"
+            )
+        try:
+            return cbk(*args, **kwargs)
+        finally:
+            store_lock.release()
+
+    def _thread_safe_read_cbk(
+        self, cbk: Callable, *args: Any, **kwargs: Any
+    ) -> Any | Err:
+        store_lock = self.lock
+        if not store_lock.acquire_read(blocking=True):
+            return Err(
+                f"Failed to acquire lock for the operation {store_lock.lock_name}"
+            )
+        try:
+            return cbk(*args, **kwargs)
+        finally:
+            store_lock.release_read()
 
     def get(
         self, uid: UID, credentials: SyftVerifyKey, has_permission: bool = False
+    ) -> Result[SyftObject, str]:
+        return self._thread_safe_read_cbk(self._get, uid, credentials, has_permission)
+
+    def get_mock(self, uid: UID) -> Result[SyftObject, str]:
+        return self._thread_safe_read_cbk(self._get_mock, uid)
+
+    def get_pointer(
+        self,
+        uid: UID,
+        credentials: SyftVerifyKey,
+        node_uid: UID,
+    ) -> Result[SyftObject, str]:
+        return self._thread_safe_read_cbk(self._get_pointer, uid, credentials, node_uid)
+
+    def set(
+        self,
+        uid: UID,
+        credentials: SyftVerifyKey,
+        syft_object: SyftObject,
+        has_result_read_permission: bool = False,
+        add_storage_permission: bool = True,
+    ) -> Result[SyftSuccess, Err]:
+        return self._thread_safe_cbk(
+            self._set,
+            uid,
+            credentials,
+            syft_object,
+            has_result_read_permission=has_result_read_permission,
+            add_storage_permission=add_storage_permission,
+        )
+
+    def delete(self, uid: UID, credentials: SyftVerifyKey) -> Result[SyftSuccess, str]:
+        return self._thread_safe_cbk(self._delete, uid, credentials)
+
+    # The methods below don't lock, and must not call the locking methods above
+    def _get(
+        self, uid: UID, credentials: SyftVerifyKey, has_permission: bool = False
     ) -> Result[SyftObject, str]:
         uid = uid.id  # We only need the UID from LineageID or UID
 
@@ -91,7 +194,7 @@ class KeyValueActionStore(ActionStore):
                 return Err(f"Could not find item with uid {uid}, {e}")
         return Err(f"Permission: {read_permission} denied")
 
-    def get_mock(self, uid: UID) -> Result[SyftObject, str]:
+    def _get_mock(self, uid: UID) -> Result[SyftObject, str]:
         uid = uid.id  # We only need the UID from LineageID or UID
 
         try:
@@ -104,7 +207,7 @@ class KeyValueActionStore(ActionStore):
         except Exception as e:
             return Err(f"Could not find item with uid {uid}, {e}")
 
-    def get_pointer(
+    def _get_pointer(
         self,
         uid: UID,
         credentials: SyftVerifyKey,
@@ -139,7 +242,7 @@ class KeyValueActionStore(ActionStore):
 
         return uid in self.data
 
-    def set(
+    def _set(
         self,
         uid: UID,
         credentials: SyftVerifyKey,
@@ -167,9 +270,6 @@ class KeyValueActionStore(ActionStore):
 
         if can_write:
             self.data[uid] = syft_object
-            if uid not in self.permissions:
-                # create default permissions
-                self.permissions[uid] = set()
             if has_result_read_permission:
                 self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
             else:
@@ -180,9 +280,6 @@ class KeyValueActionStore(ActionStore):
                     ]
                 )
 
-            if uid not in self.storage_permissions:
-                # create default storage permissions
-                self.storage_permissions[uid] = set()
             if add_storage_permission:
                 self.add_storage_permission(
                     StoragePermission(uid=uid, node_uid=self.node_uid)
@@ -209,7 +306,7 @@ class KeyValueActionStore(ActionStore):
             return Ok(SyftSuccess(message=f"Ownership of ID: {uid} taken."))
         return Err(f"UID: {uid} already owned.")
 
-    def delete(self, uid: UID, credentials: SyftVerifyKey) -> Result[SyftSuccess, str]:
+    def _delete(self, uid: UID, credentials: SyftVerifyKey) -> Result[SyftSuccess, str]:
         uid = uid.id  # We only need the UID from LineageID or UID
 
         # if you delete something you need OWNER permission
@@ -234,40 +331,25 @@ class KeyValueActionStore(ActionStore):
         ):
             return True
 
-        if (
-            permission.uid in self.permissions
-            and permission.permission_string in self.permissions[permission.uid]
-        ):
-            return True
-
         # 🟡 TODO 14: add ALL_READ, ALL_EXECUTE etc
-        if permission.permission == ActionPermission.OWNER:
-            pass
-        elif permission.permission == ActionPermission.READ:
-            pass
-        elif permission.permission == ActionPermission.WRITE:
-            pass
-        elif permission.permission == ActionPermission.EXECUTE:
-            pass
-
-        return False
+        return self.permissions.has_any(permission.uid, [permission.permission_string])
 
     def has_permissions(self, permissions: list[ActionObjectPermission]) -> bool:
         return all(self.has_permission(p) for p in permissions)
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.add(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.add(permission.uid, permission.permission_string)
 
     def remove_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.remove(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.remove(permission.uid, permission.permission_string)
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
-        for permission in permissions:
-            self.add_permission(permission)
+        self.permissions.add_many(
+            [
+                (permission.uid, permission.permission_string)
+                for permission in permissions
+            ]
+        )
 
     def _get_permissions_for_uid(self, uid: UID) -> Result[set[str], str]:
         if uid in self.permissions:
@@ -275,29 +357,24 @@ class KeyValueActionStore(ActionStore):
         return Err(f"No permissions found for uid: {uid}")
 
     def add_storage_permission(self, permission: StoragePermission) -> None:
-        permissions = self.storage_permissions[permission.uid]
-        permissions.add(permission.node_uid)
-        self.storage_permissions[permission.uid] = permissions
+        self.storage_permissions.add(permission.uid, permission.node_uid)
 
     def add_storage_permissions(self, permissions: list[StoragePermission]) -> None:
-        for permission in permissions:
-            self.add_storage_permission(permission)
+        self.storage_permissions.add_many(
+            [(permission.uid, permission.node_uid) for permission in permissions]
+        )
 
     def remove_storage_permission(self, permission: StoragePermission) -> None:
-        permissions = self.storage_permissions[permission.uid]
-        permissions.remove(permission.node_uid)
-        self.storage_permissions[permission.uid] = permissions
+        self.storage_permissions.remove(permission.uid, permission.node_uid)
 
     def has_storage_permission(self, permission: StoragePermission | UID) -> bool:
         if isinstance(permission, UID):
             permission = StoragePermission(uid=permission, node_uid=self.node_uid)
 
-        if permission.uid in self.storage_permissions:
-            return permission.node_uid in self.storage_permissions[permission.uid]
-        return False
+        return self.storage_permissions.has_any(permission.uid, [permission.node_uid])
 
     def _get_storage_permissions_for_uid(self, uid: UID) -> Result[set[UID], str]:
-        if uid in self.storage_permissions:
+        if uid in self.storage_permissions or uid in self.data:
             return Ok(self.storage_permissions[uid])
         return Err(f"No storage permissions found for uid: {uid}")
 
@@ -366,7 +443,15 @@ class SQLiteActionStore(KeyValueActionStore):
             Signature verification key, used for checking access permissions.
     """
 
-    pass
+    permission_store: type[KeyValuePermissionStore] = SQLitePermissionStore
+
+    def close(self) -> None:
+        # the connection is shared by every store of the file, and only closed
+        # with the last of them
+        with self.lock:
+            for store in [self.data, self.permissions, self.storage_permissions]:
+                if isinstance(store, SQLiteBackingStore):
+                    store._close()
 
 
 @serializable()
@@ -1,11 +1,13 @@
 # stdlib
 import ast
 from collections.abc import Callable
+import hashlib
 import inspect
 from inspect import Signature
 import keyword
 import re
 import textwrap
+from threading import Lock
 from typing import Any
 from typing import cast
 
@@ -38,6 +40,12 @@ from ..user.user import UserView
 
 NOT_ACCESSIBLE_STRING = "N / A"
 
+# compiled endpoint functions kept per process, endpoints are usually called in loops
+ENDPOINT_FUNCTION_CACHE_SIZE = 256
+# (endpoint path, hash of the code) -> function, in least recently used order
+ENDPOINT_FUNCTION_CACHE: dict[tuple[str, str], Callable] = {}
+ENDPOINT_FUNCTION_CACHE_LOCK = Lock()
+
 
 class HelperFunctionSet:
     def __init__(self, helper_functions: dict[str, Callable]) -> None:
@@ -469,19 +477,12 @@ class TwinAPIEndpoint(SyncableSyftObject):
         **kwargs: Any,
     ) -> Any:
         try:
-            inner_function = ast.parse(code.api_code).body[0]
-            inner_function.decorator_list = []
-            # compile the function
-            raw_byte_code = compile(ast.unparse(inner_function), "<string>", "exec")
-
-            # load it
-            exec(raw_byte_code)  # nosec
+            func = get_endpoint_function(self.path, code)
 
             internal_context = code.build_internal_context(context)
 
             # execute it
-            evil_string = f"{code.func_name}(*args, **kwargs,context=internal_context)"
-            result = eval(evil_string, None, locals())  # nosec
+            result = func(*args, **kwargs, context=internal_context)
 
             # Update code context state
             code.update_state(internal_context.state)
@@ -513,6 +514,40 @@ class TwinAPIEndpoint(SyncableSyftObject):
                 )
 
 
+def get_endpoint_function(path: str, code: Endpoint) -> Callable:
+    """Compile the function of the endpoint code, cached by the path of the
+    endpoint and the hash of the code"""
+    code_hash = hashlib.sha256(code.api_code.encode("utf8")).hexdigest()
+    key = (path, code_hash)
+    with ENDPOINT_FUNCTION_CACHE_LOCK:
+        func = ENDPOINT_FUNCTION_CACHE.pop(key, None)
+        if func is not None:
+            ENDPOINT_FUNCTION_CACHE[key] = func
+            return func
+
+    inner_function = ast.parse(code.api_code).body[0]
+    inner_function.decorator_list = []
+    # compile the function
+    raw_byte_code = compile(ast.unparse(inner_function), "<string>", "exec")
+
+    # load it
+    scope: dict[str, Callable] = {}
+    exec(raw_byte_code, globals(), scope)  # nosec
+    func = scope[code.func_name]
+
+    with ENDPOINT_FUNCTION_CACHE_LOCK:
+        ENDPOINT_FUNCTION_CACHE[key] = func
+        while len(ENDPOINT_FUNCTION_CACHE) > ENDPOINT_FUNCTION_CACHE_SIZE:
+            ENDPOINT_FUNCTION_CACHE.pop(next(iter(ENDPOINT_FUNCTION_CACHE)), None)
+    return func
+
+
+def invalidate_endpoint_functions(path: str) -> None:
+    with ENDPOINT_FUNCTION_CACHE_LOCK:
+        for key in [key for key in ENDPOINT_FUNCTION_CACHE if key[0] == path]:
+            del ENDPOINT_FUNCTION_CACHE[key]
+
+
 def set_access_type(context: TransformContext) -> TransformContext:
     if context.output is not None and context.obj is not None:
         if context.obj.private_function is not None:
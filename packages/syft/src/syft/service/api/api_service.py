@@ -33,6 +33,7 @@ from .api import TwinAPIContextView
 from .api import TwinAPIEndpoint
 from .api import TwinAPIEndpointView
 from .api import UpdateTwinAPIEndpoint
+from .api import invalidate_endpoint_functions
 from .api_stash import TwinAPIEndpointStash
 
 
@@ -178,6 +179,7 @@ class APIService(AbstractService):
         if result.is_err():
             return SyftError(message=result.err())
 
+        invalidate_endpoint_functions(endpoint_path)
         return SyftSuccess(message="Endpoint successfully updated.")
 
     @service_method(
@@ -204,6 +206,8 @@ class APIService(AbstractService):
         if result.is_err():
             return SyftError(message=result.err())
 
+        invalidate_endpoint_functions(endpoint_path)
+
         return SyftSuccess(message="Endpoint successfully deleted.")
 
     @service_method(
@@ -15,6 +15,7 @@ import itertools
 import random
 import sys
 from textwrap import dedent
+from threading import Lock
 from threading import Thread
 import time
 import traceback
@@ -98,6 +99,14 @@ SubmitTimePartitionKey = PartitionKey(key="submit_time", type_=DateTime)
 
 PyCodeObject = Any
 
+# compiled code kept per process, the same code runs for every job, nested call and
+# on both the private and the mock data
+USER_CODE_CACHE_SIZE = 256
+# (user code id, hash of the parsed code) -> (compiled code, compiled call of the
+# function), in least recently used order
+USER_CODE_CACHE: dict[tuple[UID, str], tuple[PyCodeObject, PyCodeObject]] = {}
+USER_CODE_CACHE_LOCK = Lock()
+
 
 @serializable()
 class UserCodeStatus(Enum):
@@ -1119,6 +1128,28 @@ def compile_byte_code(parsed_code: str) -> PyCodeObject | None:
     return None
 
 
+def get_compiled_code(code_item: UserCode) -> tuple[PyCodeObject, PyCodeObject]:
+    """Compile the code and the call of its function, cached by the id and the
+    hash of the parsed code so changed code is compiled again"""
+    code_hash = hashlib.sha256(code_item.parsed_code.encode("utf8")).hexdigest()
+    key = (code_item.id, code_hash)
+    with USER_CODE_CACHE_LOCK:
+        compiled = USER_CODE_CACHE.pop(key, None)
+        if compiled is not None:
+            USER_CODE_CACHE[key] = compiled
+            return compiled
+
+    compiled = (
+        compile(code_item.parsed_code, "<string>", "exec"),
+        compile(f"{code_item.unique_func_name}(**kwargs)", "<string>", "eval"),
+    )
+    with USER_CODE_CACHE_LOCK:
+        USER_CODE_CACHE[key] = compiled
+        while len(USER_CODE_CACHE) > USER_CODE_CACHE_SIZE:
+            USER_CODE_CACHE.pop(next(iter(USER_CODE_CACHE)), None)
+    return compiled
+
+
 def compile_code(context: TransformContext) -> TransformContext:
     if context.output is None:
         return context
@@ -1478,11 +1509,11 @@ def execute_byte_code(
                     raise Exception(code_obj.err())
                 _globals[service_func_name] = code_obj.ok()
         _globals["print"] = print
-        exec(code_item.parsed_code, _globals, _locals)  # nosec
+        byte_code, call_byte_code = get_compiled_code(code_item)
+        exec(byte_code, _globals, _locals)  # nosec
 
-        evil_string = f"{code_item.unique_func_name}(**kwargs)"
         try:
-            result = eval(evil_string, _globals, _locals)  # nosec
+            result = eval(call_byte_code, _globals, _locals)  # nosec
         except Exception as e:
             error_msg = traceback_from_error(e, code_item)
             if context.job is not None:
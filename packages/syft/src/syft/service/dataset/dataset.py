@@ -7,7 +7,6 @@ from typing import Any
 # third party
 from IPython.display import HTML
 from IPython.display import display
-import itables
 import pandas as pd
 from pydantic import ConfigDict
 from pydantic import field_validator
@@ -151,6 +150,9 @@ class Asset(SyftObject):
         .itables table th {{color: {SURFACE_SURFACE[options.color_theme]};}}
         """
 
+        # third party
+        import itables
+
         # relative
         from ...service.action.action_object import ActionObject
 
@@ -33,12 +33,19 @@ def _paginate_collection(
     collection: Collection,
     page_size: int | None = 0,
     page_index: int | None = 0,
+) -> slice | None:
+    return _paginate_total(len(collection), page_size=page_size, page_index=page_index)
+
+
+def _paginate_total(
+    total: int,
+    page_size: int | None = 0,
+    page_index: int | None = 0,
 ) -> slice | None:
     if page_size is None or page_size <= 0:
         return None
 
     # If chunk size is defined, then split list into evenly sized chunks
-    total = len(collection)
     page_index = 0 if page_index is None else page_index
 
     if page_size > total or page_index >= total // page_size or page_index < 0:
@@ -114,7 +121,24 @@ class DatasetService(AbstractService):
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset] | SyftError:
         """Get a Dataset"""
-        result = self.stash.get_all(context.credentials)
+        slice_ = None
+        if page_size is not None and page_size > 0:
+            # only load the requested page from the store
+            total = self.stash.count(context.credentials)
+            if total.is_err():
+                return SyftError(message=total.err())
+            slice_ = _paginate_total(
+                total.ok(), page_size=page_size, page_index=page_index
+            )
+
+        if slice_ is None:
+            result = self.stash.get_all(context.credentials)
+        else:
+            result = self.stash.get_all(
+                context.credentials,
+                limit=slice_.stop - slice_.start,
+                offset=slice_.start,
+            )
         if not result.is_ok():
             return SyftError(message=result.err())
 
@@ -124,9 +148,10 @@ class DatasetService(AbstractService):
             if context.node is not None:
                 dataset.node_uid = context.node.id
 
-        return _paginate_dataset_collection(
-            datasets=datasets, page_size=page_size, page_index=page_index
-        )
+        results = DictTuple(datasets, lambda dataset: dataset.name)
+        if slice_ is None:
+            return results
+        return DatasetPageView(datasets=results, total=total.ok())
 
     @service_method(path="dataset.search", name="search", roles=GUEST_ROLE_LEVEL)
     def search(
@@ -142,6 +142,7 @@ class JobService(AbstractService):
         if result.is_err():
             return SyftError(message=str(result.err()))
 
+        context.node.notify_queue(queue_item)
         return SyftSuccess(message="Great Success!")
 
     @service_method(
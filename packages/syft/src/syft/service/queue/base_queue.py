@@ -57,6 +57,9 @@ class QueueProducer:
     ) -> None:
         raise NotImplementedError
 
+    def notify(self, item: Any) -> None:
+        raise NotImplementedError
+
     def close(self) -> None:
         raise NotImplementedError
 
@@ -111,6 +114,9 @@ class BaseQueueManager:
     def send(self, message: bytes, queue_name: str) -> SyftSuccess | SyftError:
         raise NotImplementedError
 
+    def notify(self, item: Any) -> None:
+        raise NotImplementedError
+
     @property
     def publisher(self) -> QueueProducer:
         raise NotImplementedError
@@ -1,4 +1,6 @@
 # stdlib
+import hashlib
+import os
 import threading
 import time
 from typing import Any
@@ -15,6 +17,7 @@ from ...node.credentials import SyftVerifyKey
 from ...node.worker_settings import WorkerSettings
 from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
+from ...serde.serialize import _serialize as serialize
 from ...service.context import AuthedServiceContext
 from ...store.document_store import BaseStash
 from ...types.datetime import DateTime
@@ -127,6 +130,11 @@ class QueueManager(BaseQueueManager):
             queue_name=queue_name,
         )
 
+    def notify(self, item: QueueItem) -> None:
+        """Tell the producers running in this process that `item` was enqueued."""
+        for producer in self.producers.values():
+            producer.notify(item)
+
     @property
     def producers(self) -> Any:
         return self._client.producers
@@ -136,13 +144,29 @@ class QueueManager(BaseQueueManager):
         return self._client.consumers
 
 
-def handle_message_multiprocessing(
-    worker_settings: WorkerSettings,
-    queue_item: QueueItem,
-    credentials: SyftVerifyKey,
-) -> None:
-    # this is a temp hack to prevent some multithreading issues
-    time.sleep(0.5)
+# worker nodes are expensive to build (store init, services, migration checks),
+# so each consumer keeps the node it built for a given set of worker settings
+# and reuses it for every message it handles
+WORKER_NODE_CACHE_SIZE = 16
+# cache key -> node, in least recently used order
+WORKER_NODE_CACHE: dict[tuple, Any] = {}
+WORKER_NODE_CACHE_LOCK = threading.Lock()
+
+
+def worker_node_cache_key(
+    worker_settings: WorkerSettings, syft_worker_id: UID | None = None
+) -> tuple:
+    store_configs = (
+        worker_settings.document_store_config,
+        worker_settings.action_store_config,
+        worker_settings.blob_store_config,
+    )
+    configs_hash = hashlib.sha256(serialize(store_configs, to_bytes=True)).hexdigest()
+    # the pid keeps a forked child from reusing the parent's node and connections
+    return (os.getpid(), syft_worker_id, worker_settings.id, configs_hash)
+
+
+def create_worker_node(worker_settings: WorkerSettings) -> Any:
     queue_config = worker_settings.queue_config
     if queue_config is None:
         raise ValueError(f"{worker_settings} has no queue configurations!")
@@ -164,6 +188,65 @@ def handle_message_multiprocessing(
         migrate=False,
     )
 
+    # otherwise it reads it from env, resulting in the wrong credentials
+    worker.id = worker_settings.id
+    worker.signing_key = worker_settings.signing_key
+    return worker
+
+
+def get_worker_node(
+    worker_settings: WorkerSettings, syft_worker_id: UID | None = None
+) -> Any:
+    """Get the cached worker node for these settings, creating it on first use."""
+    key = worker_node_cache_key(worker_settings, syft_worker_id)
+    with WORKER_NODE_CACHE_LOCK:
+        worker = WORKER_NODE_CACHE.pop(key, None)
+        if worker is not None:
+            WORKER_NODE_CACHE[key] = worker
+            return worker
+
+    # building a node takes a while, the other consumers don't wait for it
+    new_worker = create_worker_node(worker_settings)
+    unused = []
+    with WORKER_NODE_CACHE_LOCK:
+        worker = WORKER_NODE_CACHE.pop(key, None)
+        if worker is None:
+            worker = new_worker
+        else:
+            # built by another thread in the meantime
+            unused.append(new_worker)
+        WORKER_NODE_CACHE[key] = worker
+        while len(WORKER_NODE_CACHE) > WORKER_NODE_CACHE_SIZE:
+            unused.append(WORKER_NODE_CACHE.pop(next(iter(WORKER_NODE_CACHE))))
+    for unused_worker in unused:
+        unused_worker.close_stores()
+    return worker
+
+
+def clear_worker_node_cache(syft_worker_id: UID | None = None) -> None:
+    """Release the cached worker nodes of a consumer, or all of them."""
+    with WORKER_NODE_CACHE_LOCK:
+        keys = [
+            key
+            for key in WORKER_NODE_CACHE
+            if syft_worker_id is None or key[1] == syft_worker_id
+        ]
+        workers = [WORKER_NODE_CACHE.pop(key) for key in keys]
+    for worker in workers:
+        worker.close_stores()
+
+
+def handle_message_multiprocessing(
+    worker_settings: WorkerSettings,
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+    worker: Any | None = None,
+) -> None:
+    if worker is None:
+        # this is a temp hack to prevent some multithreading issues
+        time.sleep(0.5)
+        worker = create_worker_node(worker_settings)
+
     job_item = worker.job_stash.get_by_uid(credentials, queue_item.job_id).ok()
 
     # Set monitor thread for this job.
@@ -277,31 +360,11 @@ class APICallMessageHandler(AbstractMessageHandler):
 
     @staticmethod
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
-        # relative
-        from ...node.node import Node
-
         queue_item = deserialize(message, from_bytes=True)
         worker_settings = queue_item.worker_settings
-
         queue_config = worker_settings.queue_config
-        queue_config.client_config.create_producer = False
-        queue_config.client_config.n_consumers = 0
-
-        worker = Node(
-            id=worker_settings.id,
-            name=worker_settings.name,
-            signing_key=worker_settings.signing_key,
-            document_store_config=worker_settings.document_store_config,
-            action_store_config=worker_settings.action_store_config,
-            blob_storage_config=worker_settings.blob_store_config,
-            queue_config=queue_config,
-            is_subprocess=True,
-            migrate=False,
-        )
 
-        # otherwise it reads it from env, resulting in the wrong credentials
-        worker.id = worker_settings.id
-        worker.signing_key = worker_settings.signing_key
+        worker = get_worker_node(worker_settings, syft_worker_id)
 
         credentials = queue_item.syft_client_verify_key
 
@@ -342,7 +405,7 @@ class APICallMessageHandler(AbstractMessageHandler):
 
             thread = Thread(
                 target=handle_message_multiprocessing,
-                args=(worker_settings, queue_item, credentials),
+                args=(worker_settings, queue_item, credentials, worker),
             )
             thread.start()
             thread.join()
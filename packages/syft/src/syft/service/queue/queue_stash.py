@@ -129,8 +129,8 @@ class QueueStash(BaseStash):
     ) -> Result[QueueItem, str]:
         # 🟡 TODO 36: Needs distributed lock
         if not item.resolved:
-            exists = self.get_by_uid(credentials, item.id)
-            if exists.is_ok() and exists.ok() is None:
+            exists = self.exists(credentials, UIDPartitionKey.with_obj(item.id))
+            if exists.is_ok() and not exists.ok():
                 valid = self.check_type(item, self.object_type)
                 if valid.is_err():
                     return SyftError(message=valid.err())
@@ -1,11 +1,11 @@
 # stdlib
 from binascii import hexlify
 from collections import defaultdict
-import itertools
+from queue import Empty
+from queue import SimpleQueue
 import socketserver
 import threading
 import time
-from time import sleep
 from typing import Any
 
 # third party
@@ -39,6 +39,7 @@ from .base_queue import QueueConfig
 from .base_queue import QueueConsumer
 from .base_queue import QueueProducer
 from .queue_stash import ActionQueueItem
+from .queue_stash import QueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
 
@@ -57,6 +58,11 @@ WORKER_TIMEOUT_SEC = 60
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
+# Interval (in seconds) between producer scans of the queue stash. Enqueued items are
+# normally pushed to the producer, the scan picks up items created by other processes
+# and items whose action arguments were not resolved yet.
+QUEUE_STASH_SCAN_INTERVAL_SEC = 1
+
 # Lock for working on ZMQ socket
 ZMQ_SOCKET_LOCK = threading.Lock()
 
@@ -147,6 +153,7 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = threading.Event()
+        self._pending_items: SimpleQueue = SimpleQueue()
         self.post_init()
 
     @property
@@ -167,14 +174,27 @@ class ZMQProducer(QueueProducer):
         self.poll_workers = zmq.Poller()
         self.poll_workers.register(self.socket, zmq.POLLIN)
         self.bind(f"tcp://*:{self.port}")
+
+        # wakes up the worker loop as soon as new requests are ready to dispatch
+        wakeup_address = f"inproc://producer-wakeup-{self.id}"
+        self.wakeup_socket = self.context.socket(zmq.PAIR)
+        self.wakeup_socket.setsockopt(LINGER, 0)
+        self.wakeup_socket.bind(wakeup_address)
+        self.poll_workers.register(self.wakeup_socket, zmq.POLLIN)
+        self.wakeup_sender = self.context.socket(zmq.PAIR)
+        self.wakeup_sender.setsockopt(LINGER, 0)
+        self.wakeup_sender.connect(wakeup_address)
         self.thread: threading.Thread | None = None
         self.producer_thread: threading.Thread | None = None
 
     def close(self) -> None:
         self._stop.set()
+        # unblock the item reader
+        self._pending_items.put(None)
 
         try:
             self.poll_workers.unregister(self.socket)
+            self.poll_workers.unregister(self.wakeup_socket)
         except Exception as e:
             logger.exception("Failed to unregister poller. {}", e)
         finally:
@@ -187,6 +207,8 @@ class ZMQProducer(QueueProducer):
                 self.producer_thread = None
 
             self.socket.close()
+            self.wakeup_socket.close()
+            self.wakeup_sender.close()
             self.context.destroy()
 
             self._stop.clear()
@@ -268,74 +290,100 @@ class ZMQProducer(QueueProducer):
             context=self.auth_context, action_object=new_action_object
         )
 
+    def notify(self, item: QueueItem) -> None:
+        """Push a newly enqueued item to the producer instead of waiting for a scan."""
+        self._pending_items.put(item.id)
+
     def read_items(self) -> None:
+        next_scan = Timeout(QUEUE_STASH_SCAN_INTERVAL_SEC)
         while True:
             if self._stop.is_set():
                 break
-            sleep(1)
-
-            # Items to be queued
-            items_to_queue = self.queue_stash.get_by_status(
-                self.queue_stash.partition.root_verify_key,
-                status=Status.CREATED,
-            ).ok()
-
-            items_to_queue = [] if items_to_queue is None else items_to_queue
-
-            # Queue Items that are in the processing state
-            items_processing = self.queue_stash.get_by_status(
-                self.queue_stash.partition.root_verify_key,
-                status=Status.PROCESSING,
-            ).ok()
-
-            items_processing = [] if items_processing is None else items_processing
-
-            for item in itertools.chain(items_to_queue, items_processing):
-                if item.status == Status.CREATED:
-                    if isinstance(item, ActionQueueItem):
-                        action = item.kwargs["action"]
-                        if self.contains_unresolved_action_objects(
-                            action.args
-                        ) or self.contains_unresolved_action_objects(action.kwargs):
-                            continue
-                        for arg in action.args:
-                            self.preprocess_action_arg(arg)
-                        for _, arg in action.kwargs.items():
-                            self.preprocess_action_arg(arg)
-
-                    msg_bytes = serialize(item, to_bytes=True)
-                    worker_pool = item.worker_pool.resolve_with_context(
-                        self.auth_context
-                    )
-                    worker_pool = worker_pool.ok()
-                    service_name = worker_pool.name
-                    service: Service | None = self.services.get(service_name)
 
-                    # Skip adding message if corresponding service/pool
-                    # is not registered.
-                    if service is None:
-                        continue
+            try:
+                uid = self._pending_items.get(
+                    timeout=max(next_scan.next_ts - Timeout.now(), 0)
+                )
+            except Empty:
+                uid = None
 
-                    # append request message to the corresponding service
-                    # This list is processed in dispatch method.
-
-                    # TODO: Logic to evaluate the CAN RUN Condition
-                    service.requests.append(msg_bytes)
-                    item.status = Status.PROCESSING
-                    res = self.queue_stash.update(item.syft_client_verify_key, item)
-                    if res.is_err():
-                        logger.error(
-                            "Failed to update queue item={} error={}",
-                            item,
-                            res.err(),
-                        )
-                elif item.status == Status.PROCESSING:
-                    # Evaluate Retry condition here
-                    # If job running and timeout or job status is KILL
-                    # or heartbeat fails
-                    # or container id doesn't exists, kill process or container
-                    # else decrease retry count and mark status as CREATED.
-                    pass
+            if self._stop.is_set():
+                break
+
+            queued = False
+            if uid is not None:
+                item = self.queue_stash.get_by_uid(
+                    self.queue_stash.partition.root_verify_key, uid
+                ).ok()
+                if item is not None:
+                    queued = self.queue_item(item)
+
+            if next_scan.has_expired():
+                queued = self.scan_items() or queued
+                next_scan.reset()
+
+            if queued:
+                self.wakeup_sender.send(b"")
+
+    def scan_items(self) -> bool:
+        """Queue every item still marked as created in the stash."""
+        items_to_queue = self.queue_stash.get_by_status(
+            self.queue_stash.partition.root_verify_key,
+            status=Status.CREATED,
+        ).ok()
+
+        items_to_queue = [] if items_to_queue is None else items_to_queue
+
+        queued = False
+        for item in items_to_queue:
+            queued = self.queue_item(item) or queued
+        return queued
+
+    def queue_item(self, item: QueueItem) -> bool:
+        if item.status != Status.CREATED:
+            # Evaluate Retry condition here for processing items
+            # If job running and timeout or job status is KILL
+            # or heartbeat fails
+            # or container id doesn't exists, kill process or container
+            # else decrease retry count and mark status as CREATED.
+            return False
+
+        if isinstance(item, ActionQueueItem):
+            action = item.kwargs["action"]
+            if self.contains_unresolved_action_objects(
+                action.args
+            ) or self.contains_unresolved_action_objects(action.kwargs):
+                return False
+            for arg in action.args:
+                self.preprocess_action_arg(arg)
+            for _, arg in action.kwargs.items():
+                self.preprocess_action_arg(arg)
+
+        msg_bytes = serialize(item, to_bytes=True)
+        worker_pool = item.worker_pool.resolve_with_context(self.auth_context)
+        worker_pool = worker_pool.ok()
+        service_name = worker_pool.name
+        service: Service | None = self.services.get(service_name)
+
+        # Skip adding message if corresponding service/pool
+        # is not registered.
+        if service is None:
+            return False
+
+        # append request message to the corresponding service
+        # This list is processed in dispatch method.
+
+        # TODO: Logic to evaluate the CAN RUN Condition
+        service.requests.append(msg_bytes)
+        item.status = Status.PROCESSING
+        res = self.queue_stash.update(item.syft_client_verify_key, item)
+        if res.is_err():
+            logger.error(
+                "Failed to update queue item={} error={}",
+                item,
+                res.err(),
+            )
+        return True
 
     def run(self) -> None:
         self.thread = threading.Thread(target=self._run)
@@ -479,14 +527,19 @@ class ZMQProducer(QueueProducer):
             for _, service in self.services.items():
                 self.dispatch(service, None)
 
-            items = None
+            items = {}
 
             try:
-                items = self.poll_workers.poll(ZMQ_POLLER_TIMEOUT_MSEC)
+                items = dict(self.poll_workers.poll(ZMQ_POLLER_TIMEOUT_MSEC))
             except Exception as e:
                 logger.exception("Failed to poll items: {}", e)
 
-            if items:
+            if self.wakeup_socket in items:
+                # new requests were queued, they are dispatched on the next iteration
+                while self.wakeup_socket.poll(0):
+                    self.wakeup_socket.recv()
+
+            if self.socket in items:
                 msg = self.socket.recv_multipart()
 
                 logger.debug("Recieve: {}", msg)
@@ -660,6 +713,11 @@ class ZMQConsumer(QueueConsumer):
             self.socket.close()
             self.context.destroy()
             self._stop.clear()
+            if self.syft_worker_id is not None:
+                # relative
+                from .queue import clear_worker_node_cache
+
+                clear_worker_node_cache(self.syft_worker_id)
 
     def send_to_producer(
         self,
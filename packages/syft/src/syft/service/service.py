@@ -131,6 +131,7 @@ class ServiceConfigRegistry:
         if not cls.path_exists(config.public_path):
             cls.__service_config_registry__[config.public_path] = config
             # cls.__public_to_private_path_map__[config.public_path] = config.private_path
+            UserServiceConfigRegistry.__role_registries__.clear()
 
     @classmethod
     def get_registered_configs(cls) -> dict[str, ServiceConfig]:
@@ -183,20 +184,28 @@ class UserLibConfigRegistry:
 
 
 class UserServiceConfigRegistry:
+    # the registry of each role, built on first use and dropped when a service
+    # config is registered. They are shared, so they must not be modified
+    __role_registries__: dict[ServiceRole, UserServiceConfigRegistry] = {}
+
     def __init__(self, service_config_registry: dict[str, ServiceConfig]):
         self.__service_config_registry__: dict[str, ServiceConfig] = (
             service_config_registry
         )
 
     @classmethod
-    def from_role(cls, user_service_role: ServiceRole) -> Self:
-        return cls(
-            {
-                k: service_config
-                for k, service_config in ServiceConfigRegistry.get_registered_configs().items()
-                if service_config.has_permission(user_service_role)
-            }
-        )
+    def from_role(cls, user_service_role: ServiceRole) -> UserServiceConfigRegistry:
+        registry = cls.__role_registries__.get(user_service_role)
+        if registry is None:
+            registry = cls(
+                {
+                    k: service_config
+                    for k, service_config in ServiceConfigRegistry.get_registered_configs().items()
+                    if service_config.has_permission(user_service_role)
+                }
+            )
+            cls.__role_registries__[user_service_role] = registry
+        return registry
 
     def __contains__(self, path: str) -> bool:
         return path in self.__service_config_registry__
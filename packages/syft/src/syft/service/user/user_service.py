@@ -1,4 +1,5 @@
 # stdlib
+import time
 
 # relative
 from ...abstract_node import NodeType
@@ -44,6 +45,12 @@ from .user_roles import ServiceRole
 from .user_roles import ServiceRoleCapability
 from .user_stash import UserStash
 
+# most recently used roles kept per verify key
+ROLE_CACHE_SIZE = 1024
+# seconds a cached role is trusted, which bounds how long other processes sharing
+# the store keep using a role after it was changed
+ROLE_CACHE_TTL = 10
+
 
 @instrument
 @serializable()
@@ -54,6 +61,8 @@ class UserService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = UserStash(store=store)
+        # verify key -> (role, expiry time), in least recently used order
+        self.role_cache: dict[SyftVerifyKey, tuple[ServiceRole, float]] = {}
 
     @service_method(path="user.create", name="create")
     def create(
@@ -138,6 +147,10 @@ class UserService(AbstractService):
     ) -> ServiceRole | None | SyftError:
         # they could be different
         if isinstance(credentials, SyftVerifyKey):
+            cached = self.role_cache.pop(credentials, None)
+            if cached is not None and cached[1] > time.time():
+                self.role_cache[credentials] = cached
+                return cached[0]
             result = self.stash.get_by_verify_key(
                 credentials=credentials, verify_key=credentials
             )
@@ -149,9 +162,19 @@ class UserService(AbstractService):
             # this seems weird that we get back None as Ok(None)
             user = result.ok()
             if user:
+                self._cache_role(user.verify_key, user.role)
                 return user.role
+        # unknown keys aren't cached, registering them mustn't wait for a TTL
         return ServiceRole.GUEST
 
+    def _cache_role(self, verify_key: SyftVerifyKey, role: ServiceRole) -> None:
+        self.role_cache[verify_key] = (role, time.time() + ROLE_CACHE_TTL)
+        while len(self.role_cache) > ROLE_CACHE_SIZE:
+            self.role_cache.pop(next(iter(self.role_cache)), None)
+
+    def _invalidate_role(self, verify_key: SyftVerifyKey) -> None:
+        self.role_cache.pop(verify_key, None)
+
     @service_method(path="user.search", name="search", autosplat=["user_search"])
     def search(
         self,
@@ -320,6 +343,7 @@ class UserService(AbstractService):
             return SyftError(message=error_msg)
 
         user = result.ok()
+        self._invalidate_role(user.verify_key)
         if user.role == ServiceRole.ADMIN:
             settings_stash = SettingsStash(store=self.store)
             settings = settings_stash.get_all(context.credentials)
@@ -371,6 +395,7 @@ class UserService(AbstractService):
         )
         if result.is_err():
             return SyftError(message=str(result.err()))
+        self._invalidate_role(user.verify_key)
 
         # TODO: Remove notifications for the deleted user
 
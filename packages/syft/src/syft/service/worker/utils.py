@@ -1,3 +1,6 @@
+# future
+from __future__ import annotations
+
 # stdlib
 import contextlib
 import os
@@ -6,11 +9,7 @@ import socket
 import socketserver
 import sys
 from typing import Any
-
-# third party
-import docker
-from docker.models.containers import Container
-from kr8s.objects import Pod
+from typing import TYPE_CHECKING
 
 # relative
 from ...abstract_node import AbstractNode
@@ -21,7 +20,6 @@ from ...custom_worker.config import DockerWorkerConfig
 from ...custom_worker.config import PrebuiltWorkerConfig
 from ...custom_worker.k8s import KubeUtils
 from ...custom_worker.k8s import PodStatus
-from ...custom_worker.runner_k8s import KubernetesRunner
 from ...node.credentials import SyftVerifyKey
 from ...types.uid import UID
 from ...util.util import get_queue_address
@@ -35,6 +33,15 @@ from .worker_pool import WorkerHealth
 from .worker_pool import WorkerOrchestrationType
 from .worker_pool import WorkerStatus
 
+if TYPE_CHECKING:
+    # third party
+    import docker
+    from docker.models.containers import Container
+    from kr8s.objects import Pod
+
+    # relative
+    from ...custom_worker.runner_k8s import KubernetesRunner
+
 DEFAULT_WORKER_IMAGE_TAG = "openmined/default-worker-image-cpu:0.0.1"
 DEFAULT_WORKER_POOL_NAME = "default-pool"
 K8S_NODE_CREDS_NAME = "node-creds"
@@ -49,6 +56,9 @@ def backend_container_name() -> str:
 def get_container(
     docker_client: docker.DockerClient, container_name: str
 ) -> Container | None:
+    # third party
+    import docker
+
     try:
         existing_container = docker_client.containers.get(container_name)
     except docker.errors.NotFound:
@@ -391,6 +401,9 @@ def run_workers_in_kubernetes(
     reg_url: str | None = None,
     **kwargs: Any,
 ) -> list[ContainerSpawnStatus] | SyftError:
+    # relative
+    from ...custom_worker.runner_k8s import KubernetesRunner
+
     spawn_status = []
     runner = KubernetesRunner()
 
@@ -497,6 +510,9 @@ def run_containers(
     print(f"Starting workers with start_idx={start_idx} count={number}")
 
     if orchestration == WorkerOrchestrationType.DOCKER:
+        # third party
+        import docker
+
         with contextlib.closing(docker.from_env()) as client:
             for worker_count in range(start_idx + 1, number + 1):
                 worker_name = f"{pool_name}-{worker_count}"
@@ -602,6 +618,9 @@ def _get_healthcheck_based_on_status(status: WorkerStatus) -> WorkerHealth:
 def image_build(
     image: SyftWorkerImage, **kwargs: dict[str, Any]
 ) -> ImageBuildResult | SyftError:
+    # third party
+    import docker
+
     if image.image_identifier is not None:
         full_tag = image.image_identifier.full_name_with_tag
         try:
@@ -636,6 +655,9 @@ def image_push(
     username: str | None = None,
     password: str | None = None,
 ) -> ImagePushResult | SyftError:
+    # third party
+    import docker
+
     if image.image_identifier is not None:
         full_tag = image.image_identifier.full_name_with_tag
         try:
@@ -2,7 +2,6 @@
 import contextlib
 
 # third party
-import docker
 import pydantic
 
 # relative
@@ -234,6 +233,9 @@ class SyftWorkerImageService(AbstractService):
                 message="Image Deletion is not yet implemented in Kubernetes !!"
             )
         elif image and image.image_identifier:
+            # third party
+            import docker
+
             try:
                 full_tag: str = image.image_identifier.full_name_with_tag
                 with contextlib.closing(docker.from_env()) as client:
@@ -1,12 +1,9 @@
 # stdlib
 from enum import Enum
 from typing import Any
+from typing import TYPE_CHECKING
 from typing import cast
 
-# third party
-import docker
-from docker.models.containers import Container
-
 # relative
 from ...client.api import APIRegistry
 from ...serde.serializable import serializable
@@ -24,6 +21,11 @@ from ...util.notebook_ui.styles import ITABLES_CSS
 from ..response import SyftError
 from .worker_image import SyftWorkerImage
 
+if TYPE_CHECKING:
+    # third party
+    import docker
+    from docker.models.containers import Container
+
 
 @serializable()
 class WorkerStatus(Enum):
@@ -270,11 +272,14 @@ class ContainerSpawnStatus(SyftBaseModel):
 
 
 def _get_worker_container(
-    client: docker.DockerClient,
+    client: "docker.DockerClient",
     worker: SyftWorker,
-) -> Container | SyftError:
+) -> "Container | SyftError":
+    # third party
+    import docker
+
     try:
-        return cast(Container, client.containers.get(worker.container_id))
+        return cast("Container", client.containers.get(worker.container_id))
     except docker.errors.NotFound as e:
         return SyftError(message=f"Worker {worker.id} container not found. Error {e}")
     except docker.errors.APIError as e:
@@ -298,10 +303,10 @@ _CONTAINER_STATUS_TO_WORKER_STATUS: dict[str, WorkerStatus] = dict(
 
 
 def _get_worker_container_status(
-    client: docker.DockerClient,
+    client: "docker.DockerClient",
     worker: SyftWorker,
-    container: Container | None = None,
-) -> Container | SyftError:
+    container: "Container | None" = None,
+) -> "Container | SyftError":
     if container is None:
         container = _get_worker_container(client, worker)
 
@@ -9,7 +9,6 @@ from result import OkErr
 from ...custom_worker.config import CustomWorkerConfig
 from ...custom_worker.config import WorkerConfig
 from ...custom_worker.k8s import IN_KUBERNETES
-from ...custom_worker.runner_k8s import KubernetesRunner
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
 from ...store.linked_obj import LinkedObject
@@ -481,6 +480,9 @@ class SyftWorkerPoolService(AbstractService):
                 return result
         else:
             # scale down at kubernetes control plane
+            # relative
+            from ...custom_worker.runner_k8s import KubernetesRunner
+
             runner = KubernetesRunner()
             result = scale_kubernetes_pool(
                 runner,
@@ -1,16 +1,12 @@
 # stdlib
 import contextlib
 from typing import Any
+from typing import TYPE_CHECKING
 from typing import cast
 
-# third party
-import docker
-from docker.models.containers import Container
-
 # relative
 from ...custom_worker.k8s import IN_KUBERNETES
 from ...custom_worker.k8s import PodStatus
-from ...custom_worker.runner_k8s import KubernetesRunner
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
@@ -35,6 +31,10 @@ from .worker_pool import _get_worker_container
 from .worker_pool import _get_worker_container_status
 from .worker_stash import WorkerStash
 
+if TYPE_CHECKING:
+    # third party
+    from docker.models.containers import Container
+
 
 @instrument
 @serializable()
@@ -129,9 +129,15 @@ class WorkerService(AbstractService):
         if context.node is not None and context.node.in_memory_workers:
             logs = b"Logs not implemented for In Memory Workers"
         elif IN_KUBERNETES:
+            # relative
+            from ...custom_worker.runner_k8s import KubernetesRunner
+
             runner = KubernetesRunner()
             return runner.get_pod_logs(pod_name=worker.name)
         else:
+            # third party
+            import docker
+
             with contextlib.closing(docker.from_env()) as client:
                 docker_container = _get_worker_container(client, worker)
                 if isinstance(docker_container, SyftError):
@@ -189,6 +195,9 @@ class WorkerService(AbstractService):
 
         if IN_KUBERNETES:
             # Kubernetes will only restart the worker NOT REMOVE IT
+            # relative
+            from ...custom_worker.runner_k8s import KubernetesRunner
+
             runner = KubernetesRunner()
             runner.delete_pod(pod_name=worker.name)
             return SyftSuccess(
@@ -200,6 +209,9 @@ class WorkerService(AbstractService):
             )
         elif not context.node.in_memory_workers:
             # delete the worker using docker client sdk
+            # third party
+            import docker
+
             with contextlib.closing(docker.from_env()) as client:
                 docker_container = _get_worker_container(client, worker)
                 if isinstance(docker_container, SyftError):
@@ -276,6 +288,9 @@ def refresh_worker_status(
 
 
 def refresh_status_kubernetes(workers: list[SyftWorker]) -> list[SyftWorker]:
+    # relative
+    from ...custom_worker.runner_k8s import KubernetesRunner
+
     updated_workers = []
     runner = KubernetesRunner()
     for worker in workers:
@@ -291,6 +306,9 @@ def refresh_status_kubernetes(workers: list[SyftWorker]) -> list[SyftWorker]:
 
 
 def refresh_status_docker(workers: list[SyftWorker]) -> list[SyftWorker]:
+    # third party
+    import docker
+
     updated_workers = []
 
     with contextlib.closing(docker.from_env()) as client:
@@ -307,7 +325,7 @@ def refresh_status_docker(workers: list[SyftWorker]) -> list[SyftWorker]:
 
 def _stop_worker_container(
     worker: SyftWorker,
-    container: Container,
+    container: "Container",
     force: bool,
 ) -> SyftError | None:
     try:
@@ -322,7 +340,10 @@ def _stop_worker_container(
         )
 
 
-def _remove_worker_container(container: Container, **kwargs: Any) -> None:
+def _remove_worker_container(container: "Container", **kwargs: Any) -> None:
+    # third party
+    import docker
+
     try:
         container.remove(**kwargs)
     except docker.errors.NotFound:
@@ -52,6 +52,7 @@ import requests
 from typing_extensions import Self
 
 # relative
+from ...client.http_pool import get_http_session
 from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
 from ...service.response import SyftError
@@ -126,7 +127,7 @@ def syft_iter_content(
     for attempt in range(max_retries):
         try:
             headers = {"Range": f"bytes={current_byte}-"}
-            with requests.get(
+            with get_http_session(blob_url, retries=False).get(
                 str(blob_url), stream=True, headers=headers, timeout=(timeout, timeout)
             ) as response:
                 response.raise_for_status()
@@ -207,7 +208,7 @@ class BlobRetrievalByURL(BlobRetrieval):
             if (is_blob_file := issubclass(self.type_, BlobFileType)) and stream:
                 return syft_iter_content(blob_url, chunk_size)
 
-            response = requests.get(str(blob_url), stream=stream)  # nosec
+            response = get_http_session(blob_url).get(str(blob_url), stream=stream)
             resp_content = response.content
             response.raise_for_status()
 
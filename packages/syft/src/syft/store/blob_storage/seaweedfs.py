@@ -5,12 +5,10 @@ import math
 from queue import Queue
 import threading
 from typing import Any
+from typing import TYPE_CHECKING
 
 # third party
-import boto3
-from botocore.client import BaseClient as S3BaseClient
-from botocore.client import ClientError as BotoClientError
-from botocore.client import Config
+from botocore.exceptions import ClientError as BotoClientError
 import requests
 from tqdm import tqdm
 from typing_extensions import Self
@@ -22,6 +20,7 @@ from . import BlobStorageClient
 from . import BlobStorageClientConfig
 from . import BlobStorageConfig
 from . import BlobStorageConnection
+from ...client.http_pool import get_http_session
 from ...serde.serializable import serializable
 from ...service.blob_storage.remote_profile import AzureRemoteProfile
 from ...service.response import SyftError
@@ -35,6 +34,10 @@ from ...types.grid_url import GridURL
 from ...types.syft_object import SYFT_OBJECT_VERSION_3
 from ...util.constants import DEFAULT_TIMEOUT
 
+if TYPE_CHECKING:
+    # third party
+    from botocore.client import BaseClient as S3BaseClient
+
 MAX_QUEUE_SIZE = 100
 WRITE_EXPIRATION_TIME = 900  # seconds
 DEFAULT_FILE_PART_SIZE = 1024**3  # 1GB
@@ -129,7 +132,8 @@ class SeaweedFSBlobDeposit(BlobDeposit):
 
                     gen = PartGenerator()
 
-                    response = requests.put(
+                    # the part generator can only be consumed once
+                    response = get_http_session(blob_url, retries=False).put(
                         url=str(blob_url),
                         data=gen.async_generator(chunk_size),
                         timeout=DEFAULT_TIMEOUT,
@@ -185,6 +189,10 @@ class SeaweedFSClient(BlobStorageClient):
     config: SeaweedFSClientConfig
 
     def connect(self) -> BlobStorageConnection:
+        # third party
+        import boto3
+        from botocore.client import Config
+
         return SeaweedFSConnection(
             client=boto3.client(
                 "s3",
@@ -201,13 +209,13 @@ class SeaweedFSClient(BlobStorageClient):
 
 @serializable()
 class SeaweedFSConnection(BlobStorageConnection):
-    client: S3BaseClient
+    client: "S3BaseClient"
     default_bucket_name: str
     config: SeaweedFSClientConfig
 
     def __init__(
         self,
-        client: S3BaseClient,
+        client: "S3BaseClient",
         default_bucket_name: str,
         config: SeaweedFSClientConfig,
     ):
@@ -98,6 +98,7 @@ class DictStoreConfig(StoreConfig):
             The config used for store locking. Available options:
                 * NoLockingConfig: no locking, ideal for single-thread stores.
                 * ThreadingLockingConfig: threading-based locking, ideal for same-process in-memory stores.
+                * FileLockingConfig: file-based locking, ideal for stores shared by several processes.
             Defaults to ThreadingLockingConfig.
     """
 
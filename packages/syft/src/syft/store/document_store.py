@@ -52,6 +52,14 @@ def first_or_none(result: Any) -> Ok:
     return Ok(None)
 
 
+def paginate(items: list, limit: int | None, offset: int | None) -> list:
+    """The `limit` items of `items` following the first `offset` ones"""
+    start = 0 if offset is None else offset
+    if limit is None:
+        return items[start:]
+    return items[start : start + limit]
+
+
 def is_generic_alias(t: type) -> bool:
     return isinstance(t, types.GenericAlias | typing._GenericAlias)
 
@@ -320,8 +328,14 @@ class StorePartition:
         if res.is_err():
             raise Exception(f"Something went wrong initializing the store: {res.err()}")
 
-        store_config.locking_config.lock_name = f"StorePartition-{settings.name}"
-        self.lock = SyftLock(store_config.locking_config)
+        # every partition has its own lock, the store config is shared between them
+        locking_config = store_config.locking_config.model_copy(
+            update={"lock_name": f"StorePartition-{settings.name}"}
+        )
+        self.lock = SyftLock(locking_config)
+        # bumped by every write, data derived from the partition can be cached
+        # for as long as it stays the same
+        self.generation = 0
 
     def init_store(self) -> Result[Ok, Err]:
         try:
@@ -332,6 +346,10 @@ class StorePartition:
 
         return Ok(True)
 
+    def close(self) -> None:
+        """Release the connections of the partition"""
+        pass
+
     def matches_unique_cks(self, partition_key: PartitionKey) -> bool:
         return partition_key in self.unique_cks
 
@@ -357,10 +375,29 @@ class StorePartition:
             result = cbk(*args, **kwargs)
         except BaseException as e:
             result = Err(str(e))
+        self.generation += 1
         self.lock.release()
 
         return result
 
+    def _thread_safe_read_cbk(
+        self, cbk: Callable, *args: Any, **kwargs: Any
+    ) -> Any | Err:
+        """Like `_thread_safe_cbk`, for callbacks that don't write to the store"""
+        locked = self.lock.acquire_read(blocking=True)
+        if not locked:
+            return Err(
+                f"Failed to acquire lock for the operation {self.lock.lock_name} ({self.lock._lock})"
+            )
+
+        try:
+            result = cbk(*args, **kwargs)
+        except BaseException as e:
+            result = Err(str(e))
+        self.lock.release_read()
+
+        return result
+
     def set(
         self,
         credentials: SyftVerifyKey,
@@ -383,7 +420,7 @@ class StorePartition:
         credentials: SyftVerifyKey,
         uid: UID,
     ) -> Result[SyftObject, str]:
-        return self._thread_safe_cbk(
+        return self._thread_safe_read_cbk(
             self._get,
             uid=uid,
             credentials=credentials,
@@ -395,13 +432,54 @@ class StorePartition:
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
-        return self._thread_safe_cbk(
+        return self._thread_safe_read_cbk(
             self._find_index_or_search_keys,
             credentials,
             index_qks=index_qks,
             search_qks=search_qks,
             order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def find_index_or_search_projection(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        keys: list[str],
+        order_by: PartitionKey | None = None,
+    ) -> Result[list[dict[str, Any]], str]:
+        return self._thread_safe_read_cbk(
+            self._find_index_or_search_projection,
+            credentials,
+            index_qks=index_qks,
+            search_qks=search_qks,
+            keys=keys,
+            order_by=order_by,
+        )
+
+    def count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[int, str]:
+        return self._thread_safe_read_cbk(
+            self._count, credentials, index_qks=index_qks, search_qks=search_qks
+        )
+
+    def exists(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[bool, str]:
+        return self._thread_safe_read_cbk(
+            self._exists, credentials, index_qks=index_qks, search_qks=search_qks
         )
 
     def remove_keys(
@@ -435,9 +513,17 @@ class StorePartition:
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
-        return self._thread_safe_cbk(
-            self._get_all_from_store, credentials, qks, order_by
+        return self._thread_safe_read_cbk(
+            self._get_all_from_store,
+            credentials,
+            qks,
+            order_by,
+            limit=limit,
+            offset=offset,
         )
 
     def delete(
@@ -452,8 +538,17 @@ class StorePartition:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[BaseStash.object_type], str]:
-        return self._thread_safe_cbk(self._all, credentials, order_by, has_permission)
+        return self._thread_safe_read_cbk(
+            self._all,
+            credentials,
+            order_by,
+            has_permission,
+            limit=limit,
+            offset=offset,
+        )
 
     def migrate_data(
         self,
@@ -495,9 +590,38 @@ class StorePartition:
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
         raise NotImplementedError
 
+    def _find_index_or_search_projection(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        keys: list[str],
+        order_by: PartitionKey | None = None,
+    ) -> Result[list[dict[str, Any]], str]:
+        raise NotImplementedError
+
+    def _count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[int, str]:
+        raise NotImplementedError
+
+    def _exists(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[bool, str]:
+        raise NotImplementedError
+
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
@@ -508,6 +632,8 @@ class StorePartition:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[BaseStash.object_type], str]:
         raise NotImplementedError
 
@@ -586,6 +712,12 @@ class DocumentStore:
             )
         return self.partitions[settings.name]
 
+    def close(self) -> None:
+        """Release the connections of every partition"""
+        for partition in self.partitions.values():
+            partition.close()
+        self.partitions.clear()
+
 
 @instrument
 class BaseStash:
@@ -609,8 +741,17 @@ class BaseStash:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool = False,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[BaseStash.object_type], str]:
-        return self.partition.all(credentials, order_by, has_permission)
+        """All objects readable by `credentials`, sorted by `order_by`.
+
+        `limit` and `offset` select a page, which the store loads without
+        loading the rest of the collection.
+        """
+        return self.partition.all(
+            credentials, order_by, has_permission, limit=limit, offset=offset
+        )
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
         self.partition.add_permissions(permissions)
@@ -646,13 +787,13 @@ class BaseStash:
             add_storage_permission=add_storage_permission,
         )
 
-    def query_all(
-        self,
-        credentials: SyftVerifyKey,
-        qks: QueryKey | QueryKeys,
-        order_by: PartitionKey | None = None,
-    ) -> Result[list[BaseStash.object_type], str]:
-        if isinstance(qks, QueryKey):
+    def split_query_keys(
+        self, qks: QueryKey | QueryKeys | None
+    ) -> Result[tuple[QueryKeys, QueryKeys], str]:
+        """Split `qks` into the unique (index) and the searchable query keys"""
+        if qks is None:
+            qks = QueryKeys(qks=[])
+        elif isinstance(qks, QueryKey):
             qks = QueryKeys(qks=qks)
 
         unique_keys = []
@@ -669,14 +810,88 @@ class BaseStash:
                     f"{qk} not in {type(self.partition)} unique or searchable keys"
                 )
 
-        index_qks = QueryKeys(qks=unique_keys)
-        search_qks = QueryKeys(qks=searchable_keys)
+        return Ok((QueryKeys(qks=unique_keys), QueryKeys(qks=searchable_keys)))
+
+    def query_all(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKey | QueryKeys,
+        order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Result[list[BaseStash.object_type], str]:
+        split_qks = self.split_query_keys(qks)
+        if split_qks.is_err():
+            return split_qks
+        index_qks, search_qks = split_qks.ok()
 
         return self.partition.find_index_or_search_keys(
             credentials=credentials,
             index_qks=index_qks,
             search_qks=search_qks,
             order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def query_projection(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKey | QueryKeys | None,
+        keys: list[str],
+        order_by: PartitionKey | None = None,
+    ) -> Result[list[dict[str, Any]], str]:
+        """Values of the unique or searchable `keys` of the matching objects.
+
+        The objects themselves are not loaded, which is much cheaper than
+        `query_all` when only some indexed fields are needed.
+        """
+        indexed_keys = {
+            pk.key
+            for pk in list(self.partition.unique_cks)
+            + list(self.partition.searchable_cks)
+        }
+        for key in keys:
+            if key not in indexed_keys:
+                return Err(
+                    f"{key} not in {type(self.partition)} unique or searchable keys"
+                )
+
+        split_qks = self.split_query_keys(qks)
+        if split_qks.is_err():
+            return split_qks
+        index_qks, search_qks = split_qks.ok()
+
+        return self.partition.find_index_or_search_projection(
+            credentials=credentials,
+            index_qks=index_qks,
+            search_qks=search_qks,
+            keys=keys,
+            order_by=order_by,
+        )
+
+    def count(
+        self, credentials: SyftVerifyKey, qks: QueryKey | QueryKeys | None = None
+    ) -> Result[int, str]:
+        """Number of objects matching `qks` (all objects if None) readable by `credentials`"""
+        split_qks = self.split_query_keys(qks)
+        if split_qks.is_err():
+            return split_qks
+        index_qks, search_qks = split_qks.ok()
+        return self.partition.count(
+            credentials=credentials, index_qks=index_qks, search_qks=search_qks
+        )
+
+    def exists(
+        self, credentials: SyftVerifyKey, qks: QueryKey | QueryKeys
+    ) -> Result[bool, str]:
+        """Whether an object matching `qks` is readable by `credentials`"""
+        split_qks = self.split_query_keys(qks)
+        if split_qks.is_err():
+            return split_qks
+        index_qks, search_qks = split_qks.ok()
+        return self.partition.exists(
+            credentials=credentials, index_qks=index_qks, search_qks=search_qks
         )
 
     def query_all_kwargs(
@@ -685,8 +900,16 @@ class BaseStash:
         **kwargs: dict[str, Any],
     ) -> Result[list[BaseStash.object_type], str]:
         order_by = kwargs.pop("order_by", None)
+        limit = kwargs.pop("limit", None)
+        offset = kwargs.pop("offset", None)
         qks = QueryKeys.from_dict(kwargs)
-        return self.query_all(credentials=credentials, qks=qks, order_by=order_by)
+        return self.query_all(
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
 
     def query_one(
         self,
@@ -799,6 +1022,7 @@ class StoreConfig(SyftBaseObject):
             The config used for store locking. Available options:
                 * NoLockingConfig: no locking, ideal for single-thread stores.
                 * ThreadingLockingConfig: threading-based locking, ideal for same-process in-memory stores.
+                * FileLockingConfig: file-based locking, ideal for stores shared by several processes.
             Defaults to NoLockingConfig.
     """
 
@@ -3,8 +3,13 @@ from __future__ import annotations
 
 # stdlib
 from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
 from enum import Enum
 from typing import Any
+from typing import cast
 
 # third party
 from result import Err
@@ -26,11 +31,15 @@ from ..service.context import AuthedServiceContext
 from ..service.response import SyftSuccess
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
+from .document_store import BasePartitionSettings
 from .document_store import BaseStash
 from .document_store import PartitionKey
+from .document_store import PartitionSettings
 from .document_store import QueryKey
 from .document_store import QueryKeys
+from .document_store import StoreConfig
 from .document_store import StorePartition
+from .document_store import paginate
 
 
 @serializable()
@@ -85,6 +94,272 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    def contains_many(self, keys: Iterable[Any]) -> set[Any]:
+        """The keys that are in the store"""
+        return {key for key in keys if key in self}
+
+    def transaction(self) -> AbstractContextManager:
+        """Context in which writes are committed together, if the store supports it"""
+        return nullcontext()
+
+    def values_page(self, limit: int | None, offset: int | None) -> list[Any]:
+        """A page of the values, in storage order"""
+        return [self[key] for key in paginate(list(self.keys()), limit, offset)]
+
+
+class KeyValueIndexStore:
+    """Key-Value index core logic.
+
+    Maps `(partition key, value)` pairs to the uids of the objects holding them.
+    Unique indexes hold a single uid per value, searchable indexes hold many.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        unique: bool = False,
+    ) -> None:
+        raise NotImplementedError
+
+    def init_keys(self, pk_keys: list[str]) -> None:
+        raise NotImplementedError
+
+    def has_key(self, pk_key: str) -> bool:
+        raise NotImplementedError
+
+    def contains(self, pk_key: str, value: Any) -> bool:
+        raise NotImplementedError
+
+    def get(self, pk_key: str, value: Any) -> set[UID]:
+        raise NotImplementedError
+
+    def search(self, pk_key: str, items: list[Any]) -> set[UID]:
+        raise NotImplementedError
+
+    def add(self, pk_key: str, value: Any, uid: UID) -> None:
+        raise NotImplementedError
+
+    def discard(self, pk_key: str, value: Any, uid: UID) -> None:
+        raise NotImplementedError
+
+    def is_empty(self) -> bool:
+        raise NotImplementedError
+
+
+@serializable(attrs=["unique", "store"])
+class DictIndexStore(KeyValueIndexStore):
+    """Index kept as one dict per partition key inside a `KeyValueBackingStore`.
+
+    Parameters:
+        `index_name`: str
+            Index name
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: StoreConfig
+            Backend specific configuration
+        `unique`: bool
+            Whether a value maps to a single uid or to a list of uids
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        unique: bool = False,
+    ) -> None:
+        self.unique = unique
+        self.store: KeyValueBackingStore = store_config.backing_store(
+            index_name, settings, store_config
+        )
+
+    def init_keys(self, pk_keys: list[str]) -> None:
+        for pk_key in pk_keys:
+            if pk_key not in self.store:
+                self.store[pk_key] = {} if self.unique else defaultdict(list)
+
+    def has_key(self, pk_key: str) -> bool:
+        return pk_key in self.store
+
+    def contains(self, pk_key: str, value: Any) -> bool:
+        return value in self.store[pk_key]
+
+    def get(self, pk_key: str, value: Any) -> set[UID]:
+        ck_col = self.store[pk_key]
+        if value not in ck_col:
+            return set()
+        if self.unique:
+            return {ck_col[value]}
+        return set(ck_col[value])
+
+    def search(self, pk_key: str, items: list[Any]) -> set[UID]:
+        ck_col = self.store[pk_key]
+        matches: set[UID] = set()
+        for item in items:
+            for col_key in ck_col.keys():
+                if str(item) in col_key:
+                    if self.unique:
+                        matches.add(ck_col[col_key])
+                    else:
+                        matches.update(ck_col[col_key])
+        return matches
+
+    def add(self, pk_key: str, value: Any, uid: UID) -> None:
+        ck_col = self.store[pk_key]
+        if self.unique:
+            ck_col[value] = uid
+        elif value in ck_col:
+            if uid not in ck_col[value]:
+                ck_col[value].append(uid)
+        else:
+            ck_col[value] = [uid]
+        self.store[pk_key] = ck_col
+
+    def discard(self, pk_key: str, value: Any, uid: UID) -> None:
+        ck_col = self.store[pk_key]
+        if value not in ck_col:
+            return
+        if self.unique:
+            if ck_col[value] == uid:
+                del ck_col[value]
+        else:
+            if uid in ck_col[value]:
+                ck_col[value].remove(uid)
+            if len(ck_col[value]) == 0:
+                del ck_col[value]
+        self.store[pk_key] = ck_col
+
+    def is_empty(self) -> bool:
+        return all(len(self.store[pk_key]) == 0 for pk_key in self.store.keys())
+
+    def __repr__(self) -> str:
+        return repr(self.store)
+
+
+class KeyValuePermissionStore:
+    """Key-Value permission core logic.
+
+    Maps an object uid to the permission strings (or node uids, for storage
+    permissions) granted on it.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: BasePartitionSettings,
+        store_config: StoreConfig,
+        value_type: type = str,
+    ) -> None:
+        raise NotImplementedError
+
+    def add(self, uid: UID, value: Any) -> None:
+        raise NotImplementedError
+
+    def add_many(self, items: list[tuple[UID, Any]]) -> None:
+        raise NotImplementedError
+
+    def remove(self, uid: UID, value: Any) -> None:
+        raise NotImplementedError
+
+    def has_any(self, uid: UID, values: list[Any]) -> bool:
+        raise NotImplementedError
+
+    def pop(self, uid: UID) -> Any:
+        """Remove and return the permissions of the uid, empty if it has none"""
+        raise NotImplementedError
+
+    def __getitem__(self, uid: UID) -> Any:
+        raise NotImplementedError
+
+    def __delitem__(self, uid: Any) -> None:
+        raise NotImplementedError
+
+    def __contains__(self, uid: UID) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+@serializable(attrs=["value_type", "store"])
+class DictPermissionStore(KeyValuePermissionStore):
+    """Permissions kept as one set per uid inside a `KeyValueBackingStore`.
+
+    Parameters:
+        `index_name`: str
+            Index name
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: StoreConfig
+            Backend specific configuration
+        `value_type`: type
+            Type of the stored permission values
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: BasePartitionSettings,
+        store_config: StoreConfig,
+        value_type: type = str,
+    ) -> None:
+        self.value_type = value_type
+        self.store: KeyValueBackingStore = store_config.backing_store(
+            index_name, settings, store_config, ddtype=set
+        )
+
+    def add(self, uid: UID, value: Any) -> None:
+        permissions = self.store[uid]
+        permissions.add(value)
+        self.store[uid] = permissions
+
+    def add_many(self, items: list[tuple[UID, Any]]) -> None:
+        grouped: dict[UID, set] = defaultdict(set)
+        for uid, value in items:
+            grouped[uid].add(value)
+        for uid, values in grouped.items():
+            permissions = self.store[uid]
+            permissions.update(values)
+            self.store[uid] = permissions
+
+    def remove(self, uid: UID, value: Any) -> None:
+        permissions = self.store[uid]
+        permissions.discard(value)
+        self.store[uid] = permissions
+
+    def has_any(self, uid: UID, values: list[Any]) -> bool:
+        if uid not in self.store:
+            return False
+        permissions = self.store[uid]
+        return any(value in permissions for value in values)
+
+    def pop(self, uid: UID) -> set:
+        return cast(set, self.store.pop(uid, set()))
+
+    def __getitem__(self, uid: UID) -> set:
+        return cast(set, self.store[uid])
+
+    def __delitem__(self, uid: UID) -> None:
+        del self.store[uid]
+
+    def __contains__(self, uid: UID) -> bool:
+        return uid in self.store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __repr__(self) -> str:
+        return repr(self.store)
+
+
+def index_value(qk: QueryKey) -> Any:
+    # coerce a list of objects to strings for a single searchable key
+    if qk.type_list:
+        return " ".join([str(obj) for obj in qk.value])
+    return qk.value
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -96,6 +371,9 @@ class KeyValueStorePartition(StorePartition):
             Backend specific configuration
     """
 
+    index_store: type[KeyValueIndexStore] = DictIndexStore
+    permission_store: type[KeyValuePermissionStore] = DictPermissionStore
+
     def init_store(self) -> Result[Ok, Err]:
         store_status = super().init_store()
         if store_status.is_err():
@@ -105,41 +383,44 @@ class KeyValueStorePartition(StorePartition):
             self.data = self.store_config.backing_store(
                 "data", self.settings, self.store_config
             )
-            self.unique_keys = self.store_config.backing_store(
-                "unique_keys", self.settings, self.store_config
+            self.unique_keys = self.index_store(
+                "unique_keys", self.settings, self.store_config, unique=True
             )
-            self.searchable_keys = self.store_config.backing_store(
+            self.searchable_keys = self.index_store(
                 "searchable_keys", self.settings, self.store_config
             )
             # uid -> set['<uid>_permission']
-            self.permissions: dict[UID, set[str]] = self.store_config.backing_store(
-                "permissions", self.settings, self.store_config, ddtype=set
+            self.permissions = self.permission_store(
+                "permissions", self.settings, self.store_config
             )
 
             # uid -> set['<node_uid>']
-            self.storage_permissions: dict[UID, set[UID]] = (
-                self.store_config.backing_store(
-                    "storage_permissions",
-                    self.settings,
-                    self.store_config,
-                    ddtype=set,
-                )
+            self.storage_permissions = self.permission_store(
+                "storage_permissions",
+                self.settings,
+                self.store_config,
+                value_type=UID,
             )
 
-            for partition_key in self.unique_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.unique_keys:
-                    self.unique_keys[pk_key] = {}
+            self.unique_keys.init_keys([pk.key for pk in self.unique_cks])
+            self.searchable_keys.init_keys([pk.key for pk in self.searchable_cks])
 
-            for partition_key in self.searchable_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.searchable_keys:
-                    self.searchable_keys[pk_key] = defaultdict(list)
+            # backfill indexes for data written before the index store existed
+            if self.unique_keys.is_empty() and len(self.data) > 0:
+                self._reindex()
         except BaseException as e:
             return Err(str(e))
 
         return Ok(True)
 
+    def _reindex(self) -> None:
+        for obj in self.data.values():
+            self._set_keys(
+                store_query_key=self.settings.store_key.with_obj(obj),
+                unique_query_keys=self.settings.unique_keys.with_obj(obj),
+                searchable_query_keys=self.settings.searchable_keys.with_obj(obj),
+            )
+
     def __len__(self) -> int:
         return len(self.data)
 
@@ -175,64 +456,63 @@ class KeyValueStorePartition(StorePartition):
         ignore_duplicates: bool = False,
     ) -> Result[SyftObject, str]:
         try:
-            # if obj.id is None:
-            # obj.id = UID()
-            store_query_key: QueryKey = self.settings.store_key.with_obj(obj)
-            uid = store_query_key.value
-            write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
-            can_write = self.has_permission(write_permission)
-            unique_query_keys: QueryKeys = self.settings.unique_keys.with_obj(obj)
-            store_key_exists = store_query_key.value in self.data
-            searchable_query_keys = self.settings.searchable_keys.with_obj(obj)
-
-            ck_check = self._check_partition_keys_unique(
-                unique_query_keys=unique_query_keys
-            )
-
-            if not store_key_exists and ck_check == UniqueKeyCheck.EMPTY:
-                # attempt to claim it for writing
-                ownership_result = self.take_ownership(uid=uid, credentials=credentials)
-                can_write = ownership_result.is_ok()
-            elif not ignore_duplicates:
-                keys = ", ".join(f"`{key.key}`" for key in unique_query_keys.all)
-                return Err(
-                    f"Duplication Key Error for {obj}.\n"
-                    f"The fields that should be unique are {keys}."
-                )
-            else:
-                # we are not throwing an error, because we are ignoring duplicates
-                # we are also not writing though
-                return Ok(obj)
-
-            if can_write:
-                self._set_data_and_keys(
-                    store_query_key=store_query_key,
-                    unique_query_keys=unique_query_keys,
-                    searchable_query_keys=searchable_query_keys,
-                    obj=obj,
+            with self.data.transaction():
+                # if obj.id is None:
+                # obj.id = UID()
+                store_query_key: QueryKey = self.settings.store_key.with_obj(obj)
+                uid = store_query_key.value
+                write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
+                can_write = self.has_permission(write_permission)
+                unique_query_keys: QueryKeys = self.settings.unique_keys.with_obj(obj)
+                store_key_exists = store_query_key.value in self.data
+                searchable_query_keys = self.settings.searchable_keys.with_obj(obj)
+
+                ck_check = self._check_partition_keys_unique(
+                    unique_query_keys=unique_query_keys
                 )
-                self.data[uid] = obj
-
-                # Add default permissions
-                if uid not in self.permissions:
-                    self.permissions[uid] = set()
-                self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
-                if add_permissions is not None:
-                    self.add_permissions(add_permissions)
-
-                if uid not in self.storage_permissions:
-                    self.storage_permissions[uid] = set()
-                if add_storage_permission:
-                    self.add_storage_permission(
-                        StoragePermission(
-                            uid=uid,
-                            node_uid=self.node_uid,
-                        )
+
+                if not store_key_exists and ck_check == UniqueKeyCheck.EMPTY:
+                    # attempt to claim it for writing
+                    ownership_result = self.take_ownership(
+                        uid=uid, credentials=credentials
+                    )
+                    can_write = ownership_result.is_ok()
+                elif not ignore_duplicates:
+                    keys = ", ".join(f"`{key.key}`" for key in unique_query_keys.all)
+                    return Err(
+                        f"Duplication Key Error for {obj}.\n"
+                        f"The fields that should be unique are {keys}."
+                    )
+                else:
+                    # we are not throwing an error, because we are ignoring duplicates
+                    # we are also not writing though
+                    return Ok(obj)
+
+                if can_write:
+                    self._set_data_and_keys(
+                        store_query_key=store_query_key,
+                        unique_query_keys=unique_query_keys,
+                        searchable_query_keys=searchable_query_keys,
+                        obj=obj,
                     )
 
-                return Ok(obj)
-            else:
-                return Err(f"Permission: {write_permission} denied")
+                    # Add default permissions
+                    self.add_permissions(
+                        [ActionObjectREAD(uid=uid, credentials=credentials)]
+                        + (add_permissions or [])
+                    )
+
+                    if add_storage_permission:
+                        self.add_storage_permission(
+                            StoragePermission(
+                                uid=uid,
+                                node_uid=self.node_uid,
+                            )
+                        )
+
+                    return Ok(obj)
+                else:
+                    return Err(f"Permission: {write_permission} denied")
         except Exception as e:
             return Err(f"Failed to write obj {obj}. {e}")
 
@@ -253,18 +533,21 @@ class KeyValueStorePartition(StorePartition):
         return Err(f"UID: {uid} already owned.")
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.add(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.add(permission.uid, permission.permission_string)
+        self.generation += 1
 
     def remove_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.remove(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.remove(permission.uid, permission.permission_string)
+        self.generation += 1
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
-        for permission in permissions:
-            self.add_permission(permission)
+        self.permissions.add_many(
+            [
+                (permission.uid, permission.permission_string)
+                for permission in permissions
+            ]
+        )
+        self.generation += 1
 
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         if not isinstance(permission.permission, ActionPermission):
@@ -277,30 +560,18 @@ class KeyValueStorePartition(StorePartition):
         ):
             return True
 
-        if (
-            permission.uid in self.permissions
-            and permission.permission_string in self.permissions[permission.uid]
-        ):
-            return True
+        permission_strings = [permission.permission_string]
 
         # 🟡 TODO 14: add ALL_READ, ALL_EXECUTE etc
         # third party
-        if permission.permission == ActionPermission.OWNER:
-            pass
-        elif (
-            permission.permission == ActionPermission.READ
-            and ActionObjectPermission(
-                permission.uid, ActionPermission.ALL_READ
-            ).permission_string
-            in self.permissions[permission.uid]
-        ):
-            return True
-        elif permission.permission == ActionPermission.WRITE:
-            pass
-        elif permission.permission == ActionPermission.EXECUTE:
-            pass
+        if permission.permission == ActionPermission.READ:
+            permission_strings.append(
+                ActionObjectPermission(
+                    permission.uid, ActionPermission.ALL_READ
+                ).permission_string
+            )
 
-        return False
+        return self.permissions.has_any(permission.uid, permission_strings)
 
     def _get_permissions_for_uid(self, uid: UID) -> Result[set[str], Err]:
         if uid in self.permissions:
@@ -308,42 +579,56 @@ class KeyValueStorePartition(StorePartition):
         return Err(f"No permissions found for uid: {uid}")
 
     def add_storage_permission(self, permission: StoragePermission) -> None:
-        permissions = self.storage_permissions[permission.uid]
-        permissions.add(permission.node_uid)
-        self.storage_permissions[permission.uid] = permissions
+        self.storage_permissions.add(permission.uid, permission.node_uid)
 
     def add_storage_permissions(self, permissions: list[StoragePermission]) -> None:
-        for permission in permissions:
-            self.add_storage_permission(permission)
+        self.storage_permissions.add_many(
+            [(permission.uid, permission.node_uid) for permission in permissions]
+        )
 
     def remove_storage_permission(self, permission: StoragePermission) -> None:
-        permissions = self.storage_permissions[permission.uid]
-        permissions.remove(permission.node_uid)
-        self.storage_permissions[permission.uid] = permissions
+        self.storage_permissions.remove(permission.uid, permission.node_uid)
 
     def has_storage_permission(self, permission: StoragePermission | UID) -> bool:
         if isinstance(permission, UID):
             permission = StoragePermission(uid=permission, node_uid=self.node_uid)
 
-        if permission.uid in self.storage_permissions:
-            return permission.node_uid in self.storage_permissions[permission.uid]
-        return False
+        return self.storage_permissions.has_any(permission.uid, [permission.node_uid])
 
     def _all(
         self,
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[BaseStash.object_type], str]:
-        # this checks permissions
-        res = [self._get(uid, credentials, has_permission) for uid in self.data.keys()]
-        result = [x.ok() for x in res if x.is_ok()]
         if order_by is not None:
+            # the sort key is only known once the objects are loaded
+            # this checks permissions
+            res = [
+                self._get(uid, credentials, has_permission) for uid in self.data.keys()
+            ]
+            result = [x.ok() for x in res if x.is_ok()]
             result = sorted(result, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(result)
+            return Ok(paginate(result, limit, offset))
+
+        # TODO: fix for other admins
+        if has_permission or (
+            credentials and self.root_verify_key.verify == credentials.verify
+        ):
+            # nothing is filtered out, so the store can select the page itself
+            return Ok(self.data.values_page(limit, offset))
+
+        uids = [
+            uid
+            for uid in self.data.keys()
+            if self.has_permission(ActionObjectREAD(uid=uid, credentials=credentials))
+        ]
+        return Ok([self.data[uid] for uid in paginate(uids, limit, offset)])
 
     def _get_storage_permissions_for_uid(self, uid: UID) -> Result[set[UID], Err]:
-        if uid in self.storage_permissions:
+        if uid in self.storage_permissions or uid in self.data:
             return Ok(self.storage_permissions[uid])
         return Err(f"No storage permissions found for uid: {uid}")
 
@@ -353,28 +638,15 @@ class KeyValueStorePartition(StorePartition):
         unique_query_keys: QueryKeys,
         searchable_query_keys: QueryKeys,
     ) -> None:
-        uqks = unique_query_keys.all
-        for qk in uqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.unique_keys[pk_key]
-            ck_col.pop(store_key.value, None)
-            self.unique_keys[pk_key] = ck_col
+        for qk in unique_query_keys.all:
+            self.unique_keys.discard(qk.key, index_value(qk), store_key.value)
 
-        sqks = searchable_query_keys.all
-        for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.searchable_keys[pk_key]
-            if pk_value in ck_col and (store_key.value in ck_col[pk_value]):
-                ck_col[pk_value].remove(store_key.value)
-            self.searchable_keys[pk_key] = ck_col
+        for qk in searchable_query_keys.all:
+            self.searchable_keys.discard(qk.key, index_value(qk), store_key.value)
 
-    def _find_index_or_search_keys(
-        self,
-        credentials: SyftVerifyKey,
-        index_qks: QueryKeys,
-        search_qks: QueryKeys,
-        order_by: PartitionKey | None = None,
-    ) -> Result[list[SyftObject], str]:
+    def _find_index_or_search_ids(
+        self, index_qks: QueryKeys, search_qks: QueryKeys
+    ) -> Result[set[UID] | None, str]:
         ids: set | None = None
         errors = []
         # third party
@@ -401,14 +673,94 @@ class KeyValueStorePartition(StorePartition):
         if len(errors) > 0:
             return Err(" ".join(errors))
 
-        if ids is None:
+        return Ok(ids)
+
+    def _iter_readable_ids(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[Iterator[UID], str]:
+        """The ids matching the query keys, or all ids without query keys"""
+        ids = self._find_index_or_search_ids(index_qks=index_qks, search_qks=search_qks)
+        if ids.is_err():
+            return ids
+        matching_ids = ids.ok()
+        if matching_ids is None:
+            matching_ids = self.data.keys()
+        else:
+            matching_ids = self.data.contains_many(matching_ids)
+
+        return Ok(
+            uid
+            for uid in matching_ids
+            if self.has_permission(ActionObjectREAD(uid=uid, credentials=credentials))
+        )
+
+    def _find_index_or_search_keys(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Result[list[SyftObject], str]:
+        ids = self._find_index_or_search_ids(index_qks=index_qks, search_qks=search_qks)
+        if ids.is_err():
+            return ids
+
+        if ids.ok() is None:
             return Ok([])
 
-        qks: QueryKeys = self.store_query_keys(ids)
+        qks: QueryKeys = self.store_query_keys(ids.ok())
         return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
 
+    def _find_index_or_search_projection(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        keys: list[str],
+        order_by: PartitionKey | None = None,
+    ) -> Result[list[dict[str, Any]], str]:
+        ids = self._iter_readable_ids(credentials, index_qks, search_qks)
+        if ids.is_err():
+            return ids
+
+        objs = [self.data[uid] for uid in ids.ok()]
+        if order_by is not None:
+            objs = sorted(objs, key=lambda x: getattr(x, order_by.key, ""))
+        return Ok([{key: getattr(obj, key, None) for key in keys} for obj in objs])
+
+    def _count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[int, str]:
+        ids = self._iter_readable_ids(credentials, index_qks, search_qks)
+        if ids.is_err():
+            return ids
+        return Ok(sum(1 for _ in ids.ok()))
+
+    def _exists(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[bool, str]:
+        ids = self._iter_readable_ids(credentials, index_qks, search_qks)
+        if ids.is_err():
+            return ids
+        return Ok(next(ids.ok(), None) is not None)
+
     def _update(
         self,
         credentials: SyftVerifyKey,
@@ -418,56 +770,59 @@ class KeyValueStorePartition(StorePartition):
         overwrite: bool = False,
     ) -> Result[SyftObject, str]:
         try:
-            if qk.value not in self.data:
-                return Err(f"No object exists for query key: {qk}")
-
-            if has_permission or self.has_permission(
-                ActionObjectWRITE(uid=qk.value, credentials=credentials)
-            ):
-                _original_obj = self.data[qk.value]
-                _original_unique_keys = self.settings.unique_keys.with_obj(
-                    _original_obj
-                )
-                _original_searchable_keys = self.settings.searchable_keys.with_obj(
-                    _original_obj
-                )
+            with self.data.transaction():
+                if qk.value not in self.data:
+                    return Err(f"No object exists for query key: {qk}")
 
-                store_query_key = self.settings.store_key.with_obj(_original_obj)
+                if has_permission or self.has_permission(
+                    ActionObjectWRITE(uid=qk.value, credentials=credentials)
+                ):
+                    _original_obj = self.data[qk.value]
+                    _original_unique_keys = self.settings.unique_keys.with_obj(
+                        _original_obj
+                    )
+                    _original_searchable_keys = self.settings.searchable_keys.with_obj(
+                        _original_obj
+                    )
 
-                # remove old keys
-                self._remove_keys(
-                    store_key=store_query_key,
-                    unique_query_keys=_original_unique_keys,
-                    searchable_query_keys=_original_searchable_keys,
-                )
+                    store_query_key = self.settings.store_key.with_obj(_original_obj)
 
-                # update the object with new data
-                if overwrite:
-                    # Overwrite existing object and their values
-                    _original_obj = obj
-                else:
-                    for key, value in obj.to_dict(exclude_empty=True).items():
-                        if key == "id":
-                            # protected field
-                            continue
-                        setattr(_original_obj, key, value)
-
-                # update data and keys
-                self._set_data_and_keys(
-                    store_query_key=store_query_key,
-                    unique_query_keys=self.settings.unique_keys.with_obj(_original_obj),
-                    searchable_query_keys=self.settings.searchable_keys.with_obj(
-                        _original_obj
-                    ),
-                    # has been updated
-                    obj=_original_obj,
-                )
+                    # remove old keys
+                    self._remove_keys(
+                        store_key=store_query_key,
+                        unique_query_keys=_original_unique_keys,
+                        searchable_query_keys=_original_searchable_keys,
+                    )
 
-                # 🟡 TODO 28: Add locking in this transaction
+                    # update the object with new data
+                    if overwrite:
+                        # Overwrite existing object and their values
+                        _original_obj = obj
+                    else:
+                        for key, value in obj.to_dict(exclude_empty=True).items():
+                            if key == "id":
+                                # protected field
+                                continue
+                            setattr(_original_obj, key, value)
+
+                    # update data and keys
+                    self._set_data_and_keys(
+                        store_query_key=store_query_key,
+                        unique_query_keys=self.settings.unique_keys.with_obj(
+                            _original_obj
+                        ),
+                        searchable_query_keys=self.settings.searchable_keys.with_obj(
+                            _original_obj
+                        ),
+                        # has been updated
+                        obj=_original_obj,
+                    )
 
-                return Ok(_original_obj)
-            else:
-                return Err(f"Failed to update obj {obj}, you have no permission")
+                    # 🟡 TODO 28: Add locking in this transaction
+
+                    return Ok(_original_obj)
+                else:
+                    return Err(f"Failed to update obj {obj}, you have no permission")
 
         except Exception as e:
             return Err(f"Failed to update obj {obj} with error: {e}")
@@ -477,17 +832,26 @@ class KeyValueStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
-        matches = []
-        for qk in qks.all:
-            if qk.value in self.data:
-                if self.has_permission(
-                    ActionObjectREAD(uid=qk.value, credentials=credentials)
-                ):
-                    matches.append(self.data[qk.value])
+        stored_uids = self.data.contains_many(qk.value for qk in qks.all)
+        uids = [
+            qk.value
+            for qk in qks.all
+            if qk.value in stored_uids
+            and self.has_permission(
+                ActionObjectREAD(uid=qk.value, credentials=credentials)
+            )
+        ]
         if order_by is not None:
+            matches = [self.data[uid] for uid in uids]
             matches = sorted(matches, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(matches)
+            return Ok(paginate(matches, limit, offset))
+
+        # pages keep the order of the query keys, and only the page is loaded
+        return Ok([self.data[uid] for uid in paginate(uids, limit, offset)])
 
     def create(self, obj: SyftObject) -> Result[SyftObject, str]:
         pass
@@ -496,36 +860,40 @@ class KeyValueStorePartition(StorePartition):
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
         try:
-            if has_permission or self.has_permission(
-                ActionObjectWRITE(uid=qk.value, credentials=credentials)
-            ):
-                _obj = self.data.pop(qk.value)
-                self.permissions.pop(qk.value)
-                self.storage_permissions.pop(qk.value)
-                self._delete_unique_keys_for(_obj)
-                self._delete_search_keys_for(_obj)
-                return Ok(SyftSuccess(message="Deleted"))
-            else:
-                return Err(
-                    f"Failed to delete with query key {qk}, you have no permission"
-                )
+            with self.data.transaction():
+                if has_permission or self.has_permission(
+                    ActionObjectWRITE(uid=qk.value, credentials=credentials)
+                ):
+                    # the data goes last, so a failure doesn't leave permissions
+                    # and index entries without an object
+                    _obj = self.data[qk.value]
+                    self.permissions.pop(qk.value)
+                    self.storage_permissions.pop(qk.value)
+                    self._delete_unique_keys_for(_obj, uid=qk.value)
+                    self._delete_search_keys_for(_obj, uid=qk.value)
+                    del self.data[qk.value]
+                    return Ok(SyftSuccess(message="Deleted"))
+                else:
+                    return Err(
+                        f"Failed to delete with query key {qk}, you have no permission"
+                    )
         except Exception as e:
             return Err(f"Failed to delete with query key {qk} with error: {e}")
 
-    def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+    def _delete_unique_keys_for(
+        self, obj: SyftObject, uid: UID
+    ) -> Result[SyftSuccess, str]:
         for _unique_ck in self.unique_cks:
             qk = _unique_ck.with_obj(obj)
-            unique_keys = self.unique_keys[qk.key]
-            unique_keys.pop(qk.value, None)
-            self.unique_keys[qk.key] = unique_keys
+            self.unique_keys.discard(qk.key, index_value(qk), uid)
         return Ok(SyftSuccess(message="Deleted"))
 
-    def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+    def _delete_search_keys_for(
+        self, obj: SyftObject, uid: UID
+    ) -> Result[SyftSuccess, str]:
         for _search_ck in self.searchable_cks:
             qk = _search_ck.with_obj(obj)
-            search_keys = self.searchable_keys[qk.key]
-            search_keys.pop(qk.value, None)
-            self.searchable_keys[qk.key] = search_keys
+            self.searchable_keys.discard(qk.key, index_value(qk), uid)
         return Ok(SyftSuccess(message="Deleted"))
 
     def _get_keys_index(self, qks: QueryKeys) -> Result[set[Any], str]:
@@ -533,16 +901,14 @@ class KeyValueStorePartition(StorePartition):
             # match AND
             subsets: list = []
             for qk in qks.all:
-                subset: set = set()
                 pk_key, pk_value = qk.key, qk.value
-                if pk_key not in self.unique_keys:
+                if not self.unique_keys.has_key(pk_key):
                     return Err(f"Failed to query index with {qk}")
-                ck_col = self.unique_keys[pk_key]
-                if pk_value not in ck_col.keys():
+                subset = self.unique_keys.get(pk_key, pk_value)
+                if len(subset) == 0:
                     # must be at least one in all query keys
                     continue
-                store_value = ck_col[pk_value]
-                subsets.append({store_value})
+                subsets.append(subset)
 
             if len(subsets) == 0:
                 return Ok(set())
@@ -560,34 +926,22 @@ class KeyValueStorePartition(StorePartition):
             # match AND
             subsets = []
             for qk in qks.all:
-                subset: set = set()
                 pk_key, pk_value = qk.key, qk.value
-                if pk_key not in self.searchable_keys:
+                if not self.searchable_keys.has_key(pk_key):
                     return Err(f"Failed to search with {qk}")
-                ck_col = self.searchable_keys[pk_key]
                 if qk.type_list:
                     # 🟡 TODO: change this hacky way to do on to many relationships
                     # this is when you search a QueryKey which is a list of items
                     # at the moment its mostly just a List[UID]
                     # match OR against all keys for this col
                     # the values of the list will be turned into strings in a single key
-                    matches = set()
-                    for item in pk_value:
-                        for col_key in ck_col.keys():
-                            if str(item) in col_key:
-                                store_values = ck_col[col_key]
-                                for value in store_values:
-                                    matches.add(value)
+                    matches = self.searchable_keys.search(pk_key, pk_value)
                     if len(matches):
                         subsets.append(matches)
                 else:
                     # this is the normal path
-                    if pk_value not in ck_col.keys():
-                        # must be at least one in all query keys
-                        subsets.append(set())
-                        continue
-                    store_values = ck_col[pk_value]
-                    subsets.append(set(store_values))
+                    # must be at least one in all query keys
+                    subsets.append(self.searchable_keys.get(pk_key, pk_value))
 
             if len(subsets) == 0:
                 return Ok(set())
@@ -611,12 +965,11 @@ class KeyValueStorePartition(StorePartition):
         matches = []
         for qk in qks:
             pk_key, pk_value = qk.key, qk.value
-            if pk_key not in self.unique_keys:
+            if not self.unique_keys.has_key(pk_key):
                 raise Exception(
-                    f"pk_key: {pk_key} not in unique_keys: {self.unique_keys.keys()}"
+                    f"pk_key: {pk_key} not in unique_keys: {self.unique_keys}"
                 )
-            ck_col = self.unique_keys[pk_key]
-            if pk_value in ck_col:
+            if self.unique_keys.contains(pk_key, pk_value):
                 matches.append(pk_key)
 
         if len(matches) == 0:
@@ -633,36 +986,27 @@ class KeyValueStorePartition(StorePartition):
         searchable_query_keys: QueryKeys,
         obj: SyftObject,
     ) -> None:
-        uqks = unique_query_keys.all
-
-        for qk in uqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.unique_keys[pk_key]
-            ck_col[pk_value] = store_query_key.value
-            self.unique_keys[pk_key] = ck_col
-
-        self.unique_keys[store_query_key.key][store_query_key.value] = (
-            store_query_key.value
+        self._set_keys(
+            store_query_key=store_query_key,
+            unique_query_keys=unique_query_keys,
+            searchable_query_keys=searchable_query_keys,
         )
+        self.data[store_query_key.value] = obj
 
-        sqks = searchable_query_keys.all
-        for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.searchable_keys[pk_key]
-            if qk.type_list:
-                # coerce the list of objects to strings for a single key
-                pk_value = " ".join([str(obj) for obj in pk_value])
-
-            # check if key is present, then add to existing key
-            if pk_value in ck_col:
-                ck_col[pk_value].append(store_query_key.value)
-            else:
-                # else create the key with a list
-                ck_col[pk_value] = [store_query_key.value]
+    def _set_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        uid = store_query_key.value
+        for qk in unique_query_keys.all:
+            self.unique_keys.add(qk.key, index_value(qk), uid)
 
-            self.searchable_keys[pk_key] = ck_col
+        self.unique_keys.add(store_query_key.key, store_query_key.value, uid)
 
-        self.data[store_query_key.value] = obj
+        for qk in searchable_query_keys.all:
+            self.searchable_keys.add(qk.key, index_value(qk), uid)
 
     def _migrate_data(
         self, to_klass: SyftObject, context: AuthedServiceContext, has_permission: bool
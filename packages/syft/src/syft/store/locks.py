@@ -1,5 +1,10 @@
 # stdlib
 from collections import defaultdict
+import hashlib
+import os
+from pathlib import Path
+import sys
+import tempfile
 import threading
 import time
 from typing import Any
@@ -29,7 +34,8 @@ class LockingConfig(BaseModel):
         timeout: Optional[int]
              Timeout to acquire lock(seconds)
         retry_interval: float
-            Retry interval to retry acquiring a lock if previous attempts failed.
+            Longest interval between two attempts to acquire a lock that can't be
+            waited on directly, e.g. a file lock held by another process.
     """
 
     lock_name: str = "syft_lock"
@@ -57,16 +63,60 @@ class ThreadingLockingConfig(LockingConfig):
     pass
 
 
+@serializable()
+class ReadWriteLockingConfig(LockingConfig):
+    """
+    Threading-based reader/writer locking policy: concurrent readers, exclusive
+    writers. Ideal for read-heavy same-process stores.
+    """
+
+    pass
+
+
+@serializable()
+class FileLockingConfig(LockingConfig):
+    """
+    File-based locking policy, using `fcntl` locks. Ideal for several processes
+    sharing the same SQLite file.
+
+    Args:
+        client_path: Optional[Path]
+            Folder of the lock files. Defaults to a `syft_locks` folder in the
+            temporary folder.
+    """
+
+    client_path: Path | None = None
+
+
+def _remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
 class ThreadingLock(BaseLock):
     """
     Threading-based Lock. Used to provide the same API as the rest of the locks.
     """
 
-    def __init__(self, expire: int, **kwargs: Any) -> None:
+    def __init__(self, expire: int | None, **kwargs: Any) -> None:
         self.expire = expire
         self.locked_timestamp: float = 0.0
         self.lock = threading.Lock()
 
+    def _expires_in(self) -> float | None:
+        """
+        Seconds until the current holder's lock expires, `None` if it never does.
+        """
+        if self.expire is None or self.expire == -1:
+            return None
+        return self.locked_timestamp + self.expire - time.time()
+
+    def _release_expired(self) -> None:
+        expires_in = self._expires_in()
+        if self.lock.locked() and expires_in is not None and expires_in <= 0:
+            self._release()
+
     @property
     def _locked(self) -> bool:
         """
@@ -74,14 +124,7 @@ class ThreadingLock(BaseLock):
         :returns: if the lock is acquired or not
         :rtype: bool
         """
-        locked = self.lock.locked()
-        if (
-            locked
-            and time.time() - self.locked_timestamp >= self.expire
-            and self.expire != -1
-        ):
-            self._release()
-
+        self._release_expired()
         return self.lock.locked()
 
     def _acquire(self) -> bool:
@@ -90,21 +133,33 @@ class ThreadingLock(BaseLock):
         :returns: if the lock was successfully acquired or not
         :rtype: bool
         """
-        locked = self.lock.locked()
-        if (
-            locked
-            and time.time() - self.locked_timestamp > self.expire
-            and self.expire != -1
-        ):
-            self._release()
-
-        status = self.lock.acquire(
-            blocking=False
-        )  # timeout/retries handle in the `acquire` method
+        self._release_expired()
+        status = self.lock.acquire(blocking=False)
         if status:
             self.locked_timestamp = time.time()
         return status
 
+    def _acquire_blocking(self, timeout: float | None) -> bool:
+        """
+        Implementation of acquiring a lock, waiting at most `timeout` seconds.
+        Waiters are woken up as soon as the lock is released, and wake up
+        when the holder's lock expires to break it.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._release_expired()
+            wait = _remaining(deadline)
+            expires_in = self._expires_in()
+            if expires_in is not None and self.lock.locked():
+                wait = expires_in if wait is None else min(wait, expires_in)
+            if self.lock.acquire(timeout=-1 if wait is None else max(wait, 0.0)):
+                self.locked_timestamp = time.time()
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
     def _release(self) -> None:
         """
         Implementation of releasing an acquired lock.
@@ -122,6 +177,238 @@ class ThreadingLock(BaseLock):
         return True
 
 
+class ReadWriteLock(BaseLock):
+    """
+    Threading-based reader/writer Lock. Readers share the lock, writers hold it
+    exclusively. Waiting writers block new readers, so that writers are not starved.
+    The read lock is not reentrant, and locks don't expire.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.cond = threading.Condition(threading.Lock())
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+
+    @property
+    def _locked(self) -> bool:
+        """
+        Implementation of method to check if lock has been acquired.
+        :returns: if the lock is acquired, by a reader or a writer
+        :rtype: bool
+        """
+        return self.writer or self.readers > 0
+
+    def _can_write(self) -> bool:
+        return not self.writer and self.readers == 0
+
+    def _can_read(self) -> bool:
+        return not self.writer and self.writers_waiting == 0
+
+    def _acquire(self) -> bool:
+        """
+        Implementation of acquiring the write lock in a non-blocking fashion.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        with self.cond:
+            if not self._can_write():
+                return False
+            self.writer = True
+            return True
+
+    def _acquire_blocking(self, timeout: float | None) -> bool:
+        """
+        Implementation of acquiring the write lock, waiting at most `timeout` seconds.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        with self.cond:
+            self.writers_waiting += 1
+            try:
+                acquired = self.cond.wait_for(self._can_write, timeout=timeout)
+            finally:
+                self.writers_waiting -= 1
+            if acquired:
+                self.writer = True
+            else:
+                # readers may have been waiting on this writer
+                self.cond.notify_all()
+            return acquired
+
+    def _release(self) -> None:
+        """
+        Implementation of releasing an acquired write lock.
+        """
+        with self.cond:
+            if self.writer:
+                self.writer = False
+                self.cond.notify_all()
+
+    def _acquire_read(self) -> bool:
+        """
+        Implementation of acquiring the read lock in a non-blocking fashion.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        with self.cond:
+            if not self._can_read():
+                return False
+            self.readers += 1
+            return True
+
+    def _acquire_read_blocking(self, timeout: float | None) -> bool:
+        """
+        Implementation of acquiring the read lock, waiting at most `timeout` seconds.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        with self.cond:
+            acquired = self.cond.wait_for(self._can_read, timeout=timeout)
+            if acquired:
+                self.readers += 1
+            return acquired
+
+    def _release_read(self) -> None:
+        """
+        Implementation of releasing an acquired read lock.
+        """
+        with self.cond:
+            if self.readers > 0:
+                self.readers -= 1
+                if self.readers == 0:
+                    self.cond.notify_all()
+
+    def _renew(self) -> bool:
+        """
+        Implementation of renewing an acquired lock.
+        """
+        return True
+
+
+class FileLock(BaseLock):
+    """
+    File-based Lock, using `fcntl.flock`, for exclusion across processes.
+
+    The lock file is named after the lock name and namespace. Threads of the same
+    process are serialized by a threading lock first, since `flock` doesn't exclude
+    threads sharing a file descriptor. Locks held by a process are dropped by the OS
+    when it exits, so they don't expire.
+    """
+
+    def __init__(
+        self,
+        lock_name: str,
+        namespace: str | None = None,
+        client_path: Path | None = None,
+        retry_interval: float = 0.1,
+        **kwargs: Any,
+    ) -> None:
+        if sys.platform == "win32":
+            raise ValueError("FileLockingConfig is not supported on Windows")
+
+        folder = (
+            Path(tempfile.gettempdir(), "syft_locks")
+            if client_path is None
+            else Path(client_path)
+        )
+        folder.mkdir(parents=True, exist_ok=True)
+        key = f"{namespace}_{lock_name}" if namespace else lock_name
+        # lock names can contain characters that are not valid in file names
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        self.lock_file = folder / f"{digest}.lock"
+        self.retry_interval = retry_interval
+        self.thread_lock = ThreadingLock(expire=None)
+        self.fd: int | None = None
+
+    @property
+    def _locked(self) -> bool:
+        """
+        Implementation of method to check if lock has been acquired.
+        :returns: if the lock is acquired, by this or another process
+        :rtype: bool
+        """
+        if self.fd is not None:
+            return True
+        fd = self._try_flock()
+        if fd is None:
+            return True
+        self._unlock_file(fd)
+        return False
+
+    def _try_flock(self) -> int | None:
+        # stdlib
+        import fcntl
+
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    def _unlock_file(self, fd: int) -> None:
+        # stdlib
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _acquire(self) -> bool:
+        """
+        Implementation of acquiring a lock in a non-blocking fashion.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        if not self.thread_lock._acquire():
+            return False
+        self.fd = self._try_flock()
+        if self.fd is not None:
+            return True
+        self.thread_lock._release()
+        return False
+
+    def _acquire_blocking(self, timeout: float | None) -> bool:
+        """
+        Implementation of acquiring a lock, waiting at most `timeout` seconds.
+        `flock` can't wait with a timeout, so attempts on a file locked by another
+        process back off exponentially, up to `retry_interval`.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.thread_lock._acquire_blocking(timeout):
+            return False
+
+        interval = 0.001
+        while (fd := self._try_flock()) is None:
+            remaining = _remaining(deadline)
+            if remaining == 0.0:
+                self.thread_lock._release()
+                return False
+            time.sleep(interval if remaining is None else min(interval, remaining))
+            interval = min(interval * 2, self.retry_interval)
+        self.fd = fd
+        return True
+
+    def _release(self) -> None:
+        """
+        Implementation of releasing an acquired lock.
+        """
+        fd, self.fd = self.fd, None
+        if fd is None:
+            return None
+        self._unlock_file(fd)
+        self.thread_lock._release()
+
+    def _renew(self) -> bool:
+        """
+        Implementation of renewing an acquired lock.
+        """
+        return True
+
+
 class SyftLock(BaseLock):
     """
     Syft Lock implementations.
@@ -154,6 +441,10 @@ class SyftLock(BaseLock):
             self.passthrough = True
         elif isinstance(config, ThreadingLockingConfig):
             self._lock = ThreadingLock(**base_params)
+        elif isinstance(config, ReadWriteLockingConfig):
+            self._lock = ReadWriteLock(**base_params)
+        elif isinstance(config, FileLockingConfig):
+            self._lock = FileLock(**base_params, client_path=config.client_path)
         else:
             raise ValueError("Unsupported config type")
 
@@ -180,22 +471,64 @@ class SyftLock(BaseLock):
 
         if not blocking:
             return self._acquire()
+        if self.passthrough:
+            return True
 
-        timeout: float = float(self.timeout)
-        start_time = time.time()
-        elapsed: float = 0.0
-        while timeout >= elapsed:
-            if not self._acquire():
-                time.sleep(self.retry_interval)
-                elapsed = time.time() - start_time
-            else:
-                return True
+        timeout = None if self.timeout is None else float(self.timeout)
+        try:
+            acquired = (
+                self._lock._acquire_blocking(timeout=timeout) if self._lock else False
+            )
+        except BaseException:
+            acquired = False
+        if acquired:
+            return True
+        print(
+            f"Timeout elapsed after {self.timeout} seconds while trying to acquiring lock."
+        )
+        return False
+
+    def acquire_read(self, blocking: bool = True) -> bool:
+        """
+        Acquire a lock shared with other readers, blocking or non-blocking.
+        Locks without a read mode are acquired exclusively.
+        :param bool blocking: acquire a lock in a blocking or non-blocking
+                              fashion. Defaults to True.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        if not isinstance(self._lock, ReadWriteLock):
+            return self.acquire(blocking=blocking)
+
+        timeout = None if self.timeout is None else float(self.timeout)
+        try:
+            if not blocking:
+                return self._lock._acquire_read()
+            acquired = self._lock._acquire_read_blocking(timeout=timeout)
+        except BaseException:
+            acquired = False
+        if acquired:
+            return True
         print(
             f"Timeout elapsed after {self.timeout} seconds while trying to acquiring lock."
         )
-        # third party
         return False
 
+    def release_read(self) -> bool:
+        """
+        Release a lock acquired with `acquire_read`.
+        :returns: if the lock was successfully released or not
+        :rtype: bool
+        """
+        try:
+            if isinstance(self._lock, ReadWriteLock):
+                self._lock._release_read()
+            else:
+                self.release()
+        except BaseException:
+            return False
+        return True
+
     def _acquire(self) -> bool:
         """
         Implementation of acquiring a lock in a non-blocking fashion.
@@ -7,6 +7,8 @@ from typing import Set  # noqa: UP035
 from pydantic import Field
 from pymongo import ASCENDING
 from pymongo.collection import Collection as MongoCollection
+from pymongo.errors import DuplicateKeyError
+from pymongo.errors import OperationFailure
 from result import Err
 from result import Ok
 from result import Result
@@ -41,12 +43,16 @@ from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
+from .document_store import paginate
 from .kv_document_store import KeyValueBackingStore
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .mongo_client import MongoClient
 from .mongo_client import MongoStoreClientConfig
 
+# returned by mongo when dropping an index that does not exist
+INDEX_NOT_FOUND_ERROR_CODE = 27
+
 
 @serializable()
 class MongoDict(SyftBaseObject):
@@ -191,39 +197,71 @@ class MongoStorePartition(StorePartition):
         unique_attrs = getattr(syft_obj, "__attr_unique__", [])
         object_name = syft_obj.__canonical_name__
 
-        new_index_keys = [(attr, ASCENDING) for attr in unique_attrs]
+        # every unique attr gets its own index, so inserting a duplicate of any
+        # of them fails with a DuplicateKeyError
+        new_indexes = {
+            f"{object_name}_{attr}_index_name": [(attr, ASCENDING)]
+            for attr in unique_attrs
+        }
 
         try:
             current_indexes = collection.index_information()
         except BaseException as e:
             return Err(str(e))
-        index_name = f"{object_name}_index_name"
-
-        current_index_keys = current_indexes.get(index_name, None)
 
-        if current_index_keys is not None:
-            keys_same = check_index_keys(current_index_keys["key"], new_index_keys)
-            if keys_same:
-                return Ok(True)
+        # Older versions kept one compound index of all unique attrs. It is
+        # migrated explicitly: dropped before the per attr indexes are created,
+        # since it clashes with them when there is a single unique attr, and
+        # restored if they cannot be created.
+        compound_index_name = f"{object_name}_index_name"
+        compound_index = current_indexes.get(compound_index_name, None)
+
+        stale_index_names = []
+        for index_name, new_index_keys in new_indexes.items():
+            current_index_keys = current_indexes.get(index_name, None)
+            if current_index_keys is None:
+                continue
+            if check_index_keys(current_index_keys["key"], new_index_keys):
+                new_indexes[index_name] = []
+            else:
+                # Drop current index, since incompatible with current object
+                stale_index_names.append(index_name)
+        if compound_index is not None:
+            stale_index_names.append(compound_index_name)
 
-            # Drop current index, since incompatible with current object
+        for index_name in stale_index_names:
             try:
                 collection.drop_index(index_or_name=index_name)
-            except Exception:
+            except Exception as e:
+                # another node may have dropped it already
+                if (
+                    isinstance(e, OperationFailure)
+                    and e.code == INDEX_NOT_FOUND_ERROR_CODE
+                ):
+                    continue
                 return Err(
-                    f"Failed to drop index for object: {object_name} with index keys: {current_index_keys}"
+                    f"Failed to drop index for object: {object_name} with index keys: {current_indexes[index_name]}"
                 )
 
-        # If no new indexes, then skip index creation
-        if len(new_index_keys) == 0:
-            return Ok(True)
-
-        try:
-            collection.create_index(new_index_keys, unique=True, name=index_name)
-        except Exception:
-            return Err(
-                f"Failed to create index for {object_name} with index keys: {new_index_keys}"
-            )
+        created_index_names = []
+        for index_name, new_index_keys in new_indexes.items():
+            # If no new indexes, then skip index creation
+            if len(new_index_keys) == 0:
+                continue
+            try:
+                collection.create_index(new_index_keys, unique=True, name=index_name)
+                created_index_names.append(index_name)
+            except Exception as e:
+                if compound_index is not None:
+                    for created_index_name in created_index_names:
+                        collection.drop_index(index_or_name=created_index_name)
+                    collection.create_index(
+                        compound_index["key"], unique=True, name=compound_index_name
+                    )
+                return Err(
+                    f"Failed to create index for {object_name} with index keys: {new_index_keys}. "
+                    f"Stored documents may share a value of a unique key: {e}"
+                )
 
         return Ok(True)
 
@@ -265,69 +303,106 @@ class MongoStorePartition(StorePartition):
         add_storage_permission: bool = True,
         ignore_duplicates: bool = False,
     ) -> Result[SyftObject, str]:
-        # TODO: Refactor this function since now it's doing both set and
-        # update at the same time
-        write_permission = ActionObjectWRITE(uid=obj.id, credentials=credentials)
-        can_write: bool = self.has_permission(write_permission)
-
-        store_query_key: QueryKey = self.settings.store_key.with_obj(obj)
         collection_status = self.collection
         if collection_status.is_err():
             return collection_status
         collection: MongoCollection = collection_status.ok()
 
-        store_key_exists = (
-            collection.find_one(store_query_key.as_dict_mongo) is not None
-        )
-        if (not store_key_exists) and (not self.item_keys_exist(obj, collection)):
-            # attempt to claim ownership for writing
-            ownership_result = self.take_ownership(uid=obj.id, credentials=credentials)
-            can_write = ownership_result.is_ok()
-        elif not ignore_duplicates:
+        # the unique indexes reject duplicates of the store key or any unique key
+        try:
+            collection.insert_one(obj.to(self.storage_type))
+        except DuplicateKeyError:
+            if ignore_duplicates:
+                # we are not throwing an error, because we are ignoring duplicates
+                # we are also not writing though
+                return Ok(obj)
             unique_query_keys: QueryKeys = self.settings.unique_keys.with_obj(obj)
             keys = ", ".join(f"`{key.key}`" for key in unique_query_keys.all)
             return Err(
                 f"Duplication Key Error for {obj}.\n"
                 f"The fields that should be unique are {keys}."
             )
-        else:
-            # we are not throwing an error, because we are ignoring duplicates
-            # we are also not writing though
-            return Ok(obj)
-
-        if can_write:
-            storage_obj = obj.to(self.storage_type)
 
-            collection.insert_one(storage_obj)
+        read_permission = ActionObjectPermission(
+            uid=obj.id,
+            credentials=credentials,
+            permission=ActionPermission.READ,
+        )
+        new_permissions = [read_permission] + (add_permissions or [])
+        owner_permissions = [
+            ActionObjectOWNER(uid=obj.id, credentials=credentials),
+            ActionObjectWRITE(uid=obj.id, credentials=credentials),
+            ActionObjectEXECUTE(uid=obj.id, credentials=credentials),
+        ]
+
+        # the first one to store this UID takes ownership of it
+        ownership_result = self._insert_permissions(
+            obj.id, owner_permissions + new_permissions
+        )
+        if ownership_result.is_err():
+            return ownership_result
+        if not ownership_result.ok():
+            # permissions for this UID already exist, so it is owned by someone
+            collection.delete_one({"_id": obj.id})
+            return Err(f"No permission to write object with id {obj.id}")
 
-            # adding permissions
-            read_permission = ActionObjectPermission(
-                uid=obj.id,
-                credentials=credentials,
-                permission=ActionPermission.READ,
+        if add_storage_permission:
+            storage_permission_result = self._insert_storage_permission(
+                StoragePermission(uid=obj.id, node_uid=self.node_uid)
             )
-            self.add_permission(read_permission)
+            if storage_permission_result.is_err():
+                return storage_permission_result
 
-            if add_permissions is not None:
-                self.add_permissions(add_permissions)
+        return Ok(obj)
 
-            if add_storage_permission:
-                self.add_storage_permission(
-                    StoragePermission(
-                        uid=obj.id,
-                        node_uid=self.node_uid,
-                    )
-                )
+    def _insert_permissions(
+        self, uid: UID, permissions: list[ActionObjectPermission]
+    ) -> Result[bool, Err]:
+        """Create the permissions of `uid`, unless it already has some.
 
-            return Ok(obj)
-        else:
-            return Err(f"No permission to write object with id {obj.id}")
+        Once they are created, permissions for other UIDs are added to theirs.
+        """
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        permission_strings = {
+            permission.permission_string
+            for permission in permissions
+            if permission.uid == uid
+        }
+        result = collection_permissions.update_one(
+            {"_id": uid},
+            {"$setOnInsert": {"permissions": permission_strings}},
+            upsert=True,
+        )
+        if result.upserted_id is None:
+            return Ok(False)
+
+        self.add_permissions(
+            [permission for permission in permissions if permission.uid != uid]
+        )
+        return Ok(True)
+
+    def _insert_storage_permission(
+        self, storage_permission: StoragePermission
+    ) -> Result[Ok, Err]:
+        storage_permissions_or_err = self.storage_permissions
+        if storage_permissions_or_err.is_err():
+            return storage_permissions_or_err
+        storage_permissions_collection: MongoCollection = (
+            storage_permissions_or_err.ok()
+        )
 
-    def item_keys_exist(self, obj: SyftObject, collection: MongoCollection) -> bool:
-        qks: QueryKeys = self.settings.unique_keys.with_obj(obj)
-        query = {"$or": [{k: v} for k, v in qks.as_dict_mongo.items()]}
-        res = collection.find_one(query)
-        return res is not None
+        result = storage_permissions_collection.update_one(
+            {"_id": storage_permission.uid},
+            {"$setOnInsert": {"node_uids": {storage_permission.node_uid}}},
+            upsert=True,
+        )
+        if result.upserted_id is None:
+            self.add_storage_permission(storage_permission)
+        return Ok(True)
 
     def _update(
         self,
@@ -386,13 +461,127 @@ class MongoStorePartition(StorePartition):
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
         # TODO: pass index as hint to find method
         qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
         return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
 
+    def _find_readable(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        keys: list[str] | None = None,
+        order_by: PartitionKey | None = None,
+    ) -> Result[list[dict], str]:
+        """Matching documents readable by `credentials`, with only `_id` and `keys`"""
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        # indexed keys are stored next to the blob, so it doesn't need to be loaded
+        projection = {"_id": 1}
+        for key in keys or []:
+            projection["_id" if key == "id" else key] = 1
+
+        sort_key = "_id" if order_by is None else order_by.key
+        storage_objs = list(
+            collection.find(filter=qks.as_dict_mongo, projection=projection).sort(
+                sort_key
+            )
+        )
+
+        readable_uids = self._get_readable_uids(
+            credentials, [storage_obj["_id"] for storage_obj in storage_objs]
+        )
+        if readable_uids.is_err():
+            return readable_uids
+        readable = readable_uids.ok()
+        return Ok(
+            [
+                storage_obj
+                for storage_obj in storage_objs
+                if storage_obj["_id"] in readable
+            ]
+        )
+
+    def _find_index_or_search_projection(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        keys: list[str],
+        order_by: PartitionKey | None = None,
+    ) -> Result[list[dict[str, Any]], str]:
+        qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+        storage_objs = self._find_readable(
+            credentials, qks, keys=keys, order_by=order_by
+        )
+        if storage_objs.is_err():
+            return storage_objs
+        return Ok(
+            [
+                {
+                    key: storage_obj.get("_id" if key == "id" else key, None)
+                    for key in keys
+                }
+                for storage_obj in storage_objs.ok()
+            ]
+        )
+
+    def _count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[int, str]:
+        # TODO: fix for other admins
+        if credentials and self.root_verify_key.verify == credentials.verify:
+            collection_status = self.collection
+            if collection_status.is_err():
+                return collection_status
+            collection: MongoCollection = collection_status.ok()
+            qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+            return Ok(collection.count_documents(filter=qks.as_dict_mongo))
+
+        qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+        storage_objs = self._find_readable(credentials, qks)
+        if storage_objs.is_err():
+            return storage_objs
+        return Ok(len(storage_objs.ok()))
+
+    def _exists(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+    ) -> Result[bool, str]:
+        # TODO: fix for other admins
+        if credentials and self.root_verify_key.verify == credentials.verify:
+            collection_status = self.collection
+            if collection_status.is_err():
+                return collection_status
+            collection: MongoCollection = collection_status.ok()
+            qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+            storage_obj = collection.find_one(
+                filter=qks.as_dict_mongo, projection={"_id": 1}
+            )
+            return Ok(storage_obj is not None)
+
+        qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+        storage_objs = self._find_readable(credentials, qks)
+        if storage_objs.is_err():
+            return storage_objs
+        return Ok(len(storage_objs.ok()) > 0)
+
     @property
     def data(self) -> dict:
         values: list = self._all(credentials=None, has_permission=True).ok()
@@ -404,31 +593,59 @@ class MongoStorePartition(StorePartition):
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
         collection_status = self.collection
         if collection_status.is_err():
             return collection_status
         collection: MongoCollection = collection_status.ok()
 
-        if order_by is not None:
-            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(order_by.key)
+        sort_key = "_id" if order_by is None else order_by.key
+        paginated = limit is not None or offset is not None
+        if has_permission:
+            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(sort_key)
+            if paginated:
+                # a limit of 0 means no limit in mongo
+                storage_objs = storage_objs.skip(offset or 0).limit(limit or 0)
+            storage_objs = list(storage_objs)
+        elif paginated:
+            # permissions are checked on the ids first, so only the page is loaded
+            readable_objs = self._find_readable(credentials, qks, order_by=order_by)
+            if readable_objs.is_err():
+                return readable_objs
+            page_uids = [
+                storage_obj["_id"]
+                for storage_obj in paginate(readable_objs.ok(), limit, offset)
+            ]
+            page = {
+                storage_obj["_id"]: storage_obj
+                for storage_obj in collection.find({"_id": {"$in": page_uids}})
+            }
+            storage_objs = [page[uid] for uid in page_uids if uid in page]
         else:
-            _default_key = "_id"
-            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(_default_key)
+            storage_objs = list(
+                collection.find(filter=qks.as_dict_mongo).sort(sort_key)
+            )
+            readable_uids = self._get_readable_uids(
+                credentials, [storage_obj["_id"] for storage_obj in storage_objs]
+            )
+            if readable_uids.is_err():
+                return readable_uids
+            readable = readable_uids.ok()
+            storage_objs = [
+                storage_obj
+                for storage_obj in storage_objs
+                if storage_obj["_id"] in readable
+            ]
+
         syft_objs = []
         for storage_obj in storage_objs:
             obj = self.storage_type(storage_obj)
             transform_context = TransformContext(output={}, obj=obj)
             syft_objs.append(obj.to(self.settings.object_type, transform_context))
-
-        # TODO: maybe do this in loop before this
-        res = []
-        for s in syft_objs:
-            if has_permission or self.has_permission(
-                ActionObjectREAD(uid=s.id, credentials=credentials)
-            ):
-                res.append(s)
-        return Ok(res)
+        return Ok(syft_objs)
 
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
@@ -501,6 +718,44 @@ class MongoStorePartition(StorePartition):
 
         return False
 
+    def _get_readable_uids(
+        self, credentials: SyftVerifyKey, uids: list[UID]
+    ) -> Result[Set[UID], Err]:  # noqa: UP006
+        """Filter `uids` down to the ones `credentials` can read, with one query"""
+        if not uids:
+            return Ok(set())
+
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        # TODO: fix for other admins
+        if credentials and self.root_verify_key.verify == credentials.verify:
+            permissions = collection_permissions.find(
+                {"_id": {"$in": uids}}, projection={"_id": 1}
+            )
+            return Ok({permission["_id"] for permission in permissions})
+
+        # permissions are stored as serialized sets, so they are matched here
+        # rather than in the query
+        permissions = collection_permissions.find({"_id": {"$in": uids}})
+
+        # permission strings don't depend on the uid
+        read_permissions = {
+            ActionObjectREAD(uid=uids[0], credentials=credentials).permission_string,
+            ActionObjectPermission(
+                uids[0], ActionPermission.ALL_READ
+            ).permission_string,
+        }
+        return Ok(
+            {
+                permission["_id"]
+                for permission in permissions
+                if not read_permissions.isdisjoint(permission["permissions"])
+            }
+        )
+
     def _get_permissions_for_uid(self, uid: UID) -> Result[Set[str], Err]:  # noqa: UP006
         collection_permissions_status = self.permissions
         if collection_permissions_status.is_err():
@@ -515,6 +770,7 @@ class MongoStorePartition(StorePartition):
         return Ok(set(permissions["permissions"]))
 
     def add_permission(self, permission: ActionObjectPermission) -> Result[None, Err]:
+        self.generation += 1
         collection_permissions_status = self.permissions
         if collection_permissions_status.is_err():
             return collection_permissions_status
@@ -549,6 +805,7 @@ class MongoStorePartition(StorePartition):
     def remove_permission(
         self, permission: ActionObjectPermission
     ) -> Result[None, Err]:
+        self.generation += 1
         collection_permissions_status = self.permissions
         if collection_permissions_status.is_err():
             return collection_permissions_status
@@ -699,6 +956,8 @@ class MongoStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Result[list[SyftObject], str]:
         qks = QueryKeys(qks=())
         return self._get_all_from_store(
@@ -706,6 +965,8 @@ class MongoStorePartition(StorePartition):
             qks=qks,
             order_by=order_by,
             has_permission=has_permission,
+            limit=limit,
+            offset=offset,
         )
 
     def __len__(self) -> int:
@@ -995,6 +1256,7 @@ class MongoStoreConfig(StoreConfig):
             The config used for store locking. Available options:
                 * NoLockingConfig: no locking, ideal for single-thread stores.
                 * ThreadingLockingConfig: threading-based locking, ideal for same-process in-memory stores.
+                * FileLockingConfig: file-based locking, ideal for stores shared by several processes.
             Defaults to NoLockingConfig.
     """
 
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 # stdlib
 from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
 import sqlite3
@@ -23,11 +26,14 @@ from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
 from ..types.uid import UID
 from ..util.util import thread_ident
+from .document_store import BasePartitionSettings
 from .document_store import DocumentStore
 from .document_store import PartitionSettings
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
 from .kv_document_store import KeyValueBackingStore
+from .kv_document_store import KeyValueIndexStore
+from .kv_document_store import KeyValuePermissionStore
 from .kv_document_store import KeyValueStorePartition
 from .locks import LockingConfig
 from .locks import NoLockingConfig
@@ -41,6 +47,13 @@ from .locks import SyftLock
 SQLITE_CONNECTION_POOL_DB: dict[str, sqlite3.Connection] = {}
 SQLITE_CONNECTION_POOL_CUR: dict[str, sqlite3.Cursor] = {}
 REF_COUNTS: dict[str, int] = defaultdict(int)
+# nesting depth of the open `transaction` blocks, per connection
+TRANSACTION_DEPTHS: dict[str, int] = defaultdict(int)
+# all the tables of a database share a connection, so its prepared statement
+# cache has to fit the statements of every table, not the default 128
+SQLITE_CACHED_STATEMENTS = 1024
+# bound parameters per statement, the limit of SQLite before 3.32
+SQLITE_MAX_VARIABLES = 999
 
 
 def cache_key(db_name: str) -> str:
@@ -126,6 +139,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
                 timeout=self.store_config.client_config.timeout,
                 check_same_thread=False,  # do we need this if we use the lock?
                 # check_same_thread=self.store_config.client_config.check_same_thread,
+                cached_statements=SQLITE_CACHED_STATEMENTS,
             )
             # Set journal mode to WAL.
             connection.execute("PRAGMA journal_mode = WAL")
@@ -146,6 +160,15 @@ class SQLiteBackingStore(KeyValueBackingStore):
         except Exception as e:
             raise_exception(self.table_name, e)
 
+        # covers `keys`, which then never reads the values. Tables created
+        # before the index existed get it the next time they are opened
+        with self.lock:
+            self.cur.execute(
+                f"create index if not exists {self.table_name}_sqltime "  # nosec
+                + f"on {self.table_name} (sqltime, uid)"  # nosec
+            )
+            self.db.commit()
+
     @property
     def db(self) -> sqlite3.Connection:
         if cache_key(self.db_filename) not in SQLITE_CONNECTION_POOL_DB:
@@ -167,6 +190,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
             # same connection
             self.db.close()
             del SQLITE_CONNECTION_POOL_DB[cache_key(self.db_filename)]
+            SQLITE_CONNECTION_POOL_CUR.pop(cache_key(self.db_filename), None)
         else:
             # don't close yet because another SQLiteBackingStore is probably still open
             pass
@@ -174,6 +198,32 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def _commit(self) -> None:
         self.db.commit()
 
+    @property
+    def in_transaction(self) -> bool:
+        return TRANSACTION_DEPTHS[cache_key(self.db_filename)] > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit the statements executed in the block once, when it exits.
+
+        All the tables of a database share the connection of the current thread,
+        so the block also covers the other stores of a partition. Nested blocks
+        are part of the outermost one, and an exception rolls it back.
+        """
+        key = cache_key(self.db_filename)
+        TRANSACTION_DEPTHS[key] += 1
+        try:
+            yield
+        except BaseException:
+            if TRANSACTION_DEPTHS[key] == 1:
+                self.db.rollback()
+            raise
+        else:
+            if TRANSACTION_DEPTHS[key] == 1:
+                self._commit()
+        finally:
+            TRANSACTION_DEPTHS[key] -= 1
+
     def _execute(
         self, sql: str, *args: list[Any] | None
     ) -> Result[Ok[sqlite3.Cursor], Err[str]]:
@@ -190,31 +240,37 @@ class SQLiteBackingStore(KeyValueBackingStore):
             # rather than halting the program like disk I/O error etc
             # self.db.rollback()  # Roll back all changes if an exception occurs.
             # err = Err(str(e))
-            self.db.commit()  # Commit if everything went ok
+
+            # only writes open a transaction, reads have nothing to commit, and
+            # writes in a `transaction` block are committed when it exits
+            if self.db.in_transaction and not self.in_transaction:
+                self.db.commit()  # Commit if everything went ok
 
             # if err is not None:
             #     return err
 
             return Ok(cursor)
 
-    def _set(self, key: UID, value: Any) -> None:
-        if self._exists(key):
-            self._update(key, value)
-        else:
-            insert_sql = (
-                f"insert into {self.table_name} (uid, repr, value) VALUES (?, ?, ?)"  # nosec
-            )
-            data = _serialize(value, to_bytes=True)
-            res = self._execute(insert_sql, [str(key), _repr_debug_(value), data])
-            if res.is_err():
-                raise ValueError(res.err())
+    def _iter_rows(self, sql: str, *args: list[Any] | None) -> Iterator[tuple]:
+        # a cursor of its own, statements run while iterating would reset the
+        # shared one. Closing it when the iteration stops ends the read
+        with self.lock:
+            try:
+                cursor = self.db.execute(sql, *args)
+            except Exception as e:
+                raise_exception(self.table_name, e)
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
 
-    def _update(self, key: UID, value: Any) -> None:
-        insert_sql = (
-            f"update {self.table_name} set uid = ?, repr = ?, value = ? where uid = ?"  # nosec
+    def _set(self, key: UID, value: Any) -> None:
+        upsert_sql = (
+            f"insert into {self.table_name} (uid, repr, value) VALUES (?, ?, ?) "  # nosec
+            + "on conflict(uid) do update set repr = excluded.repr, value = excluded.value"
         )
         data = _serialize(value, to_bytes=True)
-        res = self._execute(insert_sql, [str(key), _repr_debug_(value), data, str(key)])
+        res = self._execute(upsert_sql, [str(key), _repr_debug_(value), data])
         if res.is_err():
             raise ValueError(res.err())
 
@@ -232,18 +288,27 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return _deserialize(data, from_bytes=True)
 
     def _exists(self, key: UID) -> bool:
-        select_sql = f"select uid from {self.table_name} where uid = ?"  # nosec
-
+        select_sql = f"select 1 from {self.table_name} where uid = ? limit 1"  # nosec
         res = self._execute(select_sql, [str(key)])
         if res.is_err():
             return False
-        cursor = res.ok()
-
-        row = cursor.fetchone()
-        if row is None:
-            return False
-
-        return bool(row)
+        return res.ok().fetchone() is not None
+
+    def contains_many(self, keys: Iterable[UID]) -> set[UID]:
+        keys_by_str = {str(key): key for key in keys}
+        str_keys = list(keys_by_str)
+        found: set[UID] = set()
+        for start in range(0, len(str_keys), SQLITE_MAX_VARIABLES):
+            chunk = str_keys[start : start + SQLITE_MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            select_sql = (
+                f"select uid from {self.table_name} where uid in ({placeholders})"  # nosec
+            )
+            res = self._execute(select_sql, chunk)
+            if res.is_err():
+                raise ValueError(res.err())
+            found.update(keys_by_str[row[0]] for row in res.ok().fetchall())
+        return found
 
     def _get_all(self) -> Any:
         select_sql = f"select * from {self.table_name} order by sqltime"  # nosec
@@ -264,22 +329,25 @@ class SQLiteBackingStore(KeyValueBackingStore):
             data.append(_deserialize(row[2], from_bytes=True))
         return dict(zip(keys, data))
 
-    def _get_all_keys(self) -> Any:
-        select_sql = f"select uid from {self.table_name} order by sqltime"  # nosec
-        keys = []
-
-        res = self._execute(select_sql)
+    def values_page(self, limit: int | None, offset: int | None) -> list[Any]:
+        # a negative limit means no limit in SQLite, rowid keeps the rows stored
+        # within the same second in insertion order
+        select_sql = f"select value from {self.table_name} order by sqltime, rowid limit ? offset ?"  # nosec
+        res = self._execute(
+            select_sql,
+            [-1 if limit is None else limit, 0 if offset is None else offset],
+        )
         if res.is_err():
             return []
-        cursor = res.ok()
+        return [_deserialize(row[0], from_bytes=True) for row in res.ok().fetchall()]
 
-        rows = cursor.fetchall()
-        if rows is None:
-            return []
+    def _iter_keys(self) -> Iterator[UID]:
+        select_sql = f"select uid from {self.table_name} order by sqltime, rowid"  # nosec
+        for row in self._iter_rows(select_sql):
+            yield UID(row[0])
 
-        for row in rows:
-            keys.append(UID(row[0]))
-        return keys
+    def _get_all_keys(self) -> Any:
+        return list(self._iter_keys())
 
     def _delete(self, key: UID) -> None:
         select_sql = f"delete from {self.table_name} where uid = ?"  # nosec
@@ -294,7 +362,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
             raise ValueError(res.err())
 
     def _len(self) -> int:
-        select_sql = f"select count(uid) from {self.table_name}"  # nosec
+        select_sql = f"select count(*) from {self.table_name}"  # nosec
         res = self._execute(select_sql)
         if res.is_err():
             raise ValueError(res.err())
@@ -328,8 +396,8 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def copy(self) -> Self:
         return deepcopy(self)
 
-    def keys(self) -> Any:
-        return self._get_all_keys()
+    def keys(self) -> Iterator[UID]:
+        return self._iter_keys()
 
     def values(self) -> Any:
         return self._get_all().values()
@@ -356,6 +424,280 @@ class SQLiteBackingStore(KeyValueBackingStore):
             pass
 
 
+def _index_value(value: Any) -> str | bytes:
+    # strings stay searchable with instr(), everything else is compared by its
+    # serialized form, the same way the mongo codecs store non-native types
+    if isinstance(value, str):
+        return value
+    return _serialize(value, to_bytes=True)
+
+
+@serializable(attrs=["index_name", "settings", "store_config", "unique"])
+class SQLiteIndexStore(SQLiteBackingStore, KeyValueIndexStore):
+    """Partition index stored as one row per `(partition key, value, uid)` entry.
+
+    Lookups and updates are indexed statements instead of a read-modify-write of
+    a serialized dict per partition key.
+
+    Parameters:
+        `index_name`: str
+            Index name
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: SQLiteStoreConfig
+            Connection Configuration
+        `unique`: bool
+            Whether a value maps to a single uid or to many uids
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        unique: bool = False,
+    ) -> None:
+        self.unique = unique
+        self.pk_keys: set[str] = set()
+        # the index used to be stored as one serialized dict per partition key
+        self.legacy_table_name = f"{settings.name}_{index_name}"
+        super().__init__(
+            index_name=f"{index_name}_index",
+            settings=settings,
+            store_config=store_config,
+        )
+
+    def create_table(self) -> None:
+        primary_key = "pk_key, value" if self.unique else "pk_key, value, uid"
+        try:
+            with self.lock:
+                self.cur.execute(
+                    f"create table {self.table_name} (pk_key TEXT NOT NULL, "  # nosec
+                    + "value BLOB NOT NULL, uid VARCHAR(32) NOT NULL, "  # nosec
+                    + f"PRIMARY KEY ({primary_key})) WITHOUT ROWID"  # nosec
+                )
+                self.db.commit()
+        except Exception as e:
+            raise_exception(self.table_name, e)
+
+    def drop_legacy_table(self) -> None:
+        """Drop the table of the old index format, once the index is rebuilt"""
+        res = self._execute(f"drop table if exists {self.legacy_table_name}")  # nosec
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def init_keys(self, pk_keys: list[str]) -> None:
+        self.pk_keys.update(pk_keys)
+
+    def has_key(self, pk_key: str) -> bool:
+        return pk_key in self.pk_keys
+
+    def contains(self, pk_key: str, value: Any) -> bool:
+        select_sql = (
+            f"select 1 from {self.table_name} where pk_key = ? and value = ? limit 1"  # nosec
+        )
+        res = self._execute(select_sql, [pk_key, _index_value(value)])
+        if res.is_err():
+            return False
+        return res.ok().fetchone() is not None
+
+    def get(self, pk_key: str, value: Any) -> set[UID]:
+        select_sql = f"select uid from {self.table_name} where pk_key = ? and value = ?"  # nosec
+        res = self._execute(select_sql, [pk_key, _index_value(value)])
+        if res.is_err():
+            raise KeyError(f"Query {select_sql} failed")
+        return {UID(row[0]) for row in res.ok().fetchall()}
+
+    def search(self, pk_key: str, items: list[Any]) -> set[UID]:
+        select_sql = f"select uid from {self.table_name} where pk_key = ? and instr(value, ?) > 0"  # nosec
+        matches: set[UID] = set()
+        for item in items:
+            res = self._execute(select_sql, [pk_key, str(item)])
+            if res.is_err():
+                raise KeyError(f"Query {select_sql} failed")
+            matches.update(UID(row[0]) for row in res.ok().fetchall())
+        return matches
+
+    def add(self, pk_key: str, value: Any, uid: UID) -> None:
+        insert_sql = f"insert or replace into {self.table_name} (pk_key, value, uid) VALUES (?, ?, ?)"  # nosec
+        res = self._execute(insert_sql, [pk_key, _index_value(value), str(uid)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def discard(self, pk_key: str, value: Any, uid: UID) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} where pk_key = ? and value = ? and uid = ?"  # nosec
+        )
+        res = self._execute(delete_sql, [pk_key, _index_value(value), str(uid)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def is_empty(self) -> bool:
+        select_sql = f"select 1 from {self.table_name} limit 1"  # nosec
+        res = self._execute(select_sql)
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchone() is None
+
+    def _get_all(self) -> Any:
+        select_sql = f"select pk_key, value, uid from {self.table_name}"  # nosec
+        res = self._execute(select_sql)
+        if res.is_err():
+            return {}
+        index: dict[str, dict] = defaultdict(lambda: defaultdict(set))
+        for pk_key, value, uid in res.ok().fetchall():
+            index[pk_key][value].add(UID(uid))
+        return {k: dict(v) for k, v in index.items()}
+
+    def _len(self) -> int:
+        select_sql = f"select count(*) from {self.table_name}"  # nosec
+        res = self._execute(select_sql)
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchone()[0]
+
+
+@serializable(attrs=["index_name", "settings", "store_config", "value_type"])
+class SQLitePermissionStore(SQLiteBackingStore, KeyValuePermissionStore):
+    """Permissions stored as one row per `(uid, permission)` pair.
+
+    The primary key doubles as a covering index, so permission checks are point
+    queries and grants are inserts instead of a read-modify-write of a
+    serialized set.
+
+    Parameters:
+        `index_name`: str
+            Index name
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: SQLiteStoreConfig
+            Connection Configuration
+        `value_type`: type
+            Type of the stored permission values, `str` or `UID`
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: BasePartitionSettings,
+        store_config: StoreConfig,
+        value_type: type = str,
+    ) -> None:
+        self.value_type = value_type
+        super().__init__(
+            index_name=f"{index_name}_rows",
+            settings=settings,
+            store_config=store_config,
+        )
+        self._migrate_legacy_table(f"{settings.name}_{index_name}")
+
+    def create_table(self) -> None:
+        try:
+            with self.lock:
+                self.cur.execute(
+                    f"create table {self.table_name} (uid VARCHAR(32) NOT NULL, "  # nosec
+                    + "permission TEXT NOT NULL, "  # nosec
+                    + "PRIMARY KEY (uid, permission)) WITHOUT ROWID"  # nosec
+                )
+                self.db.commit()
+        except Exception as e:
+            raise_exception(self.table_name, e)
+
+    def _migrate_legacy_table(self, legacy_table_name: str) -> None:
+        # permissions used to be stored as one serialized set per uid
+        select_sql = "select name from sqlite_master where type = 'table' and name = ?"
+        res = self._execute(select_sql, [legacy_table_name])
+        if res.is_err() or res.ok().fetchone() is None:
+            return
+
+        res = self._execute(f"select uid, value from {legacy_table_name}")  # nosec
+        if res.is_err():
+            raise ValueError(res.err())
+        items = [
+            (UID(uid), value)
+            for uid, data in res.ok().fetchall()
+            for value in _deserialize(data, from_bytes=True)
+        ]
+        self.add_many(items)
+        self._execute(f"drop table if exists {legacy_table_name}")  # nosec
+
+    def _executemany(self, sql: str, rows: list[list[Any]]) -> None:
+        with self.lock:
+            try:
+                self.cur.executemany(sql, rows)
+            except Exception as e:
+                raise_exception(self.table_name, e)
+            if not self.in_transaction:
+                self.db.commit()
+
+    def add(self, uid: UID, value: Any) -> None:
+        self.add_many([(uid, value)])
+
+    def add_many(self, items: list[tuple[UID, Any]]) -> None:
+        insert_sql = (
+            f"insert or ignore into {self.table_name} (uid, permission) VALUES (?, ?)"  # nosec
+        )
+        self._executemany(insert_sql, [[str(uid), str(value)] for uid, value in items])
+
+    def remove(self, uid: UID, value: Any) -> None:
+        delete_sql = f"delete from {self.table_name} where uid = ? and permission = ?"  # nosec
+        res = self._execute(delete_sql, [str(uid), str(value)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def has_any(self, uid: UID, values: list[Any]) -> bool:
+        placeholders = ", ".join("?" * len(values))
+        select_sql = (
+            f"select 1 from {self.table_name} where uid = ? "  # nosec
+            + f"and permission in ({placeholders}) limit 1"  # nosec
+        )
+        res = self._execute(select_sql, [str(uid)] + [str(value) for value in values])
+        if res.is_err():
+            return False
+        return res.ok().fetchone() is not None
+
+    def _get(self, key: UID) -> set:
+        select_sql = f"select permission from {self.table_name} where uid = ?"  # nosec
+        res = self._execute(select_sql, [str(key)])
+        if res.is_err():
+            raise KeyError(f"Query {select_sql} failed")
+        return {self.value_type(row[0]) for row in res.ok().fetchall()}
+
+    def _exists(self, key: UID) -> bool:
+        select_sql = f"select 1 from {self.table_name} where uid = ? limit 1"  # nosec
+        res = self._execute(select_sql, [str(key)])
+        if res.is_err():
+            return False
+        return res.ok().fetchone() is not None
+
+    def _get_all(self) -> Any:
+        select_sql = f"select uid, permission from {self.table_name}"  # nosec
+        res = self._execute(select_sql)
+        if res.is_err():
+            return {}
+        permissions: dict[UID, set] = defaultdict(set)
+        for uid, value in res.ok().fetchall():
+            permissions[UID(uid)].add(self.value_type(value))
+        return dict(permissions)
+
+    def _iter_keys(self) -> Iterator[UID]:
+        select_sql = f"select distinct uid from {self.table_name}"  # nosec
+        for row in self._iter_rows(select_sql):
+            yield UID(row[0])
+
+    def _set(self, key: UID, value: Any) -> None:
+        with self.transaction():
+            self._delete(key)
+            self.add_many([(key, item) for item in value])
+
+    def _len(self) -> int:
+        select_sql = f"select count(distinct uid) from {self.table_name}"  # nosec
+        res = self._execute(select_sql)
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchone()[0]
+
+
 @serializable()
 class SQLiteStorePartition(KeyValueStorePartition):
     """SQLite StorePartition
@@ -367,14 +709,39 @@ class SQLiteStorePartition(KeyValueStorePartition):
             SQLite specific configuration
     """
 
+    index_store: type[KeyValueIndexStore] = SQLiteIndexStore
+    permission_store: type[KeyValuePermissionStore] = SQLitePermissionStore
+
+    def init_store(self) -> Result[Ok, Err]:
+        store_status = super().init_store()
+        if store_status.is_err():
+            return store_status
+
+        # the indexes are backfilled from the data, so the tables of the old
+        # index format are stale copies
+        try:
+            for index in [self.unique_keys, self.searchable_keys]:
+                if isinstance(index, SQLiteIndexStore):
+                    index.drop_legacy_table()
+        except BaseException as e:
+            return Err(str(e))
+
+        return store_status
+
     def close(self) -> None:
         self.lock.acquire()
         try:
-            # I think we don't want these now, because of the REF_COUNT?
-            # self.data._close()
-            # self.unique_keys._close()
-            # self.searchable_keys._close()
-            pass
+            # the connection is shared by every store of the file, and only
+            # closed with the last of them
+            for store in [
+                self.data,
+                self.unique_keys,
+                self.searchable_keys,
+                self.permissions,
+                self.storage_permissions,
+            ]:
+                if isinstance(store, SQLiteBackingStore):
+                    store._close()
         except BaseException:
             pass
         self.lock.release()
@@ -458,6 +825,7 @@ class SQLiteStoreConfig(StoreConfig):
             The config used for store locking. Available options:
                 * NoLockingConfig: no locking, ideal for single-thread stores.
                 * ThreadingLockingConfig: threading-based locking, ideal for same-process in-memory stores.
+                * FileLockingConfig: file-based locking, ideal for stores shared by several processes.
             Defaults to NoLockingConfig.
     """
 
@@ -14,9 +14,7 @@ from typing import ClassVar
 from typing import TYPE_CHECKING
 
 # third party
-from azure.storage.blob import BlobSasPermissions
-from azure.storage.blob import generate_blob_sas
-from botocore.client import ClientError as BotoClientError
+from botocore.exceptions import ClientError as BotoClientError
 from typing_extensions import Self
 
 # relative
@@ -265,6 +263,10 @@ class AzureSecureFilePathLocation(SecureFilePathLocation):
     def generate_url(
         self, connection: "BlobStorageConnection", type_: type | None, *args: Any
     ) -> "BlobRetrievalByURL":
+        # third party
+        from azure.storage.blob import BlobSasPermissions
+        from azure.storage.blob import generate_blob_sas
+
         # SAS is almost the same thing as the presigned url
         config = connection.config.remote_profiles[self.azure_profile_name]
         account_name = config.account_name
@@ -9,6 +9,7 @@ from collections.abc import MutableMapping
 from collections.abc import MutableSequence
 from collections.abc import Sequence
 from collections.abc import Set
+from functools import cache
 from hashlib import sha256
 import inspect
 from inspect import Signature
@@ -104,6 +105,13 @@ def _get_optional_inner_type(x: Any) -> Any:
     return non_none[0] if len(non_none) == 1 else x
 
 
+@cache
+def _class_type_hints(cls: type) -> dict[str, Any]:
+    # resolving the annotations is slow, and objects like the service contexts
+    # are created on every api call
+    return typing.get_type_hints(cls)
+
+
 class SyftHashableObject:
     __hash_exclude_attrs__: list = []
 
@@ -228,6 +236,7 @@ class SyftObjectRegistry:
 class SyftMigrationRegistry:
     __migration_version_registry__: dict[str, dict[int, str]] = {}
     __migration_transform_registry__: dict[str, dict[str, Callable]] = {}
+    __migration_chain_cache__: dict[tuple, list[Callable]] = {}
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """
@@ -251,6 +260,7 @@ class SyftMigrationRegistry:
             mapping_string = klass.__canonical_name__
             klass_version = klass.__version__
             fqn = f"{klass.__module__}.{klass.__name__}"
+            cls.__migration_chain_cache__.clear()
 
             if (
                 mapping_string in cls.__migration_version_registry__
@@ -296,6 +306,7 @@ class SyftMigrationRegistry:
 
         if versions_exists:
             mapping_string = f"{version_from}x{version_to}"
+            cls.__migration_chain_cache__.clear()
             if klass_type_str not in cls.__migration_transform_registry__:
                 cls.__migration_transform_registry__[klass_type_str] = {}
             cls.__migration_transform_registry__[klass_type_str][mapping_string] = (
@@ -371,6 +382,35 @@ class SyftMigrationRegistry:
             f"version: {version_to} in the migration registry."
         )
 
+    @classmethod
+    def get_migration_chain(
+        cls, type_from: type[SyftBaseObject], versions: tuple[int, ...]
+    ) -> list[Callable]:
+        """
+        Transforms migrating `type_from` through each of `versions` in order,
+        resolved once per (type, versions) and reused afterwards.
+        """
+        cache_key = (type_from, versions)
+        if cache_key in cls.__migration_chain_cache__:
+            return cls.__migration_chain_cache__[cache_key]
+
+        migration_chain = [
+            cls.get_migration_for_version(type_from=type_from, version_to=versions[0])
+        ]
+        transforms = cls.__migration_transform_registry__[type_from.__canonical_name__]
+        for version_from, version_to in zip(versions, versions[1:]):
+            mapping_string = f"{version_from}x{version_to}"
+            if mapping_string not in transforms:
+                raise Exception(
+                    f"No migration found for class type: {type_from} from "
+                    f"version: {version_from} to version: {version_to} "
+                    "in the migration registry."
+                )
+            migration_chain.append(transforms[mapping_string])
+
+        cls.__migration_chain_cache__[cache_key] = migration_chain
+        return migration_chain
+
 
 print_type_cache: dict = defaultdict(list)
 
@@ -574,7 +614,7 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry, SyftMigrationRegistry):
             return
         # Validate and set private attributes
         # https://github.com/pydantic/pydantic/issues/2105
-        annotations = typing.get_type_hints(self.__class__)
+        annotations = _class_type_hints(self.__class__)
         for attr, decl in self.__private_attributes__.items():
             value = kwargs.get(attr, decl.get_default())
             var_annotation = annotations.get(attr)
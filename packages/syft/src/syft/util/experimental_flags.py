@@ -19,6 +19,8 @@ class ApacheArrowCompression(Enum):
 class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
+        # numeric arrays are sent as a raw buffer to peers that can read it
+        self._NUMPY_RAW_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
         self._CAN_REGISTER = str_to_bool(
             os.getenv(
@@ -39,6 +41,14 @@ class ExperimentalFlags:
     def APACHE_ARROW_TENSOR_SERDE(self, value: bool) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = value
 
+    @property
+    def NUMPY_RAW_SERDE(self) -> bool:
+        return self._NUMPY_RAW_SERDE
+
+    @NUMPY_RAW_SERDE.setter
+    def NUMPY_RAW_SERDE(self, value: bool) -> None:
+        self._NUMPY_RAW_SERDE = value
+
     @property
     def APACHE_ARROW_COMPRESSION(self) -> ApacheArrowCompression:
         return self._APACHE_ARROW_COMPRESSION
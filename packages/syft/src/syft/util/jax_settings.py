@@ -1,5 +1,13 @@
-# third party
-from jax.config import config
+# stdlib
+import os
+import sys
 
-# this ensures that jax_enable_x64 is set before we import and use it
-config.update("jax_enable_x64", True)
+# this ensures that jax_enable_x64 is set before we import and use it, jax reads it
+# from the environment on import so syft doesn't have to import jax
+os.environ.setdefault("JAX_ENABLE_X64", "True")
+
+if "jax" in sys.modules:
+    # third party
+    from jax.config import config
+
+    config.update("jax_enable_x64", True)
@@ -310,6 +310,66 @@ def test_networkx_backing_store_save_load_custom(verify_key: SyftVerifyKey) -> N
     os.remove(custom_in_mem_graph_config.client_config.file_path)
 
 
+def test_networkx_backing_store_incremental_persistence(
+    verify_key: SyftVerifyKey,
+) -> None:
+    client_conf = InMemoryStoreClientConfig(
+        filename=f"{UID()}_action_graph.bytes", path=tempfile.gettempdir()
+    )
+    graph_config = InMemoryGraphConfig()
+    graph_config.client_config = client_conf
+    file_path = client_conf.file_path
+    networkx_store = NetworkXBackingStore(store_config=graph_config, reset=True)
+    try:
+        nodes = [create_action_node(verify_key) for _ in range(3)]
+        for node in nodes:
+            networkx_store.set(uid=node.id, data=node)
+        networkx_store.add_edge(nodes[0].id, nodes[1].id)
+        networkx_store.add_edge(nodes[1].id, nodes[2].id)
+        networkx_store.remove_edge(nodes[1].id, nodes[2].id)
+        nodes[2].status = ExecutionStatus.DONE
+        networkx_store.update(uid=nodes[2].id, data=nodes[2])
+        networkx_store.delete(uid=nodes[0].id)
+
+        # mutations are appended to the log, the snapshot is left untouched
+        assert networkx_store._log_records == 8
+        snapshot_size = os.path.getsize(file_path)
+
+        networkx_store_2 = NetworkXBackingStore(store_config=graph_config)
+        assert networkx_store_2._db is None
+        assert networkx_store_2.nodes() == networkx_store.nodes()
+        assert networkx_store_2.edges() == networkx_store.edges()
+        assert networkx_store_2.get(nodes[2].id).status == ExecutionStatus.DONE
+
+        # a partially written record is ignored and dropped on load
+        log_size = os.path.getsize(f"{file_path}.log")
+        with open(f"{file_path}.log", "ab") as f:
+            f.write((100).to_bytes(8, "big") + b"partial")
+        networkx_store_3 = NetworkXBackingStore(store_config=graph_config)
+        assert networkx_store_3.nodes() == networkx_store.nodes()
+        assert os.path.getsize(f"{file_path}.log") == log_size
+
+        # so the records appended after it can be read back
+        appended_node = create_action_node(verify_key)
+        networkx_store_3.set(uid=appended_node.id, data=appended_node)
+        networkx_store_5 = NetworkXBackingStore(store_config=graph_config)
+        assert networkx_store_5.nodes() == networkx_store_3.nodes()
+        assert networkx_store_5.exists(appended_node.id)
+
+        # the log is compacted into a new snapshot once it grows too long
+        networkx_store_2.compaction_threshold = 2
+        new_node = create_action_node(verify_key)
+        networkx_store_2.set(uid=new_node.id, data=new_node)
+        assert networkx_store_2._log_records == 0
+        assert os.path.getsize(f"{file_path}.log") == 0
+        assert os.path.getsize(file_path) > snapshot_size
+        networkx_store_4 = NetworkXBackingStore(store_config=graph_config)
+        assert networkx_store_4.nodes() == networkx_store_2.nodes()
+    finally:
+        os.remove(file_path)
+        os.remove(f"{file_path}.log")
+
+
 def test_networkx_backing_store_subgraph(
     networkx_store_with_nodes: NetworkXBackingStore, verify_key: SyftVerifyKey
 ):
@@ -0,0 +1,83 @@
+# stdlib
+import os
+from typing import Any
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.client.api import debox_signed_syftapicall_response
+from syft.node.worker import Worker
+from syft.serde.deserialize import _deserialize
+from syft.serde.serialize import _serialize
+from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftSuccess
+
+# per-call overhead of Node.handle_api_call, run with `pytest --benchmark-only`
+pytest.importorskip("pytest_benchmark")
+
+CALL_CNT = 100
+RESULT_SIZES = [2**10, 2**20, 10 * 2**20, 100 * 2**20]
+
+
+def noop_method(context: AuthedServiceContext, *args: Any, **kwargs: Any) -> None:
+    return None
+
+
+def test_api_call_overhead_benchmark(benchmark, worker: Worker, monkeypatch) -> None:
+    # the method does nothing, so only signature checks, role and service config
+    # resolution are measured
+    root_client = worker.root_client
+    monkeypatch.setattr(worker, "get_service_method", lambda path: noop_method)
+    api_call = SyftAPICall(
+        node_uid=worker.id, path="user.get_current_user", args=[], kwargs={}
+    ).sign(root_client.credentials)
+
+    def _call() -> None:
+        for _ in range(CALL_CNT):
+            assert worker.handle_api_call_with_unsigned_result(api_call) is None
+
+    benchmark.group = "api call overhead"
+    benchmark(_call)
+
+
+def sign_and_verify(worker: Worker, result: bytes) -> None:
+    # what a result goes through from the node to the client
+    body = _serialize(SyftAPIData(data=result).sign(worker.signing_key), to_bytes=True)
+    signed_result = _deserialize(body, from_bytes=True)
+    assert debox_signed_syftapicall_response(signed_result) == result
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+def test_api_result_signing_benchmark(benchmark, worker: Worker, size: int) -> None:
+    result = os.urandom(size)
+    benchmark.group = "api result signing"
+    benchmark(sign_and_verify, worker, result)
+
+
+@sy.api_endpoint_method()
+def trivial_endpoint(context) -> int:
+    return 42
+
+
+def test_custom_endpoint_call_benchmark(benchmark, worker: Worker) -> None:
+    # the endpoint does nothing, so mostly loading its code and storing its state
+    # and result are measured
+    root_client = worker.root_client
+    endpoint = sy.TwinAPIEndpoint(
+        path="bench.query",
+        mock_function=trivial_endpoint,
+        private_function=trivial_endpoint,
+    )
+    result = root_client.api.services.api.add(endpoint=endpoint)
+    assert isinstance(result, SyftSuccess)
+
+    def _call() -> None:
+        for _ in range(CALL_CNT):
+            assert root_client.api.services.api.call("bench.query").get() == 42
+
+    benchmark.group = "custom endpoint calls"
+    benchmark(_call)
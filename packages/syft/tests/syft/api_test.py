@@ -7,6 +7,12 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.client.api import signed_digest
+from syft.node.credentials import SyftSigningKey
+from syft.serde.serialize import _serialize
 from syft.service.response import SyftAttributeError
 from syft.service.user.user import UserUpdate
 from syft.service.user.user_roles import ServiceRole
@@ -75,3 +81,52 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_signed_api_data() -> None:
+    signing_key = SyftSigningKey.generate()
+    signed = SyftAPIData(data=b"result").sign(signing_key)
+    assert signed.is_valid
+    assert signed.message.data == b"result"
+
+    # the signed bytes are the serialized message itself
+    serialized = _serialize(SyftAPIData(data=b"other"), to_bytes=True)
+    signed = SignedSyftAPICall.from_serialized(serialized, signing_key)
+    assert signed.serialized_message is serialized
+
+    # full message signatures of older clients are accepted
+    legacy = SignedSyftAPICall(
+        credentials=signing_key.verify_key,
+        serialized_message=serialized,
+        signature=signing_key.signing_key.sign(serialized).signature,
+    )
+    assert legacy.is_valid
+
+    tampered = SignedSyftAPICall(
+        credentials=signing_key.verify_key,
+        serialized_message=_serialize(SyftAPIData(data=b"forged"), to_bytes=True),
+        signature=signed.signature,
+    )
+    assert not tampered.is_valid
+
+
+@pytest.mark.parametrize(
+    "communication_protocol, digest",
+    [(None, False), (4, False), ("4", False), (5, True), ("dev", True)],
+)
+def test_api_result_signature_protocol(
+    worker, communication_protocol: int | str | None, digest: bool
+) -> None:
+    kwargs = {}
+    if communication_protocol is not None:
+        kwargs["communication_protocol"] = communication_protocol
+    call = SyftAPICall(node_uid=worker.id, path="metadata", args=[], kwargs=kwargs)
+    signed_result = worker.handle_api_call(call.sign(worker.root_client.credentials))
+    assert signed_result.is_valid
+
+    # callers on older protocols only accept signatures of the whole result
+    serialized_result = signed_result.serialized_message
+    signed_bytes = signed_digest(serialized_result) if digest else serialized_result
+    worker.signing_key.verify_key.verify_key.verify(
+        signed_bytes, signed_result.signature
+    )
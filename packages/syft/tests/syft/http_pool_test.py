@@ -0,0 +1,80 @@
+# stdlib
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from threading import Thread
+
+# third party
+import pytest
+
+# syft absolute
+from syft.client.http_pool import HTTPPoolConfig
+from syft.client.http_pool import close_http_sessions
+from syft.client.http_pool import configure_http_pool
+from syft.client.http_pool import get_http_pool_stats
+from syft.client.http_pool import get_http_session
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def http_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    close_http_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_session_shared_per_node(http_url):
+    session = get_http_session(http_url)
+    assert get_http_session(f"{http_url}/api/v2/api_call") is session
+    assert get_http_session("http://127.0.0.1:1") is not session
+
+
+def test_http_session_reuses_connections(http_url):
+    for _ in range(5):
+        response = get_http_session(http_url).get(f"{http_url}/api/v2/metadata")
+        assert response.content == b"ok"
+
+    stats = get_http_pool_stats(http_url)
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+    assert stats["reused"] == 4
+
+
+def test_configure_http_pool(http_url):
+    session = get_http_session(http_url)
+    config = configure_http_pool(pool_maxsize=2, read_timeout=5)
+    try:
+        assert config.pool_maxsize == 2
+        assert get_http_session(http_url) is not session
+        adapter = get_http_session(http_url).get_adapter(http_url)
+        assert adapter.timeout == (None, 5)
+    finally:
+        configure_http_pool(**HTTPPoolConfig().model_dump())
+
+
+def test_http_session_without_retries(http_url):
+    session = get_http_session(http_url, retries=False)
+    assert session is not get_http_session(http_url)
+    assert get_http_session(http_url, retries=False) is session
+
+    assert get_http_session(http_url).get_adapter(http_url).max_retries.total == 3
+    assert session.get_adapter(http_url).max_retries.total == 0
+
+    response = session.get(f"{http_url}/api/v2/metadata")
+    assert response.content == b"ok"
+    assert get_http_pool_stats(http_url)["requests"] == 1
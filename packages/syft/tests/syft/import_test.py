@@ -0,0 +1,99 @@
+# stdlib
+import json
+import subprocess  # nosec
+import sys
+
+# third party
+import jax.numpy as jnp
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+
+# budgets for a bare `import syft`, the optional dependencies are imported on first use.
+# The import takes about 3.5s, the time budget leaves room for a loaded machine
+IMPORT_TIME_BUDGET = 8  # seconds
+IMPORT_MODULE_BUDGET = 2400
+LAZY_MODULES = [
+    "azure.storage.blob",
+    "boto3",
+    "docker",
+    "fastapi",
+    "hagrid",
+    "itables",
+    "jax",
+    "kr8s",
+    "networkx",
+]
+
+
+def run_python(code: str) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)  # nosec
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_budget() -> None:
+    result = run_python(
+        f"""
+import json, sys
+import syft
+print(json.dumps({{
+    "module_cnt": len(sys.modules),
+    "imported": [m for m in {LAZY_MODULES!r} if m in sys.modules],
+}}))
+"""
+    )
+    assert result["imported"] == []
+    assert result["module_cnt"] < IMPORT_MODULE_BUDGET
+
+
+@pytest.mark.flaky(reruns=3, reruns_delay=3)
+def test_import_time_budget() -> None:
+    result = run_python(
+        """
+import json, time
+start = time.perf_counter()
+import syft
+print(json.dumps({"duration": time.perf_counter() - start}))
+"""
+    )
+    assert result["duration"] < IMPORT_TIME_BUDGET
+
+
+def test_lazy_third_party_serde() -> None:
+    objs = [
+        pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+        pd.Series([1.0, 2.0], name="a"),
+        pd.Timestamp("2024-01-01"),
+        jnp.array([1.0, 2.0]),
+        nx.DiGraph([(1, 2), (2, 3)]),
+    ]
+    blobs = [sy.serialize(obj, to_bytes=True) for obj in objs]
+
+    # a fresh process registers the types when deserializing them
+    result = run_python(
+        f"""
+import json, sys
+import syft
+objs = [syft.deserialize(blob, from_bytes=True) for blob in {blobs!r}]
+import jax
+print(json.dumps({{
+    "types": [type(obj).__name__ for obj in objs],
+    "x64": jax.config.jax_enable_x64,
+}}))
+"""
+    )
+    assert result["types"] == [type(obj).__name__ for obj in objs]
+    assert result["x64"]
+
+    df, series, timestamp, array, graph = (
+        sy.deserialize(blob, from_bytes=True) for blob in blobs
+    )
+    assert df.equals(objs[0])
+    assert series.equals(objs[1])
+    assert timestamp == objs[2]
+    assert np.array_equal(array, objs[3])
+    assert sorted(graph.edges) == sorted(objs[4].edges)
@@ -0,0 +1,64 @@
+# stdlib
+from pathlib import Path
+from secrets import token_hex
+from threading import Thread
+import time
+
+# third party
+import pytest
+
+# syft absolute
+from syft.store.locks import FileLockingConfig
+from syft.store.locks import LockingConfig
+from syft.store.locks import SyftLock
+from syft.store.locks import ThreadingLockingConfig
+
+# contention benchmarks of the store locks, run with `pytest --benchmark-only`
+pytest.importorskip("pytest_benchmark")
+
+THREAD_CNT = 4
+REPEATS = 50
+# time spent in the critical section, standing in for a store operation
+HOLD = 0.001
+
+
+def locking_config(name: str, tmp_path: Path) -> LockingConfig:
+    params = {"lock_name": token_hex(8), "timeout": 30, "retry_interval": 0.1}
+    if name == "threading":
+        return ThreadingLockingConfig(**params)
+    return FileLockingConfig(**params, client_path=tmp_path)
+
+
+def contend(lock: SyftLock) -> list[float]:
+    """Hand the lock over between threads, returning each handoff's latency"""
+    latencies: list[float] = []
+    released_at: list[float] = []
+
+    def _worker() -> None:
+        for _ in range(REPEATS):
+            assert lock.acquire(blocking=True)
+            if released_at:
+                latencies.append(time.perf_counter() - released_at[-1])
+            time.sleep(HOLD)
+            released_at.append(time.perf_counter())
+            lock.release()
+
+    threads = [Thread(target=_worker) for _ in range(THREAD_CNT)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+@pytest.mark.parametrize("name", ["threading", "file"])
+def test_lock_contention_benchmark(benchmark, tmp_path: Path, name: str) -> None:
+    lock = SyftLock(locking_config(name, tmp_path))
+    benchmark.group = "lock contention"
+
+    latencies = benchmark(contend, lock)
+    benchmark.extra_info["max_handoff_latency"] = max(latencies)
+    benchmark.extra_info["mean_handoff_latency"] = sum(latencies) / len(latencies)
+
+    # handoffs don't wait for a retry interval
+    assert sum(latencies) / len(latencies) < lock.retry_interval
@@ -9,8 +9,10 @@ import time
 import pytest
 
 # syft absolute
+from syft.store.locks import FileLockingConfig
 from syft.store.locks import LockingConfig
 from syft.store.locks import NoLockingConfig
+from syft.store.locks import ReadWriteLockingConfig
 from syft.store.locks import SyftLock
 from syft.store.locks import ThreadingLockingConfig
 
@@ -34,11 +36,25 @@ def locks_threading_config(request):
     yield ThreadingLockingConfig(**def_params)
 
 
+@pytest.fixture(scope="function")
+def locks_read_write_config(request):
+    def_params["lock_name"] = token_hex(8)
+    yield ReadWriteLockingConfig(**def_params)
+
+
+@pytest.fixture(scope="function")
+def locks_file_config(request, tmp_path: Path):
+    def_params["lock_name"] = token_hex(8)
+    yield FileLockingConfig(**def_params, client_path=tmp_path)
+
+
 @pytest.mark.parametrize(
     "config",
     [
         pytest.lazy_fixture("locks_nop_config"),
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 def test_sanity(config: LockingConfig):
@@ -72,6 +88,8 @@ def test_acquire_nop(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -98,6 +116,8 @@ def test_acquire_release(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -139,6 +159,7 @@ def test_acquire_expire(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -185,6 +206,8 @@ def test_acquire_double_aqcuire_timeout_ok(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -223,17 +246,111 @@ def test_acquire_double_aqcuire_retry_interval(config: LockingConfig):
     acq_ok = lock.acquire(blocking=True)
     assert acq_ok
 
-    not_acq = lock.acquire(blocking=True)
+    # waiters block on the lock itself, so the retry interval doesn't delay them
+    start = time.monotonic()
+    also_acq = lock.acquire(blocking=True)
+    elapsed = time.monotonic() - start
 
     lock.release()
 
-    assert not not_acq
+    assert also_acq
+    assert elapsed < config.retry_interval
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
+        pytest.lazy_fixture("locks_file_config"),
+    ],
+)
+def test_acquire_handoff(config: LockingConfig):
+    config.timeout = 5
+    config.retry_interval = 1
+    lock = SyftLock(config)
+    assert lock.acquire(blocking=True)
+
+    acquired_at = []
+
+    def _waiter() -> None:
+        if lock.acquire(blocking=True):
+            acquired_at.append(time.monotonic())
+            lock.release()
+
+    waiter = Thread(target=_waiter)
+    waiter.start()
+    time.sleep(0.2)
+    released_at = time.monotonic()
+    lock.release()
+    waiter.join()
+
+    assert len(acquired_at) == 1
+    assert acquired_at[0] - released_at < config.retry_interval / 2
+
+
+def test_read_write_lock_shared_reads(locks_read_write_config: LockingConfig):
+    lock = SyftLock(locks_read_write_config)
+
+    assert lock.acquire_read(blocking=False)
+    assert lock.acquire_read(blocking=False)
+    assert not lock.acquire(blocking=False)
+
+    lock.release_read()
+    lock.release_read()
+    assert lock.acquire(blocking=False)
+    assert not lock.acquire_read(blocking=False)
+    lock.release()
+    assert not lock.locked()
+
+
+def test_read_write_lock_writer_preference(locks_read_write_config: LockingConfig):
+    lock = SyftLock(locks_read_write_config)
+    assert lock.acquire_read(blocking=True)
+
+    writer = Thread(target=lambda: lock.acquire(blocking=True) and lock.release())
+    writer.start()
+    time.sleep(0.2)
+
+    # new readers wait for the waiting writer, so it isn't starved
+    assert not lock.acquire_read(blocking=False)
+    lock.release_read()
+    writer.join()
+
+    assert lock.acquire_read(blocking=False)
+    lock.release_read()
+
+
+def test_read_lock_falls_back_to_exclusive(locks_threading_config: LockingConfig):
+    lock = SyftLock(locks_threading_config)
+
+    assert lock.acquire_read(blocking=False)
+    assert not lock.acquire_read(blocking=False)
+    lock.release_read()
+    assert not lock.locked()
+
+
+def test_file_lock_shared_between_instances(locks_file_config: LockingConfig):
+    # separate instances hold separate file descriptors, like separate processes
+    lock1 = SyftLock(locks_file_config)
+    lock2 = SyftLock(locks_file_config)
+
+    assert lock1.acquire(blocking=False)
+    assert lock2.locked()
+    assert not lock2.acquire(blocking=False)
+
+    lock1.release()
+    assert not lock2.locked()
+    assert lock2.acquire(blocking=False)
+    lock2.release()
 
 
 @pytest.mark.parametrize(
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_read_write_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -250,6 +367,7 @@ def test_acquire_double_release(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -0,0 +1,52 @@
+# stdlib
+from copy import copy
+from unittest import mock
+
+# syft absolute
+from syft.protocol.data_protocol import TYPE_BANK
+from syft.protocol.data_protocol import clear_data_protocol_cache
+from syft.protocol.data_protocol import debox_arg_and_migrate
+from syft.protocol.data_protocol import get_data_protocol
+from syft.service.settings.settings import NodeSettingsUpdate
+from syft.service.settings.settings import NodeSettingsUpdateV2
+from syft.types.syft_object import SyftMigrationRegistry
+
+
+def test_data_protocol_cached():
+    data_protocol = get_data_protocol()
+    assert get_data_protocol() is data_protocol
+
+    protocol = data_protocol.latest_version
+    protocol_state = data_protocol.get_protocol_state(protocol)
+    assert data_protocol.get_protocol_state(protocol) is protocol_state
+    assert protocol_state == data_protocol.build_state(stop_key=str(protocol))
+
+    # registering new types invalidates the cached protocol
+    with mock.patch("syft.protocol.data_protocol.TYPE_BANK", copy(TYPE_BANK)):
+        assert get_data_protocol() is not data_protocol
+
+    clear_data_protocol_cache()
+    assert get_data_protocol() is not data_protocol
+
+
+def test_migration_chain_cached():
+    migration_chain = SyftMigrationRegistry.get_migration_chain(
+        type_from=NodeSettingsUpdateV2, versions=(3,)
+    )
+    assert migration_chain == [
+        SyftMigrationRegistry.get_migration_for_version(
+            type_from=NodeSettingsUpdateV2, version_to=3
+        )
+    ]
+    assert (
+        SyftMigrationRegistry.get_migration_chain(
+            type_from=NodeSettingsUpdateV2, versions=(3,)
+        )
+        is migration_chain
+    )
+
+    settings_update = NodeSettingsUpdateV2(name="test")
+    protocol_state = {"NodeSettingsUpdate": {"2": ("hash", "1"), "3": ("hash", "2")}}
+    migrated = debox_arg_and_migrate(settings_update, protocol_state)
+    assert isinstance(migrated, NodeSettingsUpdate)
+    assert migrated.name == "test"
@@ -0,0 +1,64 @@
+# stdlib
+from secrets import token_hex
+import time
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.service.policy.policy import OutputPolicyExecuteCount
+
+# throughput of the queue consumers, run with `pytest --benchmark-only`
+pytest.importorskip("pytest_benchmark")
+
+JOB_CNT = 10
+ROUNDS = 3
+CONSUMER_CNT = 2
+
+
+@pytest.fixture
+def queue_worker():
+    worker = sy.Worker(
+        name=token_hex(8),
+        # the consumers' worker nodes share the sqlite stores of the node
+        local_db=True,
+        n_consumers=CONSUMER_CNT,
+        create_producer=True,
+        queue_port=None,
+        in_memory_workers=True,
+    )
+    yield worker
+    worker.cleanup()
+
+
+def run_jobs(root_client: sy.DomainClient) -> float:
+    start = time.time()
+    jobs = [root_client.code.compute(blocking=False) for _ in range(JOB_CNT)]
+    for job in jobs:
+        job.wait(timeout=60)
+        assert job.result.get() == 42
+    return JOB_CNT / (time.time() - start)
+
+
+def test_queue_throughput_benchmark(benchmark, queue_worker: sy.Worker) -> None:
+    # every message goes through the consumers' worker node, so this mostly
+    # measures the per-message overhead of handling a job
+    root_client = queue_worker.root_client
+
+    @sy.syft_function(
+        input_policy=sy.ExactMatch(),
+        output_policy=OutputPolicyExecuteCount(limit=JOB_CNT * (ROUNDS + 1)),
+    )
+    def compute() -> int:
+        return 42
+
+    root_client.code.request_code_execution(compute)
+    root_client.requests[-1].approve()
+
+    messages_per_sec = []
+    benchmark.group = "queue throughput"
+    benchmark.pedantic(
+        lambda: messages_per_sec.append(run_jobs(root_client)), rounds=ROUNDS
+    )
+    benchmark.extra_info["messages_per_sec"] = max(messages_per_sec)
@@ -116,6 +116,8 @@ def test_requeststash_get_all_for_verify_key_find_index_fail(
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: PartitionKey | None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> Err:
         return Err(mock_error_message)
 
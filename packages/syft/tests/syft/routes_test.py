@@ -0,0 +1,112 @@
+# stdlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any
+
+# third party
+import anyio
+import pytest
+
+# syft absolute
+from syft.client.api import SIGNATURE_HEADER
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPICall
+from syft.client.api import debox_signed_syftapicall_response
+from syft.node.routes import make_routes
+from syft.node.server import make_app
+from syft.node.worker import Worker
+from syft.serde.deserialize import _deserialize
+from syft.serde.serialize import _serialize
+from syft.service.context import AuthedServiceContext
+
+# the requests are sent to the app in-process, like the TestClient of starlette does
+httpx = pytest.importorskip("httpx")
+
+CALL_CNT = 4
+# how long each of the api calls takes
+CALL_TIME = 1.0
+
+
+def slow_method(context: AuthedServiceContext, *args: Any, **kwargs: Any) -> str:
+    time.sleep(CALL_TIME)
+    return "done"
+
+
+async def call_concurrently(app: Any, body: bytes) -> tuple[list, float]:
+    # as many threads for the sync routes as there are calls, so running the calls
+    # there would leave none for the healthcheck
+    anyio.to_thread.current_default_thread_limiter().total_tokens = CALL_CNT
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def _call() -> Any:
+            response = await client.post("/api/v2/api_call", content=body)
+            signed_result = _deserialize(response.content, from_bytes=True)
+            assert isinstance(signed_result, SignedSyftAPICall)
+            return debox_signed_syftapicall_response(signed_result)
+
+        async def _healthcheck() -> float:
+            await asyncio.sleep(CALL_TIME / 4)
+            start = time.time()
+            response = await client.get("/api/v2/")
+            assert response.json() == {"status": "ok"}
+            return time.time() - start
+
+        *results, healthcheck_time = await asyncio.gather(
+            *[_call() for _ in range(CALL_CNT)], _healthcheck()
+        )
+    return results, healthcheck_time
+
+
+def test_api_calls_run_concurrently(worker: Worker, monkeypatch) -> None:
+    root_client = worker.root_client
+    monkeypatch.setattr(worker, "get_service_method", lambda path: slow_method)
+    api_call = SyftAPICall(
+        node_uid=worker.id, path="user.get_current_user", args=[], kwargs={}
+    ).sign(root_client.credentials)
+    body = _serialize(api_call, to_bytes=True)
+
+    router = make_routes(worker, executor=ThreadPoolExecutor(max_workers=CALL_CNT))
+    app = make_app(worker.name, router=router)
+
+    start = time.time()
+    results, healthcheck_time = asyncio.run(call_concurrently(app, body))
+
+    assert results == ["done"] * CALL_CNT
+    assert time.time() - start < 2 * CALL_TIME
+    # the healthcheck doesn't wait for the api calls
+    assert healthcheck_time < CALL_TIME / 4
+
+
+async def post_api_call(app: Any, body: bytes) -> Any:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post("/api/v2/api_call", content=body)
+
+
+@pytest.mark.parametrize("communication_protocol,raw_body", [(4, False), ("dev", True)])
+def test_api_call_response_body(
+    worker: Worker, communication_protocol: int | str, raw_body: bool
+) -> None:
+    api_call = SyftAPICall(
+        node_uid=worker.id,
+        path="metadata",
+        args=[],
+        kwargs={"communication_protocol": communication_protocol},
+    ).sign(worker.root_client.credentials)
+    app = make_app(worker.name, router=make_routes(worker))
+
+    response = asyncio.run(post_api_call(app, _serialize(api_call, to_bytes=True)))
+    assert response.status_code == 200
+    # newer callers get the serialized result as the body, older ones the envelope
+    assert (SIGNATURE_HEADER in response.headers) is raw_body
+    signed_result = SignedSyftAPICall.from_headers(response.headers, response.content)
+    if not raw_body:
+        assert signed_result is None
+        signed_result = _deserialize(response.content, from_bytes=True)
+
+    assert isinstance(signed_result, SignedSyftAPICall)
+    assert signed_result.credentials == worker.signing_key.verify_key
+    result = debox_signed_syftapicall_response(signed_result)
+    assert result.id == worker.metadata.id
@@ -0,0 +1,113 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import NUMPY_RAW_MAGIC
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_raw_serde
+from syft.serde.arrow import numpy_serialize
+from syft.serde.arrow import writeable_array
+from syft.util.experimental_flags import flags
+
+ARRAYS = [
+    np.array(3.5),
+    np.array([], dtype=np.int32),
+    np.arange(24, dtype=np.int64).reshape(2, 3, 4),
+    np.arange(12, dtype=np.float32).reshape(3, 4).T,
+    np.arange(6, dtype=">i4"),
+    np.array([1 + 2j, 3 - 4j]),
+    np.array([True, False, True]),
+    np.array(["2024-01-01", "2024-06-30"], dtype="datetime64[D]"),
+    np.array([b"ab", b"cde"]),
+]
+
+
+@pytest.fixture
+def raw_numpy_serde():
+    with numpy_raw_serde("dev"):
+        yield
+
+
+@pytest.mark.usefixtures("raw_numpy_serde")
+@pytest.mark.parametrize("array", ARRAYS)
+def test_numpy_raw_roundtrip(array: np.ndarray) -> None:
+    buf = numpy_serialize(array)
+    assert buf.startswith(NUMPY_RAW_MAGIC)
+
+    result = numpy_deserialize(buf)
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert np.array_equal(result, array)
+
+    result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+    assert np.array_equal(result, array)
+
+
+@pytest.mark.usefixtures("raw_numpy_serde")
+def test_numpy_raw_zero_copy() -> None:
+    array = np.arange(10)
+    buf = numpy_serialize(array)
+    result = numpy_deserialize(buf)
+    # the result is a read-only view of the serialized buffer
+    assert not result.flags.writeable
+    assert np.shares_memory(result, np.frombuffer(buf, dtype=np.uint8))
+
+    copy = writeable_array(result)
+    assert copy.flags.writeable
+    assert not np.shares_memory(copy, result)
+    copy[0] = 42
+    assert result[0] == 0
+    assert writeable_array(copy) is copy
+
+
+@pytest.mark.parametrize(
+    "communication_protocol,raw", [(None, False), (4, False), (5, True), ("dev", True)]
+)
+def test_numpy_raw_protocol_gate(communication_protocol, raw: bool) -> None:
+    # peers on older protocols can only read arrow payloads
+    array = np.arange(100, dtype=np.float64).reshape(10, 10)
+    with numpy_raw_serde(communication_protocol):
+        buf = numpy_serialize(array)
+    assert buf.startswith(NUMPY_RAW_MAGIC) is raw
+    assert np.array_equal(numpy_deserialize(buf), array)
+
+
+@pytest.mark.usefixtures("raw_numpy_serde")
+def test_numpy_raw_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(flags, "NUMPY_RAW_SERDE", False)
+    array = np.arange(10)
+    buf = numpy_serialize(array)
+    assert not buf.startswith(NUMPY_RAW_MAGIC)
+    result = numpy_deserialize(buf)
+    assert result.flags.writeable
+    assert np.array_equal(result, array)
+
+
+def test_numpy_arrow_format_is_default() -> None:
+    array = np.arange(100, dtype=np.float64).reshape(10, 10)
+    buf = numpy_serialize(array)
+    assert not buf.startswith(NUMPY_RAW_MAGIC)
+    assert np.array_equal(numpy_deserialize(buf), array)
+
+
+def test_numpy_multi_chunk_roundtrip(monkeypatch: pytest.MonkeyPatch) -> None:
+    # force the array buffer to be split over several capnp chunks
+    monkeypatch.setattr(sy.serde.recursive, "CAPNP_DATA_CHUNK_SIZE", 1000)
+    array = np.random.rand(10_000)
+
+    result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+    assert np.array_equal(result, array)
+
+
+@pytest.mark.usefixtures("raw_numpy_serde")
+def test_jax_raw_roundtrip() -> None:
+    jnp = pytest.importorskip("jax.numpy")
+    array = jnp.arange(12.0).reshape(3, 4)
+    blob = sy.serialize(array, to_bytes=True)
+    assert NUMPY_RAW_MAGIC in blob
+
+    result = sy.deserialize(blob, from_bytes=True)
+    assert type(result) is type(array)
+    assert np.array_equal(result, array)
@@ -0,0 +1,55 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.domain_client import DomainClient
+from syft.service.action.action_object import ActionObject
+from syft.service.job.job_stash import Job
+from syft.types.uid import UID
+
+# micro-benchmarks of the recursive serde, run with `pytest --benchmark-only`
+pytest.importorskip("pytest_benchmark")
+
+
+@sy.syft_function(
+    input_policy=sy.ExactMatch(), output_policy=sy.SingleExecutionExactOutput()
+)
+def benchmark_syft_func():
+    return 1
+
+
+@pytest.fixture
+def user_code(root_domain_client: DomainClient):
+    root_domain_client.code.submit(benchmark_syft_func)
+    return root_domain_client.code.get_by_service_func_name("benchmark_syft_func")[0]
+
+
+def syft_objects(user_code) -> dict:
+    return {
+        "SyftAPICall": SyftAPICall(
+            node_uid=UID(),
+            path="action.get",
+            args=[UID()],
+            kwargs={"resolve": True},
+        ),
+        "Job": Job(id=UID(), node_uid=UID()),
+        "UserCode": user_code,
+        "ActionObject": ActionObject.from_obj(np.arange(100)),
+    }
+
+
+@pytest.mark.parametrize("name", ["SyftAPICall", "Job", "UserCode", "ActionObject"])
+def test_serialize_benchmark(benchmark, user_code, name: str) -> None:
+    obj = syft_objects(user_code)[name]
+    benchmark.group = "serialize"
+    benchmark(sy.serialize, obj, to_bytes=True)
+
+
+@pytest.mark.parametrize("name", ["SyftAPICall", "Job", "UserCode", "ActionObject"])
+def test_deserialize_benchmark(benchmark, user_code, name: str) -> None:
+    blob = sy.serialize(syft_objects(user_code)[name], to_bytes=True)
+    benchmark.group = "deserialize"
+    benchmark(sy.deserialize, blob, from_bytes=True)
@@ -0,0 +1,48 @@
+# syft absolute
+import syft as sy
+from syft.node.worker import Worker
+from syft.service.api import api as api_module
+from syft.service.response import SyftSuccess
+
+
+@sy.api_endpoint_method()
+def mock_function(context) -> int:
+    return -42
+
+
+@sy.api_endpoint_method()
+def private_function(context) -> int:
+    return 42
+
+
+@sy.api_endpoint_method()
+def updated_private_function(context) -> int:
+    return 43
+
+
+def add_endpoint(worker: Worker, path: str) -> None:
+    endpoint = sy.TwinAPIEndpoint(
+        path=path, mock_function=mock_function, private_function=private_function
+    )
+    result = worker.root_client.api.services.api.add(endpoint=endpoint)
+    assert isinstance(result, SyftSuccess)
+
+
+def test_endpoint_function_cache(worker: Worker, monkeypatch) -> None:
+    monkeypatch.setattr(api_module, "ENDPOINT_FUNCTION_CACHE", {})
+    add_endpoint(worker, "test.query")
+    # the endpoint is called directly, the client calls it in jobs
+    api = worker.root_client.api.services.api
+
+    for _ in range(2):
+        assert api.call_private("test.query").get() == 42
+        assert api.call_public("test.query").get() == -42
+    # one function for the private and one for the mock code
+    assert len(api_module.ENDPOINT_FUNCTION_CACHE) == 2
+
+    result = api.update(
+        endpoint_path="test.query", private_function=updated_private_function
+    )
+    assert isinstance(result, SyftSuccess)
+    assert api_module.ENDPOINT_FUNCTION_CACHE == {}
+    assert api.call_private("test.query").get() == 43
@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 
 # syft absolute
+import syft as sy
 from syft.node.credentials import SyftVerifyKey
 from syft.service.action.action_store import ActionObjectEXECUTE
 from syft.service.action.action_store import ActionObjectOWNER
@@ -142,3 +143,21 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+def test_action_store_serde(dict_action_store: Any) -> None:
+    client_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_CLIENT)
+
+    # the lock is not serialized, it is recreated from the store config
+    store = sy.deserialize(
+        sy.serialize(dict_action_store, to_bytes=True), from_bytes=True
+    )
+    assert store.lock.lock_name == dict_action_store.lock.lock_name
+
+    data_uid = UID()
+    obj = MockSyftObject(data=1)
+    res = store.set(data_uid, client_key, obj, has_result_read_permission=True)
+    assert res.is_ok()
+    res = store.get(data_uid, client_key)
+    assert res.is_ok()
+    assert res.ok() == obj
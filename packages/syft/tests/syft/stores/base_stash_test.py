@@ -2,6 +2,7 @@
 from collections.abc import Callable
 from collections.abc import Container
 import random
+from secrets import token_hex
 from typing import Any
 from typing import TypeVar
 
@@ -12,6 +13,7 @@ from typing_extensions import ParamSpec
 
 # syft absolute
 from syft.serde.serializable import serializable
+from syft.service.action.action_permissions import ActionObjectREAD
 from syft.service.response import SyftSuccess
 from syft.store.dict_document_store import DictDocumentStore
 from syft.store.document_store import BaseUIDStoreStash
@@ -20,6 +22,9 @@ from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKey
 from syft.store.document_store import QueryKeys
 from syft.store.document_store import UIDPartitionKey
+from syft.store.mongo_client import MongoStoreClientConfig
+from syft.store.mongo_document_store import MongoDocumentStore
+from syft.store.mongo_document_store import MongoStoreConfig
 from syft.types.syft_object import SyftObject
 from syft.types.uid import UID
 
@@ -80,6 +85,20 @@ def base_stash(root_verify_key) -> MockStash:
     yield MockStash(store=DictDocumentStore(UID(), root_verify_key))
 
 
+@pytest.fixture(params=["dict", "mongo"])
+def any_store_stash(root_verify_key, request) -> MockStash:
+    if request.param == "dict":
+        store = DictDocumentStore(UID(), root_verify_key)
+    else:
+        mongo_client = request.getfixturevalue("mongo_client")
+        store_config = MongoStoreConfig(
+            client_config=MongoStoreClientConfig(client=mongo_client),
+            db_name=token_hex(8),
+        )
+        store = MongoDocumentStore(UID(), root_verify_key, store_config=store_config)
+    yield MockStash(store=store)
+
+
 def random_sentence(faker: Faker) -> str:
     return faker.paragraph(nb_sentences=1)
 
@@ -444,3 +463,96 @@ def test_basestash_cannot_query_non_searchable(
     assert base_stash.query_all(
         root_verify_key, QueryKeys(qks=[qk, UIDPartitionKey.with_obj(obj.id)])
     ).is_err()
+
+
+def test_basestash_count_exists_projection(
+    root_verify_key,
+    guest_verify_key,
+    any_store_stash: MockStash,
+    mock_objects: list[MockObject],
+    faker: Faker,
+) -> None:
+    stash = any_store_stash
+    desc = random_sentence(faker)
+    similar_objects = [
+        MockObject(**kwargs) for kwargs in multiple_object_kwargs(faker, n=3, desc=desc)
+    ]
+    for obj in mock_objects + similar_objects:
+        add_mock_object(root_verify_key, stash, obj)
+
+    desc_qk = QueryKey.from_obj(DescPartitionKey, desc)
+    assert stash.count(root_verify_key).ok() == len(mock_objects) + 3
+    assert stash.count(root_verify_key, desc_qk).ok() == 3
+    assert stash.exists(root_verify_key, desc_qk).ok()
+    assert stash.exists(
+        root_verify_key, UIDPartitionKey.with_obj(similar_objects[0].id)
+    ).ok()
+
+    random_desc = create_unique(
+        random_sentence, [obj.desc for obj in mock_objects], faker
+    )
+    random_desc_qk = QueryKey.from_obj(DescPartitionKey, random_desc)
+    assert stash.count(root_verify_key, random_desc_qk).ok() == 0
+    assert not stash.exists(root_verify_key, random_desc_qk).ok()
+
+    # objects that can't be read are not counted
+    assert stash.count(guest_verify_key).ok() == 0
+    assert not stash.exists(guest_verify_key, desc_qk).ok()
+
+    result = stash.query_projection(
+        root_verify_key, desc_qk, keys=["id", "name"], order_by=NamePartitionKey
+    )
+    assert result.is_ok()
+    assert result.ok() == [
+        {"id": obj.id, "name": obj.name}
+        for obj in sorted(similar_objects, key=lambda obj: obj.name)
+    ]
+
+    # only indexed keys can be projected
+    assert stash.query_projection(root_verify_key, desc_qk, keys=["value"]).is_err()
+
+
+@pytest.mark.parametrize("limit, offset", [(3, 0), (3, 4), (None, 2), (20, 8)])
+def test_basestash_paginate(
+    root_verify_key,
+    guest_verify_key,
+    any_store_stash: MockStash,
+    mock_objects: list[MockObject],
+    limit: int | None,
+    offset: int,
+) -> None:
+    stash = any_store_stash
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, stash, obj)
+    for obj in mock_objects[::2]:
+        stash.add_permission(ActionObjectREAD(uid=obj.id, credentials=guest_verify_key))
+
+    def page(objs: list[MockObject]) -> list[MockObject]:
+        return objs[offset:] if limit is None else objs[offset : offset + limit]
+
+    for credentials in [root_verify_key, guest_verify_key]:
+        all_objs = stash.get_all(credentials).ok()
+        assert stash.get_all(credentials, limit=limit, offset=offset).ok() == page(
+            all_objs
+        )
+
+        sorted_objs = stash.get_all(credentials, order_by=NamePartitionKey).ok()
+        assert sorted_objs == sorted(all_objs, key=lambda obj: obj.name)
+        result = stash.get_all(
+            credentials, order_by=NamePartitionKey, limit=limit, offset=offset
+        )
+        assert result.ok() == page(sorted_objs)
+
+    # the pages of a query follow the order of its unpaginated results
+    importance_qk = QueryKey.from_obj(
+        ImportancePartitionKey, mock_objects[0].importance
+    )
+    matches = stash.query_all(root_verify_key, importance_qk).ok()
+    paged = [
+        obj
+        for offset_ in range(0, len(matches), 2)
+        for obj in stash.query_all(
+            root_verify_key, importance_qk, limit=2, offset=offset_
+        ).ok()
+    ]
+    assert paged == matches
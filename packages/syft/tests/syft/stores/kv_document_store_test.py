@@ -128,6 +128,21 @@ def test_kv_store_partition_delete(
     assert len(kv_store_partition.all(root_verify_key).ok()) == 0
 
 
+def test_kv_store_partition_delete_without_storage_permission(
+    root_verify_key, kv_store_partition: KeyValueStorePartition
+) -> None:
+    obj = MockSyftObject(data=1)
+    res = kv_store_partition.set(root_verify_key, obj, add_storage_permission=False)
+    assert res.is_ok()
+
+    key = kv_store_partition.settings.store_key.with_obj(obj)
+    res = kv_store_partition.delete(root_verify_key, key)
+    assert res.is_ok()
+    assert len(kv_store_partition.data) == 0
+    assert len(kv_store_partition.permissions) == 0
+    assert len(kv_store_partition.all(root_verify_key).ok()) == 0
+
+
 def test_kv_store_partition_delete_and_recreate(
     root_verify_key, worker, kv_store_partition: KeyValueStorePartition
 ) -> None:
@@ -1,4 +1,5 @@
 # stdlib
+from collections.abc import Callable
 from secrets import token_hex
 from threading import Thread
 
@@ -8,6 +9,7 @@ from result import Err
 
 # syft absolute
 from syft.node.credentials import SyftVerifyKey
+from syft.serde.serializable import serializable
 from syft.service.action.action_permissions import ActionObjectPermission
 from syft.service.action.action_permissions import ActionPermission
 from syft.service.action.action_permissions import StoragePermission
@@ -21,6 +23,8 @@ from syft.store.document_store import QueryKeys
 from syft.store.mongo_client import MongoStoreClientConfig
 from syft.store.mongo_document_store import MongoStoreConfig
 from syft.store.mongo_document_store import MongoStorePartition
+from syft.types.syft_object import SYFT_OBJECT_VERSION_2
+from syft.types.syft_object import SyftObject
 from syft.types.uid import UID
 
 # relative
@@ -37,6 +41,45 @@ PERMISSIONS = [
     ActionObjectEXECUTE,
 ]
 
+MONGO_COLLECTION_METHODS = [
+    "find",
+    "find_one",
+    "insert_one",
+    "update_one",
+    "delete_one",
+    "bulk_write",
+]
+
+
+@serializable()
+class MockUniqueSyftObject(SyftObject):
+    __canonical_name__ = f"MockUniqueSyftObject_{UID()}"
+    __version__ = SYFT_OBJECT_VERSION_2
+    __attr_unique__ = ["name", "email"]
+
+    name: str
+    email: str
+
+
+def count_queries(
+    monkeypatch: pytest.MonkeyPatch, method_names: list[str]
+) -> list[str]:
+    """Record the name of every call to `method_names` on mongomock collections"""
+    queries: list[str] = []
+
+    def counted(method_name: str) -> Callable:
+        method = getattr(MongoCollection, method_name)
+
+        def wrapper(self, *args, **kwargs):
+            queries.append(method_name)
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    for method_name in method_names:
+        monkeypatch.setattr(MongoCollection, method_name, counted(method_name))
+    return queries
+
 
 def test_mongo_store_partition_sanity(
     mongo_store_partition: MongoStorePartition,
@@ -138,6 +181,131 @@ def test_mongo_store_partition_set(
         )
 
 
+def test_mongo_store_partition_set_query_count(
+    root_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    queries = count_queries(monkeypatch, MONGO_COLLECTION_METHODS)
+    obj = MockSyftObject(data=1)
+    res = mongo_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+    assert res.is_ok()
+    # the document, its permissions and its storage permissions
+    assert queries == ["insert_one", "update_one", "update_one"]
+
+    queries.clear()
+    res = mongo_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+    assert res.is_err()
+    assert queries == ["insert_one"]
+
+    for permission in PERMISSIONS:
+        assert mongo_store_partition.has_permission(
+            permission(uid=obj.id, credentials=root_verify_key)
+        )
+
+
+def unique_store_partition(
+    root_verify_key: SyftVerifyKey, mongo_client
+) -> MongoStorePartition:
+    mongo_config = MongoStoreClientConfig(client=mongo_client)
+    store_config = MongoStoreConfig(client_config=mongo_config, db_name=token_hex(8))
+    settings = PartitionSettings(name="test", object_type=MockUniqueSyftObject)
+    return MongoStorePartition(
+        UID(), root_verify_key, settings=settings, store_config=store_config
+    )
+
+
+def test_mongo_store_partition_set_unique_keys(
+    root_verify_key: SyftVerifyKey, mongo_client
+) -> None:
+    store = unique_store_partition(root_verify_key, mongo_client)
+    res = store.init_store()
+    assert res.is_ok()
+
+    obj = MockUniqueSyftObject(name="alice", email="alice@openmined.org")
+    assert store.set(root_verify_key, obj).is_ok()
+
+    # a duplicate of any of the unique keys is rejected
+    for duplicate in [
+        MockUniqueSyftObject(name="alice", email="bob@openmined.org"),
+        MockUniqueSyftObject(name="bob", email="alice@openmined.org"),
+    ]:
+        res = store.set(root_verify_key, duplicate)
+        assert res.is_err()
+        assert "Duplication Key Error" in res.err()
+        assert store.set(root_verify_key, duplicate, ignore_duplicates=True).is_ok()
+
+    obj2 = MockUniqueSyftObject(name="bob", email="bob@openmined.org")
+    assert store.set(root_verify_key, obj2).is_ok()
+    assert len(store.all(root_verify_key).ok()) == 2
+
+
+def test_mongo_store_partition_set_owned_uid(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    # permissions exist for a UID that is not stored
+    obj = MockSyftObject(data=1)
+    mongo_store_partition.add_permission(
+        ActionObjectWRITE(uid=obj.id, credentials=guest_verify_key)
+    )
+
+    # nobody can store it, not even a writer
+    for credentials in [guest_verify_key, root_verify_key]:
+        res = mongo_store_partition.set(credentials, obj, ignore_duplicates=False)
+        assert res.is_err()
+        assert "No permission" in res.err()
+    assert len(mongo_store_partition.all(root_verify_key).ok()) == 0
+    assert not mongo_store_partition.has_permission(
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key)
+    )
+
+
+def test_mongo_store_partition_migrate_compound_index(
+    root_verify_key: SyftVerifyKey, mongo_client
+) -> None:
+    store = unique_store_partition(root_verify_key, mongo_client)
+    assert store.init_store().is_ok()
+    collection = store.collection.ok()
+    object_name = MockUniqueSyftObject.__canonical_name__
+    compound_index_name = f"{object_name}_index_name"
+    attr_index_names = {
+        f"{object_name}_{attr}_index_name"
+        for attr in MockUniqueSyftObject.__attr_unique__
+    }
+
+    # the compound index of older versions
+    for index_name in attr_index_names:
+        collection.drop_index(index_name)
+    compound_keys = [("name", 1), ("email", 1)]
+    collection.create_index(compound_keys, unique=True, name=compound_index_name)
+    assert store.init_store().is_ok()
+    assert set(collection.index_information()) == attr_index_names | {"_id_"}
+
+    # documents that only the compound index allows keep it in place
+    for index_name in attr_index_names:
+        collection.drop_index(index_name)
+    collection.create_index(compound_keys, unique=True, name=compound_index_name)
+    collection.insert_many(
+        [
+            {"name": "alice", "email": "alice@openmined.org"},
+            {"name": "alice", "email": "bob@openmined.org"},
+        ]
+    )
+    res = store.init_store()
+    assert res.is_err()
+    indexes = collection.index_information()
+    assert set(indexes) == {compound_index_name, "_id_"}
+    assert indexes[compound_index_name]["key"] == compound_keys
+
+
 def test_mongo_store_partition_delete(
     root_verify_key,
     mongo_store_partition: MongoStorePartition,
@@ -952,6 +1120,37 @@ def test_mongo_store_partition_permissions_get_all(
     assert len(mongo_store_partition.all(hacker_verify_key).ok()) == 0
 
 
+def test_mongo_store_partition_get_all_query_count(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+    num_root_objects: int = 20
+    num_guest_objects: int = 30
+    for i in range(num_root_objects):
+        mongo_store_partition.set(
+            credentials=root_verify_key, obj=MockSyftObject(data=i)
+        )
+    for i in range(num_guest_objects):
+        mongo_store_partition.set(
+            credentials=guest_verify_key, obj=MockSyftObject(data=i)
+        )
+
+    queries = count_queries(monkeypatch, ["find", "find_one"])
+
+    assert len(mongo_store_partition.all(guest_verify_key).ok()) == num_guest_objects
+    # one query for the objects and one for their permissions
+    assert queries == ["find", "find"]
+
+    queries.clear()
+    objs = mongo_store_partition.all(root_verify_key).ok()
+    assert len(objs) == num_root_objects + num_guest_objects
+    assert queries == ["find", "find"]
+
+
 def test_mongo_store_partition_permissions_delete(
     root_verify_key: SyftVerifyKey,
     guest_verify_key: SyftVerifyKey,
@@ -5,10 +5,27 @@ from threading import Thread
 import pytest
 
 # syft absolute
+from syft.node.credentials import SyftVerifyKey
+from syft.serde.serialize import _serialize
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionObjectWRITE
+from syft.service.action.action_permissions import ActionPermission
+from syft.service.action.action_permissions import StoragePermission
 from syft.store.document_store import QueryKeys
+from syft.store.sqlite_document_store import REF_COUNTS
+from syft.store.sqlite_document_store import SQLiteDocumentStore
+from syft.store.sqlite_document_store import SQLiteIndexStore
+from syft.store.sqlite_document_store import SQLitePermissionStore
 from syft.store.sqlite_document_store import SQLiteStorePartition
+from syft.store.sqlite_document_store import cache_key
+from syft.types.uid import UID
 
 # relative
+from .base_stash_test import MockObject
+from .base_stash_test import MockStash
+from .store_constants_test import TEST_VERIFY_KEY_STRING_CLIENT
+from .store_fixtures_test import sqlite_document_store_fn
 from .store_fixtures_test import sqlite_store_partition_fn
 from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockSyftObject
@@ -20,6 +37,267 @@ def test_sqlite_store_partition_sanity(
     assert hasattr(sqlite_store_partition, "data")
     assert hasattr(sqlite_store_partition, "unique_keys")
     assert hasattr(sqlite_store_partition, "searchable_keys")
+    assert isinstance(sqlite_store_partition.unique_keys, SQLiteIndexStore)
+    assert isinstance(sqlite_store_partition.searchable_keys, SQLiteIndexStore)
+
+
+def test_sqlite_store_partition_index_rows(
+    root_verify_key,
+    sqlite_document_store: SQLiteDocumentStore,
+) -> None:
+    stash = MockStash(store=sqlite_document_store)
+    objs = [
+        MockObject(name=f"name_{idx}", desc="same", importance=idx % 2, value=idx)
+        for idx in range(4)
+    ]
+    for obj in objs:
+        assert stash.set(root_verify_key, obj).is_ok()
+
+    assert stash.find_one(root_verify_key, name="name_1").ok() == objs[1]
+    assert len(stash.find_all(root_verify_key, desc="same").ok()) == 4
+    assert len(stash.find_all(root_verify_key, importance=1).ok()) == 2
+
+    # one row per (partition key, value, uid) entry
+    searchable_keys = stash.partition.searchable_keys
+    assert len(searchable_keys) == 4 * len(stash.partition.searchable_cks)
+
+    # updating replaces the old index entries of the object
+    updated = objs[1].copy()
+    updated.name = "renamed"
+    updated.importance = 0
+    assert stash.update(root_verify_key, updated).is_ok()
+    assert stash.find_one(root_verify_key, name="name_1").ok() is None
+    assert stash.find_one(root_verify_key, name="renamed").ok().id == objs[1].id
+    assert len(stash.find_all(root_verify_key, importance=1).ok()) == 1
+    assert len(stash.find_all(root_verify_key, importance=0).ok()) == 3
+
+    # deleting one object keeps the entries of objects sharing its values
+    assert stash.delete_by_uid(root_verify_key, objs[0].id).is_ok()
+    assert len(stash.find_all(root_verify_key, desc="same").ok()) == 3
+    assert len(searchable_keys) == 3 * len(stash.partition.searchable_cks)
+
+
+def test_sqlite_store_partition_index_backfill(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    stash = MockStash(store=store)
+    obj = MockObject(name="backfill", desc="desc", importance=1, value=1)
+    assert stash.set(root_verify_key, obj).is_ok()
+
+    # simulate a database written before the index tables existed, with the
+    # tables of the old index format
+    indexes = [stash.partition.unique_keys, stash.partition.searchable_keys]
+    for index in indexes:
+        index._execute(f"delete from {index.table_name}")  # nosec
+        index._execute(
+            f"create table {index.legacy_table_name} (uid VARCHAR(32) NOT NULL "  # nosec
+            + "PRIMARY KEY, repr TEXT NOT NULL, value BLOB NOT NULL)"
+        )
+
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    stash = MockStash(store=store)
+    assert stash.find_one(root_verify_key, name="backfill").ok() == obj
+    assert stash.find_all(root_verify_key, importance=1).ok() == [obj]
+
+    # the backfilled indexes replace the old tables
+    for index in indexes:
+        res = index._execute(
+            "select name from sqlite_master where name = ?", [index.legacy_table_name]
+        )
+        assert res.ok().fetchone() is None
+
+
+def test_sqlite_store_partition_permission_rows(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    client_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_CLIENT)
+    assert isinstance(sqlite_store_partition.permissions, SQLitePermissionStore)
+
+    obj = MockSyftObject(data=1)
+    res = sqlite_store_partition.set(
+        root_verify_key,
+        obj,
+        add_permissions=[ActionObjectWRITE(uid=obj.id, credentials=client_key)],
+    )
+    assert res.is_ok()
+
+    # owner grants from take_ownership plus the default READ and the extra WRITE
+    permissions = sqlite_store_partition.permissions[obj.id]
+    assert ActionObjectWRITE(uid=obj.id, credentials=client_key).permission_string in (
+        permissions
+    )
+    assert sqlite_store_partition.has_permission(
+        ActionObjectWRITE(uid=obj.id, credentials=client_key)
+    )
+    assert not sqlite_store_partition.has_permission(
+        ActionObjectREAD(uid=obj.id, credentials=client_key)
+    )
+
+    sqlite_store_partition.add_permission(
+        ActionObjectPermission(uid=obj.id, permission=ActionPermission.ALL_READ)
+    )
+    assert sqlite_store_partition.has_permission(
+        ActionObjectREAD(uid=obj.id, credentials=client_key)
+    )
+
+    sqlite_store_partition.remove_permission(
+        ActionObjectWRITE(uid=obj.id, credentials=client_key)
+    )
+    assert not sqlite_store_partition.has_permission(
+        ActionObjectWRITE(uid=obj.id, credentials=client_key)
+    )
+
+    assert sqlite_store_partition.has_storage_permission(obj.id)
+    sqlite_store_partition.remove_storage_permission(
+        StoragePermission(uid=obj.id, node_uid=sqlite_store_partition.node_uid)
+    )
+    assert not sqlite_store_partition.has_storage_permission(obj.id)
+    assert sqlite_store_partition._get_storage_permissions_for_uid(obj.id).ok() == set()
+
+    assert sqlite_store_partition.delete(
+        root_verify_key, sqlite_store_partition.settings.store_key.with_obj(obj)
+    ).is_ok()
+    assert obj.id not in sqlite_store_partition.permissions
+    assert len(sqlite_store_partition.permissions) == 0
+
+
+def test_sqlite_store_partition_permission_legacy_migration(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    uid = UID()
+    permission = ActionObjectREAD(uid=uid, credentials=root_verify_key)
+
+    # permissions used to be one serialized set per uid
+    legacy_table = f"{store.settings.name}_permissions"
+    permissions = store.permissions
+    permissions._execute(
+        f"create table {legacy_table} (uid VARCHAR(32) NOT NULL PRIMARY KEY, "  # nosec
+        + "repr TEXT NOT NULL, value BLOB NOT NULL)"
+    )
+    permissions._execute(
+        f"insert into {legacy_table} (uid, repr, value) VALUES (?, ?, ?)",  # nosec
+        [str(uid), "", _serialize({permission.permission_string}, to_bytes=True)],
+    )
+
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    assert store.permissions[uid] == {permission.permission_string}
+    res = store.permissions._execute(
+        "select name from sqlite_master where name = ?", [legacy_table]
+    )
+    assert res.ok().fetchone() is None
+
+
+def test_sqlite_store_partition_close(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    other_store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    key = cache_key(store.data.db_filename)
+    ref_count = REF_COUNTS[key]
+
+    # the connection stays open for the other partition of the file
+    store.close()
+    assert REF_COUNTS[key] == ref_count - 5
+    obj = MockSyftObject(data=1)
+    assert other_store.set(root_verify_key, obj).is_ok()
+    assert other_store.all(root_verify_key).ok() == [obj]
+
+
+def test_sqlite_store_partition_commits(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    statements: list[str] = []
+    store.data.db.set_trace_callback(statements.append)
+
+    def commits() -> int:
+        count = statements.count("COMMIT")
+        statements.clear()
+        return count
+
+    # data, indexes and permissions are written in a single transaction
+    obj = MockSyftObject(data=1)
+    assert store.set(root_verify_key, obj).is_ok()
+    assert commits() == 1
+
+    # reads don't commit
+    assert store.get(root_verify_key, obj.id).ok() == obj
+    assert store.all(root_verify_key).ok() == [obj]
+    assert len(store) == 1
+    assert commits() == 0
+
+    # an existing row is updated in place
+    store.data[obj.id] = MockSyftObject(id=obj.id, data=2)
+    assert commits() == 1
+    assert store.data[obj.id].data == 2
+    assert len(store.data) == 1
+
+    store.data.db.set_trace_callback(None)
+
+
+def test_sqlite_store_partition_transaction_rollback(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    obj = MockSyftObject(data=1)
+
+    with pytest.raises(RuntimeError):
+        with store.data.transaction():
+            store.data[obj.id] = obj
+            with store.data.transaction():
+                store.permissions.add(obj.id, "READ")
+            assert obj.id in store.data
+            raise RuntimeError("rollback")
+
+    assert obj.id not in store.data
+    assert obj.id not in store.permissions
+
+    with store.data.transaction():
+        store.data[obj.id] = obj
+    assert store.data[obj.id] == obj
+
+
+def test_sqlite_store_partition_key_queries(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    objs = [MockSyftObject(data=idx) for idx in range(5)]
+    for obj in objs:
+        assert store.set(root_verify_key, obj).is_ok()
+    missing = MockSyftObject(data="missing")
+
+    # keys are read lazily, in insertion order, from the covering index
+    keys = store.data.keys()
+    assert not isinstance(keys, list)
+    assert list(keys) == [obj.id for obj in objs]
+    plan = store.data.db.execute(
+        f"explain query plan select uid from {store.data.table_name} "  # nosec
+        + "order by sqltime, rowid"
+    ).fetchall()
+    assert "COVERING INDEX" in plan[0][-1]
+
+    # statements run while iterating don't reset the keys
+    assert [uid for uid in store.data.keys() if uid in store.data] == [
+        obj.id for obj in objs
+    ]
+
+    assert objs[0].id in store.data
+    assert missing.id not in store.data
+    assert len(store.data) == len(objs)
+
+    uids = [obj.id for obj in objs] + [missing.id]
+    assert store.data.contains_many(uids) == {obj.id for obj in objs}
+    assert store.data.contains_many([]) == set()
+    assert store.permissions.contains_many(uids) == {obj.id for obj in objs}
 
 
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -154,6 +432,22 @@ def test_sqlite_store_partition_delete(
     )
 
 
+def test_sqlite_store_partition_delete_without_storage_permission(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    obj = MockSyftObject(data=1)
+    res = sqlite_store_partition.set(root_verify_key, obj, add_storage_permission=False)
+    assert res.is_ok()
+
+    key = sqlite_store_partition.settings.store_key.with_obj(obj)
+    res = sqlite_store_partition.delete(root_verify_key, key)
+    assert res.is_ok()
+    assert len(sqlite_store_partition.data) == 0
+    assert len(sqlite_store_partition.permissions) == 0
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == 0
+
+
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
 def test_sqlite_store_partition_update(
     root_verify_key,
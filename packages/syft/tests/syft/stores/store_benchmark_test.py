@@ -0,0 +1,106 @@
+# stdlib
+from pathlib import Path
+from threading import Thread
+
+# third party
+import pytest
+
+# syft absolute
+from syft.store.document_store import StorePartition
+from syft.store.kv_document_store import KeyValueBackingStore
+from syft.types.uid import UID
+
+# relative
+from .store_fixtures_test import dict_store_partition_fn
+from .store_fixtures_test import sqlite_store_partition_fn
+from .store_mocks_test import MockObjectType
+
+# read-heavy multithreaded benchmarks of the partitions, run with `pytest --benchmark-only`
+pytest.importorskip("pytest_benchmark")
+
+OBJ_CNT = 50
+REPEATS = 20
+# rows of the table the key-only queries run against
+ROW_CNT = 1_000_000
+LOOKUP_CNT = 10_000
+
+
+def read_concurrently(
+    partition: StorePartition, root_verify_key, uids: list, thread_cnt: int
+) -> None:
+    def _reader() -> None:
+        for _ in range(REPEATS):
+            for uid in uids:
+                assert partition.get(root_verify_key, uid).is_ok()
+        assert partition.all(root_verify_key).is_ok()
+
+    threads = [Thread(target=_reader) for _ in range(thread_cnt)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize("thread_cnt", [1, 4])
+@pytest.mark.parametrize("locking", ["threading", "read_write"])
+@pytest.mark.parametrize("store", ["dict", "sqlite"])
+def test_partition_read_benchmark(
+    benchmark,
+    root_verify_key,
+    sqlite_workspace: tuple[Path, str],
+    store: str,
+    locking: str,
+    thread_cnt: int,
+) -> None:
+    if store == "dict":
+        partition = dict_store_partition_fn(root_verify_key, locking)
+    else:
+        partition = sqlite_store_partition_fn(
+            root_verify_key, sqlite_workspace, locking
+        )
+
+    uids = []
+    for idx in range(OBJ_CNT):
+        obj = MockObjectType(data=idx)
+        assert partition.set(root_verify_key, obj).is_ok()
+        uids.append(obj.id)
+
+    benchmark.group = f"{store} partition reads, {thread_cnt} threads"
+    benchmark(read_concurrently, partition, root_verify_key, uids, thread_cnt)
+
+
+def fill_rows(partition: StorePartition, row_cnt: int) -> list[UID]:
+    # key-only queries never read the values, so the rows skip serialization
+    uids = [UID() for _ in range(row_cnt)]
+    partition.data.db.executemany(
+        f"insert into {partition.data.table_name} (uid, repr, value) values (?, ?, ?)",  # nosec
+        ((str(uid), "", b"") for uid in uids),
+    )
+    partition.data.db.commit()
+    return uids
+
+
+def key_query(data: KeyValueBackingStore, query: str, uids: list[UID]) -> None:
+    if query == "keys":
+        assert sum(1 for _ in data.keys()) == ROW_CNT
+    elif query == "contains":
+        assert all(uid in data for uid in uids)
+    elif query == "contains_many":
+        assert len(data.contains_many(uids)) == len(uids)
+    else:
+        assert len(data) == ROW_CNT
+
+
+@pytest.mark.parametrize("query", ["keys", "contains", "contains_many", "len"])
+def test_sqlite_key_query_benchmark(
+    benchmark,
+    root_verify_key,
+    sqlite_workspace: tuple[Path, str],
+    query: str,
+) -> None:
+    partition = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    uids = fill_rows(partition, ROW_CNT)
+    lookups = uids[:: ROW_CNT // LOOKUP_CNT]
+
+    benchmark.group = f"sqlite key queries, {ROW_CNT} rows"
+    benchmark(key_query, partition.data, query, lookups)
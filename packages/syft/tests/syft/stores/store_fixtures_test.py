@@ -20,6 +20,7 @@ from syft.store.dict_document_store import DictStorePartition
 from syft.store.document_store import PartitionSettings
 from syft.store.locks import LockingConfig
 from syft.store.locks import NoLockingConfig
+from syft.store.locks import ReadWriteLockingConfig
 from syft.store.locks import ThreadingLockingConfig
 from syft.store.mongo_client import MongoStoreClientConfig
 from syft.store.mongo_document_store import MongoDocumentStore
@@ -40,6 +41,7 @@ MONGO_CLIENT_CACHE = None
 locking_scenarios = [
     "nop",
     "threading",
+    "read_write",
 ]
 
 
@@ -48,6 +50,8 @@ def str_to_locking_config(conf: str) -> LockingConfig:
         return NoLockingConfig()
     elif conf == "threading":
         return ThreadingLockingConfig()
+    elif conf == "read_write":
+        return ReadWriteLockingConfig()
     else:
         raise NotImplementedError(f"unknown locking config {conf}")
 
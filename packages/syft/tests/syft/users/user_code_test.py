@@ -9,6 +9,10 @@ import numpy as np
 import syft as sy
 from syft.client.domain_client import DomainClient
 from syft.service.action.action_object import ActionObject
+from syft.service.code import user_code as user_code_module
+from syft.service.code.user_code import execute_byte_code
+from syft.service.code.user_code import get_compiled_code
+from syft.service.context import AuthedServiceContext
 from syft.service.request.request import Request
 from syft.service.request.request import UserCodeStatusChange
 from syft.service.response import SyftError
@@ -329,3 +333,30 @@ def test_mock_no_arguments(worker) -> None:
 
     result = ds_client.api.services.code.compute_sum()
     assert result.get() == 1
+
+
+def test_compiled_code_cache(worker, guest_client: User, monkeypatch) -> None:
+    monkeypatch.setattr(user_code_module, "USER_CODE_CACHE", {})
+    guest_client.api.services.code.submit(mock_syft_func)
+    user_code = worker.root_client.code[0]
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+
+    for _ in range(2):
+        result = execute_byte_code(user_code, {}, context)
+        assert result.result == 1
+    assert len(user_code_module.USER_CODE_CACHE) == 1
+    compiled = get_compiled_code(user_code)
+    assert get_compiled_code(user_code) is compiled
+
+    # changed code is compiled again
+    user_code.parsed_code += "\n# changed"
+    assert get_compiled_code(user_code) is not compiled
+    assert len(user_code_module.USER_CODE_CACHE) == 2
+
+    # the least recently used code is evicted
+    monkeypatch.setattr(user_code_module, "USER_CODE_CACHE_SIZE", 1)
+    user_code.parsed_code += "\n# changed again"
+    new_compiled = get_compiled_code(user_code)
+    assert list(user_code_module.USER_CODE_CACHE.values()) == [new_compiled]
@@ -10,6 +10,8 @@ from result import Ok
 # syft absolute
 from syft.node.credentials import SyftVerifyKey
 from syft.node.worker import Worker
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionPermission
 from syft.service.context import AuthedServiceContext
 from syft.service.context import NodeServiceContext
 from syft.service.context import UnauthedServiceContext
@@ -431,6 +433,60 @@ def test_userservice_delete_success(
     assert response == expected_output
 
 
+def test_userservice_role_cache(
+    monkeypatch: MonkeyPatch,
+    user_service: UserService,
+    authed_context: AuthedServiceContext,
+    guest_user: User,
+) -> None:
+    root_verify_key = user_service.stash.partition.root_verify_key
+    read_own_user = ActionObjectPermission(
+        uid=guest_user.id,
+        permission=ActionPermission.READ,
+        credentials=guest_user.verify_key,
+    )
+    assert user_service.stash.set(
+        root_verify_key, guest_user, add_permissions=[read_own_user]
+    ).is_ok()
+    authed_context.credentials = root_verify_key
+    authed_context.role = ServiceRole.ADMIN
+    lookups = []
+    get_by_verify_key = user_service.stash.get_by_verify_key
+
+    def mock_get_by_verify_key(credentials: SyftVerifyKey, verify_key) -> Ok:
+        lookups.append(verify_key)
+        return get_by_verify_key(credentials=credentials, verify_key=verify_key)
+
+    monkeypatch.setattr(user_service.stash, "get_by_verify_key", mock_get_by_verify_key)
+
+    # the role is looked up once, then served from the cache
+    for _ in range(3):
+        role = user_service.get_role_for_credentials(guest_user.verify_key)
+        assert role == guest_user.role
+    assert len(lookups) == 1
+
+    # updates and deletes drop the cached role
+    response = user_service.update(
+        authed_context,
+        uid=guest_user.id,
+        user_update=UserUpdate(role=ServiceRole.DATA_SCIENTIST),
+    )
+    assert isinstance(response, UserView)
+    role = user_service.get_role_for_credentials(guest_user.verify_key)
+    assert role == ServiceRole.DATA_SCIENTIST
+    assert len(lookups) == 2
+
+    response = user_service.delete(authed_context, uid=guest_user.id)
+    assert isinstance(response, SyftSuccess)
+    role = user_service.get_role_for_credentials(guest_user.verify_key)
+    assert role == ServiceRole.GUEST
+    assert len(lookups) == 3
+
+    # unknown keys are looked up every time
+    user_service.get_role_for_credentials(guest_user.verify_key)
+    assert len(lookups) == 4
+
+
 def test_userservice_user_verify_key(
     monkeypatch: MonkeyPatch, user_service: UserService, guest_user: User
 ) -> None:
@@ -220,6 +220,39 @@ def test_action_object_hooks() -> None:
     action_object.syft_post_hooks__["__add__"] = []
 
 
+@sy.syft_function(
+    input_policy=sy.ExactMatch(), output_policy=sy.SingleExecutionExactOutput()
+)
+def api_cache_func():
+    return 1
+
+
+def test_worker_api_bytes_cache(worker) -> None:
+    root_client = worker.root_client
+    verify_key = root_client.credentials.verify_key
+    protocol = worker.current_protocol
+
+    api_bytes = worker.get_api_bytes(verify_key, protocol)
+    assert worker.get_api_bytes(verify_key, protocol) is api_bytes
+    api = sy.deserialize(api_bytes, from_bytes=True)
+    assert "code.call_api_cache_func" not in api.endpoints
+
+    # writing user code makes the cached api stale
+    root_client.code.submit(api_cache_func)
+    new_api_bytes = worker.get_api_bytes(verify_key, protocol)
+    assert new_api_bytes is not api_bytes
+    api = sy.deserialize(new_api_bytes, from_bytes=True)
+    assert "code.call_api_cache_func" in api.endpoints
+
+    # the api of every user is cached separately
+    guest_key = SyftSigningKey.generate().verify_key
+    guest_api_bytes = worker.get_api_bytes(guest_key, protocol)
+    assert guest_api_bytes is not new_api_bytes
+    guest_api = sy.deserialize(guest_api_bytes, from_bytes=True)
+    assert "code.call_api_cache_func" not in guest_api.endpoints
+    assert len(guest_api.endpoints) < len(api.endpoints)
+
+
 def test_worker_serde(worker) -> None:
     ser = sy.serialize(worker, to_bytes=True)
     de = sy.deserialize(ser, from_bytes=True)
@@ -2,7 +2,9 @@
 from collections import defaultdict
 from secrets import token_hex
 import sys
+import time
 from time import sleep
+from typing import Any
 
 # third party
 from faker import Faker
@@ -11,8 +13,17 @@ from zmq import Socket
 
 # syft absolute
 import syft
+from syft.node.node import NodeRegistry
+from syft.node.worker_settings import WorkerSettings
+from syft.service.context import AuthedServiceContext
+from syft.service.queue import queue as queue_module
+from syft.service.queue import zmq_queue
 from syft.service.queue.base_queue import AbstractMessageHandler
 from syft.service.queue.queue import QueueManager
+from syft.service.queue.queue import clear_worker_node_cache
+from syft.service.queue.queue import get_worker_node
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.queue.queue_stash import Status
 from syft.service.queue.zmq_queue import ZMQClient
 from syft.service.queue.zmq_queue import ZMQClientConfig
 from syft.service.queue.zmq_queue import ZMQConsumer
@@ -20,6 +31,10 @@ from syft.service.queue.zmq_queue import ZMQProducer
 from syft.service.queue.zmq_queue import ZMQQueueConfig
 from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
+from syft.service.user.user_roles import ServiceRole
+from syft.service.worker.worker_pool_service import SyftWorkerPoolService
+from syft.store.linked_obj import LinkedObject
+from syft.types.uid import UID
 from syft.util.util import get_queue_address
 
 # relative
@@ -278,3 +293,107 @@ def test_zmq_client_serde():
     deser = syft.deserialize(bytes_data, from_bytes=True)
 
     assert type(deser) == type(client)
+
+
+def test_worker_node_reused_across_messages(worker):
+    worker_settings = WorkerSettings.from_node(worker)
+    consumer_id = UID()
+
+    try:
+        worker_node = get_worker_node(worker_settings, consumer_id)
+        assert worker_node.id == worker.id
+        assert worker_node.signing_key == worker.signing_key
+
+        # same consumer and settings, e.g. the next message on the queue
+        assert get_worker_node(worker_settings, consumer_id) is worker_node
+        next_settings = syft.deserialize(
+            syft.serialize(worker_settings, to_bytes=True), from_bytes=True
+        )
+        assert get_worker_node(next_settings, consumer_id) is worker_node
+
+        # another consumer gets its own node
+        assert get_worker_node(worker_settings, UID()) is not worker_node
+    finally:
+        clear_worker_node_cache()
+
+
+def test_worker_node_cache_closes_evicted_nodes(worker, monkeypatch):
+    monkeypatch.setattr(queue_module, "WORKER_NODE_CACHE_SIZE", 1)
+    worker_settings = WorkerSettings.from_node(worker)
+    closed = []
+
+    def get_node(consumer_id: UID) -> Any:
+        worker_node = get_worker_node(worker_settings, consumer_id)
+        close_stores = worker_node.close_stores
+
+        def record_close_stores() -> None:
+            closed.append(worker_node)
+            close_stores()
+
+        monkeypatch.setattr(worker_node, "close_stores", record_close_stores)
+        return worker_node
+
+    try:
+        first_node = get_node(UID())
+        second_consumer_id = UID()
+        second_node = get_node(second_consumer_id)
+        registered_node = NodeRegistry.node_for(worker.id)
+        assert closed == [first_node]
+        assert list(queue_module.WORKER_NODE_CACHE.values()) == [second_node]
+
+        # closing the consumer closes its nodes
+        clear_worker_node_cache(second_consumer_id)
+        assert closed == [first_node, second_node]
+        assert queue_module.WORKER_NODE_CACHE == {}
+
+        # the worker nodes have the id of the node they work for, which stays
+        # registered
+        assert registered_node is not None
+        assert NodeRegistry.node_for(worker.id) is registered_node
+    finally:
+        clear_worker_node_cache()
+
+
+def test_zmq_producer_dispatches_notified_items(worker, monkeypatch):
+    # make sure the item can only be picked up through the push path
+    monkeypatch.setattr(zmq_queue, "QUEUE_STASH_SCAN_INTERVAL_SEC", 60)
+
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.verify_key, role=ServiceRole.ADMIN
+    )
+    producer = ZMQProducer(
+        queue_name="api_call",
+        queue_stash=worker.queue_stash,
+        worker_stash=worker.worker_stash,
+        port=get_random_port(),
+        context=context,
+    )
+    worker_pool = worker.get_default_worker_pool()
+    service = zmq_queue.Service(worker_pool.name)
+    producer.services[worker_pool.name] = service
+    producer.run()
+
+    try:
+        queue_item = QueueItem(
+            id=UID(),
+            node_uid=worker.id,
+            method="get_all",
+            service="userservice",
+            args=[],
+            kwargs={},
+            worker_pool=LinkedObject.from_obj(
+                worker_pool, service_type=SyftWorkerPoolService, node_uid=worker.id
+            ),
+        )
+        worker.queue_stash.set_placeholder(worker.verify_key, queue_item)
+        producer.notify(queue_item)
+
+        deadline = time.time() + 5
+        while not service.requests and time.time() < deadline:
+            sleep(0.01)
+
+        assert len(service.requests) == 1
+        item = worker.queue_stash.get_by_uid(worker.verify_key, queue_item.id).ok()
+        assert item.status == Status.PROCESSING
+    finally:
+        producer.close()